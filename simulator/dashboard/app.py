@@ -97,6 +97,9 @@ class DashboardServer:
             await websocket_manager.connect(websocket, client_info)
             self.stats["websocket_connections"] += 1
             
+            # Metric updates are deltas, so every client starts from a full snapshot
+            await self._send_metrics_snapshot(websocket)
+            
             try:
                 while True:
                     # Receive messages from client
@@ -110,6 +113,8 @@ class DashboardServer:
                         await self._send_current_status(websocket)
                     elif actions.get("action") == "get_metrics":
                         await self._send_current_metrics(websocket)
+                    elif actions.get("action") == "subscribe":
+                        await self._send_metrics_snapshot(websocket)
                         
             except WebSocketDisconnect:
                 await websocket_manager.disconnect(websocket)
@@ -526,6 +531,18 @@ class DashboardServer:
         else:
             await websocket_manager.send_error_to_client(websocket, "Metrics collector not available", "NO_METRICS")
             
+    async def _send_metrics_snapshot(self, websocket: WebSocket):
+        """Send a full metrics snapshot as a metrics_update baseline for later deltas"""
+        if self.metrics_collector:
+            try:
+                await websocket_manager.send_to_client(websocket, {
+                    "type": "metrics_update",
+                    "data": self.metrics_collector.get_current_metrics(),
+                    "timestamp": datetime.now().isoformat()
+                })
+            except Exception as e:
+                await websocket_manager.send_error_to_client(websocket, str(e), "METRICS_ERROR")
+                
     def set_simulation_engine(self, engine: SimulationEngine):
         """Set the simulation engine reference"""
         self.simulation_engine = engine
@@ -242,7 +242,14 @@ class DashboardApp {
                 break;
                 
             case 'metrics_update':
-                this.metrics = { ...this.metrics, ...data.data };
+                // Updates only carry changed counters and gauges, so merge sections one level deep
+                Object.entries(data.data).forEach(([key, value]) => {
+                    const current = this.metrics[key];
+                    const isSection = value && typeof value === 'object' && !Array.isArray(value);
+                    this.metrics[key] = isSection && current && typeof current === 'object'
+                        ? { ...current, ...value }
+                        : value;
+                });
                 this.updateMetrics();
                 this.updateCharts();
                 break;
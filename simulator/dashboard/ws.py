@@ -11,6 +11,8 @@ from typing import Set, Dict, Any, Optional
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 
+from ..metrics import json_default
+
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +79,7 @@ class WebSocketManager:
     async def send_to_client(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
         """Send message to a specific client"""
         try:
-            message_str = json.dumps(message, default=str)
+            message_str = json.dumps(message, default=json_default)
             await websocket.send_text(message_str)
             
             # Update statistics
@@ -203,6 +205,7 @@ class WebSocketManager:
                 # Handle subscription requests
                 topics = data.get("topics", [])
                 await self._handle_subscription(websocket, topics)
+                return {"action": "subscribe"}
                 
             elif message_type == "get_status":
                 # Client requesting current status
@@ -11,7 +11,7 @@ import random
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from collections import defaultdict
 
 from .config import SimulationConfig, RuntimeStats
@@ -19,7 +19,7 @@ from .scenarios import ScenarioLoader
 from .generators.customers import CustomerGenerator, CustomerProfile
 from .generators.transactions import TransactionGenerator, PendingTransaction
 from .generators.fraud import FraudGenerator, FraudProfile, FraudType
-from .generators.events import LifeEventGenerator, LifeEvent
+from .generators.events import LifeEventGenerator, LifeEvent, LifeEventTable
 from .connectors.nexum import NexumConnector, MockNexumConnector
 from .connectors.bastion import BastionConnector, MockBastionConnector
 from .connectors.kafka import KafkaConnector, MockKafkaConnector
@@ -40,6 +40,7 @@ class SimulationState:
     customer_accounts: Dict[str, List[str]] = None
     active_fraud_profiles: List[FraudProfile] = None
     active_life_events: List[LifeEvent] = None
+    life_event_table: Optional[LifeEventTable] = None
     pending_transactions: List[PendingTransaction] = None
     
     def __post_init__(self):
@@ -252,18 +253,17 @@ class SimulationEngine:
         
         # Generate life events for the simulation period
         logger.info("Generating life events...")
-        all_life_events = []
-        for customer in self.state.customers:
-            events = self.life_event_generator.generate_life_events(
-                customer, self.clock.sim_start_time, 
-                int(self.config.duration_hours * 24)
-            )
-            all_life_events.extend(events)
-            
+        all_life_events = self.life_event_generator.generate_life_events_batch(
+            self.state.customers, self.clock.sim_start_time,
+            int(self.config.duration_hours * 24)
+        )
+        
         self.state.active_life_events = all_life_events
+        self.state.life_event_table = LifeEventTable(all_life_events)
         
         # Pre-generate fraud profiles based on scenario
         logger.info("Initializing fraud patterns...")
+        self.fraud_generator.set_account_mapping(self.state.customer_accounts)
         await self._setup_fraud_patterns()
         
         setup_duration = time.time() - setup_start
@@ -344,30 +344,29 @@ class SimulationEngine:
                     
                 current_sim_time = self.clock.get_current_sim_time()
                 
+                # Resolve active life events for all customers in one pass
+                if self.state.life_event_table is not None:
+                    active_events_by_customer = self.state.life_event_table.get_active_by_customer(current_sim_time)
+                else:
+                    active_events_by_customer = {}
+                
                 # Generate transactions for each customer
                 batch_transactions = []
                 
                 for customer in self.state.customers:
                     # Apply life event effects
-                    active_events = [
-                        event for event in self.state.active_life_events
-                        if event.customer_id == customer.customer_id and event.is_active(current_sim_time)
-                    ]
-                    
-                    if active_events:
-                        modified_customer = self.life_event_generator.apply_event_effects(customer, active_events)
-                    else:
-                        modified_customer = customer
+                    active_events = active_events_by_customer.get(customer.customer_id)
+                    effects = self.life_event_generator.compute_event_effects(active_events)
                         
                     # Determine if customer should generate transactions now
-                    if self._should_generate_transactions(modified_customer, current_sim_time):
+                    if self._should_generate_transactions(customer, current_sim_time, effects.transaction_multiplier):
                         account_ids = self.state.customer_accounts.get(customer.customer_id, [])
                         if account_ids:
                             # Generate 1-3 transactions for this customer
                             num_transactions = random.randint(1, 3)
                             for _ in range(num_transactions):
                                 transaction = self._generate_single_transaction(
-                                    modified_customer, account_ids, current_sim_time
+                                    customer, account_ids, current_sim_time
                                 )
                                 if transaction:
                                     batch_transactions.append(transaction)
@@ -404,6 +403,7 @@ class SimulationEngine:
                     
                     if fraud_transactions:
                         await self._process_fraud_transactions(fraud_transactions)
+                        self.fraud_generator.release_transactions(fraud_transactions)
                         
                 # Check for new fraud patterns to activate
                 await self._activate_scheduled_fraud()
@@ -626,10 +626,11 @@ class SimulationEngine:
                 
                 self.fraud_generator.add_fraud_profile(fraud_profile)
                 
-    def _should_generate_transactions(self, customer: CustomerProfile, current_time: datetime) -> bool:
+    def _should_generate_transactions(self, customer: CustomerProfile, current_time: datetime,
+                                    frequency_multiplier: float = 1.0) -> bool:
         """Determine if a customer should generate transactions now"""
-        # Base probability based on customer transaction frequency
-        base_prob_per_hour = customer.transaction_frequency / (7 * 24)  # Weekly to hourly
+        # Base probability based on customer transaction frequency (scaled by life events)
+        base_prob_per_hour = customer.transaction_frequency * frequency_multiplier / (7 * 24)  # Weekly to hourly
         
         # Adjust for time of day
         hour = current_time.hour
@@ -721,7 +722,7 @@ class SimulationEngine:
             
             # Publish to Kafka if enabled
             if self.kafka_connector:
-                await self.kafka_connector.publish_transaction(transaction.__dict__)
+                await self.kafka_connector.publish_transaction(asdict(transaction))
                 await self.kafka_connector.publish_fraud_decision(fraud_score_result)
                 
             # Update runtime stats
@@ -791,7 +792,7 @@ class SimulationEngine:
                 channel=transaction.channel.value,
                 country=transaction.metadata.get("customer_location", "US").split(",")[-1].strip(),
                 timestamp=transaction.timestamp.timestamp(),
-                metadata=transaction.metadata
+                metadata=dict(transaction.metadata)
             )
             
             return result
@@ -814,7 +815,7 @@ class SimulationEngine:
         self.runtime_stats.end_time = datetime.now()
         
         # Get final metrics
-        final_metrics = self.metrics_collector.get_current_metrics()
+        final_metrics = self.metrics_collector.get_current_metrics(fresh=True)
         nexum_stats = self.nexum_connector.get_stats()
         bastion_stats = self.bastion_connector.get_connector_stats()
         
@@ -5,15 +5,41 @@ such as address changes, new device logins, travel, job changes, etc.
 These events affect customer transaction patterns and risk profiles.
 """
 
-import random
+import copy
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional, Tuple
-from enum import Enum
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, NamedTuple
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field, replace
+
+import numpy as np
 
 from .customers import CustomerProfile, CustomerLifeStage, IncomeLevel
 
 
+# Shared channel preference tuples (never mutated, reused by every event)
+_CHANNELS_TRAVEL_DOMESTIC = ("card", "mobile")
+_CHANNELS_TRAVEL_INTL = ("card",)
+_CHANNELS_DEVICE_THEFT = ("branch", "online")
+
+# Detail field names per event builder; values are stored as a parallel tuple
+_ADDRESS_CHANGE_DETAILS = ("reason", "old_address", "new_address", "requires_verification")
+_NEW_DEVICE_LOGIN_DETAILS = ("device_type", "os", "location", "requires_verification")
+_DOMESTIC_TRAVEL_DETAILS = ("destination", "trip_type", "trip_duration")
+_INTERNATIONAL_TRAVEL_DETAILS = ("destination", "safety_score", "trip_duration", "currency_different")
+_JOB_CHANGE_DETAILS = ("change_type", "income_multiplier")
+_MEDICAL_EMERGENCY_DETAILS = ("emergency_type", "severity", "spending_multiplier")
+_ACCOUNT_COMPROMISE_DETAILS = ("compromise_type", "requires_account_freeze", "requires_new_cards")
+_DEVICE_THEFT_DETAILS = ("device_type", "requires_card_replacement", "location")
+_HOME_PURCHASE_DETAILS = ("purchase_type", "home_value", "down_payment")
+_GENERIC_DETAILS = ("type",)
+_MARRIAGE_DETAILS = ("requires_name_change", "joint_accounts", "wedding_expenses")
+_DIVORCE_DETAILS = ("requires_account_separation", "asset_division", "legal_costs")
+_NEW_BABY_DETAILS = ("medical_expenses", "baby_supplies", "potential_income_reduction")
+_INCOME_CHANGE_DETAILS = ("change_type", "income_multiplier", "is_permanent")
+_RETIREMENT_DETAILS = ("retirement_type", "pension_available", "401k_rollover", "income_reduction")
+
+
 class EventType(Enum):
     """Types of life events that affect banking behavior"""
     ADDRESS_CHANGE = "address_change"
@@ -41,7 +67,18 @@ class EventImpact(Enum):
     CRITICAL = "critical" # Major life disruption
 
 
-@dataclass
+class SpendingPattern(IntEnum):
+    """Spending pattern shifts caused by life events (stored as small ints)"""
+    NONE = 0
+    CONSERVATIVE = 1
+    WEDDING_FOCUS = 2
+    HOME_FOCUS = 3
+    MEDICAL_FOCUS = 4
+    FIXED_INCOME = 5
+    FAMILY_FOCUS = 6
+
+
+@dataclass(slots=True)
 class LifeEvent:
     """A life event affecting a customer"""
     event_id: str
@@ -50,35 +87,109 @@ class LifeEvent:
     event_date: datetime
     impact_level: EventImpact
     duration_days: int  # How long the impact lasts
+    end_date: datetime = field(init=False)  # Set once in __post_init__
     
-    # Event-specific details
-    details: Dict[str, any]
+    # Event-specific details (materialized on demand by the details property)
+    detail_keys: Tuple[str, ...]
+    detail_values: tuple
     
     # Behavioral changes
     transaction_frequency_multiplier: float = 1.0
-    spending_pattern_change: Optional[str] = None
+    spending_pattern_change: SpendingPattern = SpendingPattern.NONE
     risk_score_adjustment: float = 0.0
-    new_locations: List[str] = None
-    channel_preferences: Optional[List[str]] = None
+    new_locations: Tuple[str, ...] = ()
+    channel_preferences: Optional[Tuple[str, ...]] = None
     
+    def __post_init__(self):
+        self.end_date = self.event_date + timedelta(days=self.duration_days)
+        
     @property
-    def end_date(self) -> datetime:
-        return self.event_date + timedelta(days=self.duration_days)
+    def details(self) -> Dict[str, any]:
+        """Event-specific details as a dict"""
+        return dict(zip(self.detail_keys, self.detail_values))
         
     def is_active(self, current_time: datetime) -> bool:
         """Check if event is currently affecting customer behavior"""
         return self.event_date <= current_time <= self.end_date
 
 
+class EventEffects(NamedTuple):
+    """Cumulative behavioral effects of a customer's active life events"""
+    transaction_multiplier: float
+    risk_adjustment: float
+    locations: Tuple[str, ...]
+    channels: Optional[Tuple[str, ...]]
+
+
+NO_EVENT_EFFECTS = EventEffects(1.0, 0.0, (), None)
+
+
+def _to_ns(dt: datetime) -> int:
+    """Convert a datetime to an int64 nanosecond epoch"""
+    return int(np.datetime64(dt, 'ns').view('i8'))
+
+
+class LifeEventTable:
+    """Columnar index over life events for fast active-window queries"""
+    
+    def __init__(self, events: List[LifeEvent]):
+        # Grouped by customer (stable, so per-customer date order is kept)
+        self.events = sorted(events, key=lambda e: e.customer_id)
+        self.customer_ids = np.array([e.customer_id for e in self.events], dtype=object)
+        self.start_ns = np.array([_to_ns(e.event_date) for e in self.events], dtype=np.int64)
+        self.end_ns = np.array([_to_ns(e.end_date) for e in self.events], dtype=np.int64)
+        self.spending_patterns = np.array([e.spending_pattern_change for e in self.events], dtype=np.int8)
+        
+    def __len__(self) -> int:
+        return len(self.events)
+        
+    def active_mask(self, current_time: datetime) -> np.ndarray:
+        """Boolean mask of events active at current time"""
+        now_ns = _to_ns(current_time)
+        return (self.start_ns <= now_ns) & (now_ns <= self.end_ns)
+        
+    def get_active_events(self, customer_id: str, current_time: datetime) -> List[LifeEvent]:
+        """Get life events active for a single customer at current time"""
+        lo = int(np.searchsorted(self.customer_ids, customer_id, side='left'))
+        hi = int(np.searchsorted(self.customer_ids, customer_id, side='right'))
+        if lo == hi:
+            return []
+            
+        now_ns = _to_ns(current_time)
+        mask = (self.start_ns[lo:hi] <= now_ns) & (now_ns <= self.end_ns[lo:hi])
+        return [self.events[lo + i] for i in np.flatnonzero(mask)]
+        
+    def get_active_by_customer(self, current_time: datetime) -> Dict[str, List[LifeEvent]]:
+        """Get all active life events at current time, keyed by customer ID"""
+        active = {}
+        for idx in np.flatnonzero(self.active_mask(current_time)):
+            event = self.events[idx]
+            active.setdefault(event.customer_id, []).append(event)
+        return active
+
+
+def _generate_events_chunk(job) -> List[LifeEvent]:
+    """Worker entry point: generate life events for one chunk of customers"""
+    generator, customers, simulation_start, duration_days = job
+    return generator.generate_life_events_batch(customers, simulation_start, duration_days)
+
+
 class LifeEventGenerator:
     """Generates realistic life events for customers"""
     
     def __init__(self, seed: Optional[int] = None):
-        if seed is not None:
-            random.seed(seed)
-            
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_seq)
         self._initialize_event_patterns()
         
+    def _randint(self, low: int, high: int) -> int:
+        """Random integer in [low, high], inclusive like random.randint"""
+        return int(self._rng.integers(low, high + 1))
+        
+    def _choice(self, options):
+        """Pick a random element from a sequence"""
+        return options[int(self._rng.integers(len(options)))]
+        
     def _initialize_event_patterns(self):
         """Initialize event patterns and probabilities"""
         # Event probabilities per customer per year by life stage
@@ -145,6 +256,16 @@ class LifeEventGenerator:
             }
         }
         
+        # Dense (life stage x event type) matrix of the same annual probabilities
+        self._life_stage_index = {stage: i for i, stage in enumerate(CustomerLifeStage)}
+        self._event_types = list(EventType)
+        self._prob_matrix = np.zeros((len(self._life_stage_index), len(self._event_types)))
+        for life_stage, probabilities in self.event_probabilities.items():
+            for event_type, annual_prob in probabilities.items():
+                self._prob_matrix[self._life_stage_index[life_stage], self._event_types.index(event_type)] = annual_prob
+        self._sim_prob = None
+        self._prepared_duration_days = None
+        
         # Travel destinations by region
         self.domestic_destinations = [
             "Las Vegas, NV", "Miami, FL", "Orlando, FL", "Los Angeles, CA",
@@ -152,7 +273,7 @@ class LifeEventGenerator:
             "Austin, TX", "Boston, MA", "San Francisco, CA", "Portland, OR"
         ]
         
-        self.international_destinations = [
+        international_destinations = [
             ("London, UK", 0.8), ("Paris, France", 0.9), ("Tokyo, Japan", 0.7),
             ("Toronto, Canada", 0.9), ("Mexico City, Mexico", 0.6),
             ("Amsterdam, Netherlands", 0.8), ("Rome, Italy", 0.8),
@@ -162,37 +283,112 @@ class LifeEventGenerator:
             ("Berlin, Germany", 0.8), ("Seoul, South Korea", 0.7)
         ]
         
+        # Stored as parallel columns - sampling only needs an index
+        self._intl_names = np.array([name for name, _ in international_destinations], dtype=object)
+        self._intl_safety = np.array([safety for _, safety in international_destinations], dtype=np.float64)
+        
+    def prepare(self, duration_days: int):
+        """Precompute simulation period event probabilities for a run length"""
+        simulation_years = duration_days / 365.0
+        self._sim_prob = 1.0 - (1.0 - self._prob_matrix) ** simulation_years
+        self._prepared_duration_days = duration_days
+        
     def generate_life_events(self, customer: CustomerProfile, simulation_start: datetime, 
                            duration_days: int) -> List[LifeEvent]:
         """Generate life events for a customer over the simulation period"""
-        events = []
+        return self.generate_life_events_batch([customer], simulation_start, duration_days)
+        
+    def generate_life_events_batch(self, customers: List[CustomerProfile], simulation_start: datetime,
+                                 duration_days: int, workers: int = 1) -> List[LifeEvent]:
+        """Generate life events for many customers, grouped by customer and sorted by date"""
+        if duration_days != self._prepared_duration_days:
+            self.prepare(duration_days)
+            
+        if not customers:
+            return []
+            
+        if workers > 1 and len(customers) >= workers:
+            return self._generate_life_events_parallel(customers, simulation_start, duration_days, workers)
+            
+        # Group customers by life stage so each stage is drawn as one block
+        stage_indices = np.array([self._life_stage_index[c.life_stage] for c in customers])
+        order = np.argsort(stage_indices, kind='stable')
+        bounds = np.searchsorted(stage_indices[order], np.arange(len(self._life_stage_index) + 1))
+        
+        fired_customers = []
+        fired_types = []
+        for stage_idx in range(len(self._life_stage_index)):
+            members = order[bounds[stage_idx]:bounds[stage_idx + 1]]
+            if len(members) == 0:
+                continue
+                
+            stage_probs = self._sim_prob[stage_idx]
+            draws = self._rng.random((len(members), len(stage_probs))) < stage_probs
+            rows, cols = np.nonzero(draws)
+            fired_customers.append(members[rows])
+            fired_types.append(cols)
+            
+        customer_idx = np.concatenate(fired_customers)
+        type_idx = np.concatenate(fired_types)
+        if len(customer_idx) == 0:
+            return []
+            
+        # Multiple events of same type possible, each additional one half as likely.
+        # The halving chain is advanced for every still-running cell at once.
+        counts = np.ones(len(customer_idx), dtype=np.int64)
+        chain_probs = self._sim_prob[stage_indices[customer_idx], type_idx] * 0.5
+        running = np.arange(len(customer_idx))
+        while len(running):
+            running = running[self._rng.random(len(running)) < chain_probs[running]]
+            counts[running] += 1
+            chain_probs[running] *= 0.5
+            
+        customer_idx = np.repeat(customer_idx, counts)
+        type_idx = np.repeat(type_idx, counts)
         
-        # Get event probabilities for this customer's life stage
-        probabilities = self.event_probabilities.get(customer.life_stage, {})
+        # Draw every event day in one call
+        day_offsets = self._rng.integers(0, duration_days + 1, size=len(customer_idx))
         
-        # Convert annual probabilities to simulation period probabilities
-        simulation_years = duration_days / 365.0
+        # Emit events grouped by customer and in date order within each customer
+        emit_order = np.lexsort((day_offsets, customer_idx))
+        event_dates = (
+            np.datetime64(simulation_start, 'us') + day_offsets[emit_order].astype('timedelta64[D]')
+        ).tolist()
         
-        for event_type, annual_prob in probabilities.items():
-            simulation_prob = 1 - (1 - annual_prob) ** simulation_years
+        events = []
+        for i, event_date in zip(emit_order, event_dates):
+            event = self._generate_specific_event(
+                self._event_types[type_idx[i]], customers[customer_idx[i]], event_date
+            )
+            if event:
+                events.append(event)
+                
+        return events
+        
+    def _generate_life_events_parallel(self, customers: List[CustomerProfile], simulation_start: datetime,
+                                     duration_days: int, workers: int) -> List[LifeEvent]:
+        """Generate life events for customer chunks in worker processes"""
+        # Each chunk gets an independent child stream, so a given seed and
+        # worker count always reproduce the same events
+        chunks = np.array_split(np.arange(len(customers)), workers)
+        jobs = []
+        for chunk, child_seed in zip(chunks, self._seed_seq.spawn(workers)):
+            worker = copy.copy(self)
+            worker._seed_seq = child_seed
+            worker._rng = np.random.default_rng(child_seed)
+            jobs.append((worker, [customers[i] for i in chunk], simulation_start, duration_days))
             
-            # Multiple events of same type possible
-            while random.random() < simulation_prob:
-                event = self._generate_specific_event(
-                    event_type, customer, simulation_start, duration_days
-                )
-                if event:
-                    events.append(event)
-                simulation_prob *= 0.5  # Reduce probability for additional events
+        events = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_events in executor.map(_generate_events_chunk, jobs):
+                events.extend(chunk_events)
                 
-        return sorted(events, key=lambda e: e.event_date)
+        return events
         
     def _generate_specific_event(self, event_type: EventType, customer: CustomerProfile,
-                               simulation_start: datetime, duration_days: int) -> Optional[LifeEvent]:
+                               event_date: datetime) -> Optional[LifeEvent]:
         """Generate a specific type of life event"""
-        # Random date during simulation
-        event_date = simulation_start + timedelta(days=random.randint(0, duration_days))
-        event_id = f"EVENT_{int(event_date.timestamp())}_{random.randint(1000, 9999)}"
+        event_id = f"EVENT_{int(event_date.timestamp())}_{self._randint(1000, 9999)}"
         
         if event_type == EventType.ADDRESS_CHANGE:
             return self._generate_address_change(event_id, customer, event_date)
@@ -229,14 +425,14 @@ class LifeEventGenerator:
         """Generate address change event"""
         # Different reasons for moving
         reasons = ["job_relocation", "family_reasons", "better_housing", "cost_reduction", "life_change"]
-        reason = random.choice(reasons)
+        reason = self._choice(reasons)
         
         # New city (could be same state or different)
-        if random.random() < 0.7:  # 70% same state
+        if self._rng.random() < 0.7:  # 70% same state
             new_city = f"New City, {customer.state}"
         else:  # 30% different state
             states = ["CA", "NY", "TX", "FL", "IL", "PA", "OH", "GA", "NC", "MI"]
-            new_state = random.choice([s for s in states if s != customer.state])
+            new_state = self._choice([s for s in states if s != customer.state])
             new_city = f"New City, {new_state}"
             
         return LifeEvent(
@@ -246,26 +442,27 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.MEDIUM,
             duration_days=30,  # Address verification period
-            details={
-                "reason": reason,
-                "old_address": f"{customer.city}, {customer.state}",
-                "new_address": new_city,
-                "requires_verification": True
-            },
+            detail_keys=_ADDRESS_CHANGE_DETAILS,
+            detail_values=(
+                reason,
+                f"{customer.city}, {customer.state}",
+                new_city,
+                True
+            ),
             risk_score_adjustment=0.1,  # Temporary risk increase
-            new_locations=[new_city]
+            new_locations=(new_city,)
         )
         
     def _generate_new_device_login(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate new device login event"""
         device_types = ["smartphone", "tablet", "laptop", "desktop"]
-        device_type = random.choice(device_types)
+        device_type = self._choice(device_types)
         
         # Device OS and browser patterns by age
         if customer.age < 35:
-            os_choice = random.choice(["iOS", "Android", "macOS", "Windows"])
+            os_choice = self._choice(["iOS", "Android", "macOS", "Windows"])
         else:
-            os_choice = random.choice(["iOS", "Android", "Windows", "Windows"])  # More Windows
+            os_choice = self._choice(["iOS", "Android", "Windows", "Windows"])  # More Windows
             
         return LifeEvent(
             event_id=event_id,
@@ -274,22 +471,23 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.LOW,
             duration_days=7,  # New device verification period
-            details={
-                "device_type": device_type,
-                "os": os_choice,
-                "location": f"{customer.city}, {customer.state}",
-                "requires_verification": True
-            },
+            detail_keys=_NEW_DEVICE_LOGIN_DETAILS,
+            detail_values=(
+                device_type,
+                os_choice,
+                f"{customer.city}, {customer.state}",
+                True
+            ),
             risk_score_adjustment=0.05
         )
         
     def _generate_domestic_travel(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate domestic travel event"""
-        destination = random.choice(self.domestic_destinations)
-        trip_duration = random.randint(2, 14)  # 2 days to 2 weeks
+        destination = self._choice(self.domestic_destinations)
+        trip_duration = self._randint(2, 14)  # 2 days to 2 weeks
         
         trip_types = ["vacation", "business", "family_visit", "conference"]
-        trip_type = random.choice(trip_types)
+        trip_type = self._choice(trip_types)
         
         return LifeEvent(
             event_id=event_id,
@@ -298,20 +496,23 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.LOW,
             duration_days=trip_duration,
-            details={
-                "destination": destination,
-                "trip_type": trip_type,
-                "trip_duration": trip_duration
-            },
+            detail_keys=_DOMESTIC_TRAVEL_DETAILS,
+            detail_values=(
+                destination,
+                trip_type,
+                trip_duration
+            ),
             transaction_frequency_multiplier=1.3,  # More transactions while traveling
-            new_locations=[destination],
-            channel_preferences=["card", "mobile"]  # Prefer card/mobile while traveling
+            new_locations=(destination,),
+            channel_preferences=_CHANNELS_TRAVEL_DOMESTIC  # Prefer card/mobile while traveling
         )
         
     def _generate_international_travel(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate international travel event"""
-        destination, safety_score = random.choice(self.international_destinations)
-        trip_duration = random.randint(3, 21)  # 3 days to 3 weeks
+        idx = int(self._rng.integers(len(self._intl_names)))
+        destination = self._intl_names[idx]
+        safety_score = float(self._intl_safety[idx])
+        trip_duration = self._randint(3, 21)  # 3 days to 3 weeks
         
         # Risk adjustment based on destination
         risk_adjustment = (1.0 - safety_score) * 0.2
@@ -323,16 +524,17 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.MEDIUM,
             duration_days=trip_duration,
-            details={
-                "destination": destination,
-                "safety_score": safety_score,
-                "trip_duration": trip_duration,
-                "currency_different": True
-            },
+            detail_keys=_INTERNATIONAL_TRAVEL_DETAILS,
+            detail_values=(
+                destination,
+                safety_score,
+                trip_duration,
+                True
+            ),
             transaction_frequency_multiplier=1.5,
             risk_score_adjustment=risk_adjustment,
-            new_locations=[destination],
-            channel_preferences=["card"]  # Primarily card usage abroad
+            new_locations=(destination,),
+            channel_preferences=_CHANNELS_TRAVEL_INTL  # Primarily card usage abroad
         )
         
     def _generate_job_change(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
@@ -345,18 +547,18 @@ class LifeEventGenerator:
         elif customer.life_stage == CustomerLifeStage.RETIREE:
             change_types = ["retirement", "part_time"]
             
-        change_type = random.choice(change_types)
+        change_type = self._choice(change_types)
         
         # Impact varies by change type
         if change_type in ["promotion", "new_company"]:
             impact = EventImpact.MEDIUM
-            income_change = random.uniform(1.1, 1.5)  # 10-50% increase
+            income_change = self._rng.uniform(1.1, 1.5)  # 10-50% increase
         elif change_type == "layoff":
             impact = EventImpact.HIGH
             income_change = 0.0  # No income temporarily
         else:
             impact = EventImpact.LOW
-            income_change = random.uniform(0.9, 1.1)
+            income_change = self._rng.uniform(0.9, 1.1)
             
         return LifeEvent(
             event_id=event_id,
@@ -365,30 +567,31 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=impact,
             duration_days=90,  # Job transition period
-            details={
-                "change_type": change_type,
-                "income_multiplier": income_change
-            },
-            spending_pattern_change="conservative" if change_type == "layoff" else None,
+            detail_keys=_JOB_CHANGE_DETAILS,
+            detail_values=(
+                change_type,
+                income_change
+            ),
+            spending_pattern_change=SpendingPattern.CONSERVATIVE if change_type == "layoff" else SpendingPattern.NONE,
             transaction_frequency_multiplier=0.7 if change_type == "layoff" else 1.0
         )
         
     def _generate_medical_emergency(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate medical emergency event"""
         emergency_types = ["surgery", "accident", "illness", "hospitalization"]
-        emergency_type = random.choice(emergency_types)
+        emergency_type = self._choice(emergency_types)
         
         # Severity affects duration and spending
-        severity = random.choice(["minor", "moderate", "major"])
+        severity = self._choice(["minor", "moderate", "major"])
         
         if severity == "minor":
-            duration = random.randint(3, 14)
+            duration = self._randint(3, 14)
             spending_multiplier = 1.2
         elif severity == "moderate": 
-            duration = random.randint(14, 60)
+            duration = self._randint(14, 60)
             spending_multiplier = 1.8
         else:  # major
-            duration = random.randint(30, 180)
+            duration = self._randint(30, 180)
             spending_multiplier = 3.0
             
         return LifeEvent(
@@ -398,19 +601,20 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=duration,
-            details={
-                "emergency_type": emergency_type,
-                "severity": severity,
-                "spending_multiplier": spending_multiplier
-            },
+            detail_keys=_MEDICAL_EMERGENCY_DETAILS,
+            detail_values=(
+                emergency_type,
+                severity,
+                spending_multiplier
+            ),
             transaction_frequency_multiplier=spending_multiplier,
-            spending_pattern_change="medical_focus"
+            spending_pattern_change=SpendingPattern.MEDICAL_FOCUS
         )
         
     def _generate_account_compromise(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate account compromise event"""
         compromise_types = ["phishing", "data_breach", "card_skimming", "social_engineering"]
-        compromise_type = random.choice(compromise_types)
+        compromise_type = self._choice(compromise_types)
         
         return LifeEvent(
             event_id=event_id,
@@ -419,11 +623,12 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.CRITICAL,
             duration_days=14,  # Account recovery period
-            details={
-                "compromise_type": compromise_type,
-                "requires_account_freeze": True,
-                "requires_new_cards": True
-            },
+            detail_keys=_ACCOUNT_COMPROMISE_DETAILS,
+            detail_values=(
+                compromise_type,
+                True,
+                True
+            ),
             risk_score_adjustment=0.8,  # Temporarily very high risk
             transaction_frequency_multiplier=0.1  # Minimal activity during recovery
         )
@@ -431,7 +636,7 @@ class LifeEventGenerator:
     def _generate_device_theft(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate device theft event"""
         device_types = ["smartphone", "laptop", "tablet", "wallet_with_cards"]
-        device_type = random.choice(device_types)
+        device_type = self._choice(device_types)
         
         return LifeEvent(
             event_id=event_id,
@@ -440,30 +645,31 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=7,  # Recovery period
-            details={
-                "device_type": device_type,
-                "requires_card_replacement": device_type in ["smartphone", "wallet_with_cards"],
-                "location": f"{customer.city}, {customer.state}"
-            },
+            detail_keys=_DEVICE_THEFT_DETAILS,
+            detail_values=(
+                device_type,
+                device_type in ["smartphone", "wallet_with_cards"],
+                f"{customer.city}, {customer.state}"
+            ),
             risk_score_adjustment=0.3,
             transaction_frequency_multiplier=0.3,  # Reduced activity until recovery
-            channel_preferences=["branch", "online"]  # Avoid mobile/card initially
+            channel_preferences=_CHANNELS_DEVICE_THEFT  # Avoid mobile/card initially
         )
         
     def _generate_home_purchase(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate home purchase event"""
         purchase_types = ["first_home", "upgrade", "downsize", "investment"]
-        purchase_type = random.choice(purchase_types)
+        purchase_type = self._choice(purchase_types)
         
         # Home value based on income
         if customer.income_level == IncomeLevel.LOW:
-            home_value = random.uniform(150000, 300000)
+            home_value = self._rng.uniform(150000, 300000)
         elif customer.income_level == IncomeLevel.MEDIUM:
-            home_value = random.uniform(250000, 500000)
+            home_value = self._rng.uniform(250000, 500000)
         elif customer.income_level == IncomeLevel.HIGH:
-            home_value = random.uniform(400000, 800000)
+            home_value = self._rng.uniform(400000, 800000)
         else:  # ULTRA_HIGH
-            home_value = random.uniform(600000, 2000000)
+            home_value = self._rng.uniform(600000, 2000000)
             
         return LifeEvent(
             event_id=event_id,
@@ -472,13 +678,14 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=60,  # Closing and moving process
-            details={
-                "purchase_type": purchase_type,
-                "home_value": home_value,
-                "down_payment": home_value * random.uniform(0.1, 0.3)
-            },
+            detail_keys=_HOME_PURCHASE_DETAILS,
+            detail_values=(
+                purchase_type,
+                home_value,
+                home_value * self._rng.uniform(0.1, 0.3)
+            ),
             transaction_frequency_multiplier=2.0,  # Lots of home-related purchases
-            spending_pattern_change="home_focus"
+            spending_pattern_change=SpendingPattern.HOME_FOCUS
         )
         
     def _generate_generic_event(self, event_id: str, event_type: EventType, 
@@ -490,9 +697,10 @@ class LifeEventGenerator:
             customer_id=customer.customer_id,
             event_date=event_date,
             impact_level=EventImpact.LOW,
-            duration_days=random.randint(1, 30),
-            details={"type": "generic"},
-            transaction_frequency_multiplier=random.uniform(0.8, 1.2)
+            duration_days=self._randint(1, 30),
+            detail_keys=_GENERIC_DETAILS,
+            detail_values=("generic",),
+            transaction_frequency_multiplier=self._rng.uniform(0.8, 1.2)
         )
         
     def _generate_marriage(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
@@ -504,13 +712,14 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=180,  # Wedding planning and adjustment period
-            details={
-                "requires_name_change": random.random() < 0.7,
-                "joint_accounts": True,
-                "wedding_expenses": random.uniform(15000, 50000)
-            },
+            detail_keys=_MARRIAGE_DETAILS,
+            detail_values=(
+                self._rng.random() < 0.7,
+                True,
+                self._rng.uniform(15000, 50000)
+            ),
             transaction_frequency_multiplier=1.8,  # Wedding expenses
-            spending_pattern_change="wedding_focus"
+            spending_pattern_change=SpendingPattern.WEDDING_FOCUS
         )
         
     def _generate_divorce(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
@@ -522,13 +731,14 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=365,  # Long adjustment period
-            details={
-                "requires_account_separation": True,
-                "asset_division": True,
-                "legal_costs": random.uniform(5000, 25000)
-            },
+            detail_keys=_DIVORCE_DETAILS,
+            detail_values=(
+                True,
+                True,
+                self._rng.uniform(5000, 25000)
+            ),
             transaction_frequency_multiplier=0.7,  # Reduced spending
-            spending_pattern_change="conservative"
+            spending_pattern_change=SpendingPattern.CONSERVATIVE
         )
         
     def _generate_new_baby(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
@@ -540,31 +750,32 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=365,  # First year adjustments
-            details={
-                "medical_expenses": random.uniform(8000, 15000),
-                "baby_supplies": True,
-                "potential_income_reduction": random.random() < 0.4  # Maternity/paternity leave
-            },
+            detail_keys=_NEW_BABY_DETAILS,
+            detail_values=(
+                self._rng.uniform(8000, 15000),
+                True,
+                self._rng.random() < 0.4  # Maternity/paternity leave
+            ),
             transaction_frequency_multiplier=1.5,  # Baby-related purchases
-            spending_pattern_change="family_focus"
+            spending_pattern_change=SpendingPattern.FAMILY_FOCUS
         )
         
     def _generate_income_change(self, event_id: str, customer: CustomerProfile, event_date: datetime) -> LifeEvent:
         """Generate income change event"""
         change_types = ["raise", "bonus", "reduction", "second_income", "loss_income"]
-        change_type = random.choice(change_types)
+        change_type = self._choice(change_types)
         
         if change_type == "raise":
-            multiplier = random.uniform(1.05, 1.25)
+            multiplier = self._rng.uniform(1.05, 1.25)
             impact = EventImpact.MEDIUM
         elif change_type == "bonus":
             multiplier = 1.0  # One-time, doesn't affect base
             impact = EventImpact.LOW
         elif change_type == "reduction":
-            multiplier = random.uniform(0.7, 0.95)
+            multiplier = self._rng.uniform(0.7, 0.95)
             impact = EventImpact.HIGH
         else:
-            multiplier = random.uniform(0.9, 1.3)
+            multiplier = self._rng.uniform(0.9, 1.3)
             impact = EventImpact.MEDIUM
             
         return LifeEvent(
@@ -574,11 +785,12 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=impact,
             duration_days=90,  # Adjustment period
-            details={
-                "change_type": change_type,
-                "income_multiplier": multiplier,
-                "is_permanent": change_type in ["raise", "reduction", "second_income"]
-            },
+            detail_keys=_INCOME_CHANGE_DETAILS,
+            detail_values=(
+                change_type,
+                multiplier,
+                change_type in ["raise", "reduction", "second_income"]
+            ),
             transaction_frequency_multiplier=multiplier if change_type != "bonus" else 1.2
         )
         
@@ -591,14 +803,15 @@ class LifeEventGenerator:
             event_date=event_date,
             impact_level=EventImpact.HIGH,
             duration_days=365,  # First year of retirement
-            details={
-                "retirement_type": random.choice(["full", "partial", "early"]),
-                "pension_available": random.random() < 0.4,
-                "401k_rollover": True,
-                "income_reduction": random.uniform(0.4, 0.8)
-            },
+            detail_keys=_RETIREMENT_DETAILS,
+            detail_values=(
+                self._choice(["full", "partial", "early"]),
+                self._rng.random() < 0.4,
+                True,
+                self._rng.uniform(0.4, 0.8)
+            ),
             transaction_frequency_multiplier=0.8,
-            spending_pattern_change="fixed_income"
+            spending_pattern_change=SpendingPattern.FIXED_INCOME
         )
         
     def get_active_events(self, customer_id: str, current_time: datetime, events: List[LifeEvent]) -> List[LifeEvent]:
@@ -608,15 +821,11 @@ class LifeEventGenerator:
             if event.customer_id == customer_id and event.is_active(current_time)
         ]
         
-    def apply_event_effects(self, customer: CustomerProfile, active_events: List[LifeEvent]) -> CustomerProfile:
-        """Apply cumulative effects of active life events to customer behavior"""
+    def compute_event_effects(self, active_events: List[LifeEvent]) -> EventEffects:
+        """Compute cumulative effects of active life events without touching the customer"""
         if not active_events:
-            return customer
+            return NO_EVENT_EFFECTS
             
-        # Create a copy to avoid modifying original
-        modified_customer = customer.__class__(**customer.__dict__)
-        
-        # Apply cumulative effects
         total_transaction_multiplier = 1.0
         total_risk_adjustment = 0.0
         new_locations = []
@@ -632,14 +841,27 @@ class LifeEventGenerator:
             if event.channel_preferences:
                 channel_preferences = event.channel_preferences
                 
-        # Apply to customer profile
-        modified_customer.transaction_frequency *= total_transaction_multiplier
+        return EventEffects(
+            total_transaction_multiplier, total_risk_adjustment,
+            tuple(new_locations), channel_preferences
+        )
         
-        # Store event effects in metadata for transaction generation
-        if not hasattr(modified_customer, 'active_events'):
-            modified_customer.active_events = active_events
-            modified_customer.event_risk_adjustment = total_risk_adjustment
-            modified_customer.event_locations = new_locations
-            modified_customer.event_channels = channel_preferences
+    def apply_event_effects(self, customer: CustomerProfile, active_events: List[LifeEvent]) -> CustomerProfile:
+        """Apply cumulative effects of active life events to customer behavior"""
+        if not active_events:
+            return customer
             
-        return modified_customer
\ No newline at end of file
+        effects = self.compute_event_effects(active_events)
+        
+        # Copy with the adjusted frequency to avoid modifying original
+        modified_customer = replace(
+            customer, transaction_frequency=customer.transaction_frequency * effects.transaction_multiplier
+        )
+        
+        # Store event effects in metadata for transaction generation
+        modified_customer.active_events = active_events
+        modified_customer.event_risk_adjustment = effects.risk_adjustment
+        modified_customer.event_locations = list(effects.locations)
+        modified_customer.event_channels = effects.channels
+        
+        return modified_customer
@@ -5,16 +5,79 @@ for testing fraud detection systems. Includes coordinated attacks,
 money laundering patterns, and individual fraud scenarios.
 """
 
-import random
-import math
+import itertools
+import json
+from bisect import bisect_left, bisect_right
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, Union
 from enum import Enum
 from dataclasses import dataclass, field
-from decimal import Decimal
+from types import MappingProxyType
 
-from .customers import CustomerProfile
-from .transactions import PendingTransaction, TransactionChannel, TransactionType
+import numpy as np
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from .customers import CustomerProfile, IncomeLevel
+from .transactions import (
+    PendingTransaction, TransactionChannel, TransactionType,
+    _CHANNEL_CODES, _TXN_TYPE_CODES, _MetaView, _offset_timestamps, _to_cents
+)
+
+
+# Fraud transactions are built positionally in PendingTransaction field order:
+# (type, amount, currency, description, channel, from_account, to_account,
+#  merchant_id, merchant_category, reference, timestamp, metadata)
+
+# Strings repeated across many retained transactions are interned once
+_USD = sys.intern("USD")
+
+# Shared channel choices for fraud transaction generation
+_WIRE_OR_ONLINE = (TransactionChannel.WIRE, TransactionChannel.ONLINE)
+_BRANCH_OR_ATM = (TransactionChannel.BRANCH, TransactionChannel.ATM)
+_ONLINE_OR_CARD = (TransactionChannel.ONLINE, TransactionChannel.CARD)
+
+# Metadata shared by every transaction of a pattern; per-transaction fields are merged on top
+_CARD_TESTING_BASE_META = MappingProxyType({"fraud_pattern": "card_testing", "rapid_succession": True})
+_VELOCITY_BASE_META = MappingProxyType({"fraud_pattern": "velocity_attack"})
+_LARGE_AMOUNT_BASE_META = MappingProxyType({"fraud_pattern": "large_amount"})
+_ATO_TEST_BASE_META = MappingProxyType({"fraud_pattern": "account_takeover", "phase": "testing"})
+_ATO_DRAIN_BASE_META = MappingProxyType({
+    "fraud_pattern": "account_takeover", "phase": "draining", "location_change": True, "device_change": True
+})
+_LAYERING_BASE_META = MappingProxyType({"fraud_pattern": "layering", "obfuscation": "amount_timing_variation"})
+_STRUCTURING_BASE_META = MappingProxyType({"fraud_pattern": "structuring"})
+_UNUSUAL_LOCATION_BASE_META = MappingProxyType({"fraud_pattern": "unusual_location", "geographic_anomaly": True})
+_GENERIC_BASE_META = MappingProxyType({"fraud_pattern": "generic_suspicious"})
+
+# Account takeover phase type -> (transaction type, description prefix, reference tag,
+# base metadata, default count range, default amount range, profile metadata fields
+# copied onto each transaction with their defaults)
+_ATO_PHASE_SPECS = MappingProxyType({
+    "small_test": (
+        TransactionType.WITHDRAWAL, "Test Transaction #", "ATO_TEST_", _ATO_TEST_BASE_META,
+        (2, 5), (10, 100), (("location_change", False), ("device_change", False))
+    ),
+    "drain_account": (
+        TransactionType.TRANSFER, "Account Drain #", "ATO_DRAIN_", _ATO_DRAIN_BASE_META,
+        (3, 10), (1000, 10000), (("suspicious_location", None),)
+    ),
+})
+
+# Merchant IDs for merchant suffixes 1000-9999, interned and built once so rows pick
+# them by index instead of formatting a string each
+_TEST_MERCHANT_POOL = np.array([sys.intern(f"TEST_MERCHANT_{i}") for i in range(1000, 10000)], dtype=object)
+_INTL_MERCHANT_POOL = np.array([sys.intern(f"INTL_MERCHANT_{i}") for i in range(1000, 10000)], dtype=object)
+
+# Income levels targeted by large amount fraud
+_HV_LEVELS = frozenset({IncomeLevel.HIGH, IncomeLevel.ULTRA_HIGH})
 
 
 class FraudType(Enum):
@@ -47,7 +110,48 @@ class FraudType(Enum):
     REFUND_FRAUD = "refund_fraud"           # Fraudulent refund requests
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class FraudPatternSpec:
+    """Numeric ranges of a fraud pattern, extracted once from its template"""
+    min_transactions: int
+    max_transactions: int
+    min_amount: float
+    max_amount: float
+    min_window_minutes: int
+    max_window_minutes: int
+    preferred_channels: Tuple[TransactionChannel, ...]
+    merchant_categories: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_template(cls, template: Dict[str, any]) -> "FraudPatternSpec":
+        """Build a spec from a fraud_patterns template entry"""
+        return cls(
+            min_transactions=template["transaction_count"][0],
+            max_transactions=template["transaction_count"][1],
+            min_amount=template["amount_range"][0],
+            max_amount=template["amount_range"][1],
+            min_window_minutes=template["time_window_minutes"][0],
+            max_window_minutes=template["time_window_minutes"][1],
+            preferred_channels=tuple(template["preferred_channels"]),
+            merchant_categories=tuple(sys.intern(c) for c in template.get("merchant_categories", ()))
+        )
+        
+    @property
+    def amount_range(self) -> Tuple[float, float]:
+        return (self.min_amount, self.max_amount)
+
+
+def _fraud_key(fraud_id: str) -> int:
+    """Stable 32-bit key of a fraud ID for seeding per-profile generators"""
+    return zlib.crc32(fraud_id.encode())
+
+
+def _to_ns(dt: datetime) -> int:
+    """Convert a datetime to an int64 nanosecond epoch"""
+    return int(np.datetime64(dt, 'ns').view('i8'))
+
+
+@dataclass(slots=True, frozen=True)
 class FraudProfile:
     """Profile of a fraudulent entity"""
     fraud_id: str
@@ -60,13 +164,22 @@ class FraudProfile:
     success_rate: float = 0.7  # How many transactions succeed
     sophistication: float = 0.5  # How sophisticated (0=obvious, 1=subtle)
     metadata: Dict[str, any] = field(default_factory=dict)
+    # Derived once; the profile is frozen
+    end_time: datetime = field(init=False, repr=False, compare=False)
+    account_array: np.ndarray = field(init=False, repr=False, compare=False)  # account_ids as an object array
+    start_ts: int = field(init=False, repr=False, compare=False)  # int64 epoch nanoseconds
+    end_ts: int = field(init=False, repr=False, compare=False)
+    seed_key: int = field(init=False, repr=False, compare=False)  # _fraud_key(fraud_id)
     
-    @property
-    def end_time(self) -> datetime:
-        return self.start_time + timedelta(minutes=self.duration_minutes)
+    def __post_init__(self):
+        object.__setattr__(self, "end_time", self.start_time + timedelta(minutes=self.duration_minutes))
+        object.__setattr__(self, "start_ts", _to_ns(self.start_time))
+        object.__setattr__(self, "end_ts", _to_ns(self.end_time))
+        object.__setattr__(self, "account_array", np.array(self.account_ids, dtype=object))
+        object.__setattr__(self, "seed_key", _fraud_key(self.fraud_id))
 
 
-@dataclass
+@dataclass(slots=True)
 class FraudNetwork:
     """A network of connected fraud entities"""
     network_id: str
@@ -74,25 +187,338 @@ class FraudNetwork:
     connection_strength: float  # How tightly connected
     coordination_level: float   # How coordinated their actions are
     
+    # Start-time index over fraud_profiles, built once in __post_init__
+    _sorted: List[FraudProfile] = field(init=False, repr=False, compare=False)
+    _starts: List[datetime] = field(init=False, repr=False, compare=False)
+    _max_duration: timedelta = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._sorted = sorted(self.fraud_profiles, key=lambda p: p.start_time)
+        self._starts = [p.start_time for p in self._sorted]
+        self._max_duration = timedelta(minutes=max((p.duration_minutes for p in self._sorted), default=0))
+        
     def get_active_profiles(self, current_time: datetime) -> List[FraudProfile]:
         """Get fraud profiles active at current time"""
-        return [
-            profile for profile in self.fraud_profiles
-            if profile.start_time <= current_time <= profile.end_time
-        ]
+        # Only profiles starting within the longest duration before now can still be active
+        lo = bisect_left(self._starts, current_time - self._max_duration)
+        hi = bisect_right(self._starts, current_time)
+        return [profile for profile in self._sorted[lo:hi] if current_time <= profile.end_time]
+
+
+def _velocity_draws(rng: np.random.Generator, count: int, success_rate: float,
+                    amount_range: Tuple[float, float], window_s: int,
+                    n_channels: int, n_accounts: int):
+    """Batch draws for a velocity attack
+    
+    Single-channel and single-account profiles (the common case) skip those
+    draws entirely instead of sampling from a range of one.
+    """
+    n = int(rng.binomial(count, success_rate))
+    amounts = _to_cents(rng.uniform(*amount_range, n))
+    
+    # Very tight timing - all within minutes
+    time_offsets = rng.integers(0, window_s + 1, n)
+    channel_idx = rng.integers(0, n_channels, n) if n_channels > 1 else np.zeros(n, dtype=np.int64)
+    account_idx = rng.integers(0, n_accounts, n) if n_accounts > 1 else np.zeros(n, dtype=np.int64)
+    return n, amounts, time_offsets, channel_idx, account_idx
+
+
+# Free list of consumed PendingTransactions (see FraudGenerator.release_transactions)
+_pt_pool: List[PendingTransaction] = []
+_PT_POOL_MAX = 4096
+
+
+def _acquire_pt(*fields) -> PendingTransaction:
+    """Reuse a released PendingTransaction when one is pooled, else construct one"""
+    if _pt_pool:
+        return _pt_pool.pop().reset(*fields)
+    return PendingTransaction(*fields)
+
+
+def _column(values: Optional[np.ndarray], n: int):
+    """Iterate an optional object column, yielding None for every row when absent"""
+    return values.tolist() if values is not None else itertools.repeat(None, n)
+
+
+@dataclass(slots=True)
+class FraudTxnBatch:
+    """Column-oriented fraud transactions for one profile, materialized on demand"""
+    transaction_type: TransactionType
+    description_prefix: str
+    reference_prefix: str
+    sequence: np.ndarray                  # int64, numbers rendered into description/reference
+    amount_cents: np.ndarray              # int64, exact money amounts in cents
+    channels: np.ndarray                  # int8 index into channel_table
+    channel_table: Tuple[TransactionChannel, ...]
+    from_accounts: Optional[np.ndarray]   # object, None when every row is an external deposit
+    to_accounts: Optional[np.ndarray]     # object, None when every row is an external transfer
+    base_time: datetime
+    offsets_s: np.ndarray                 # int64 seconds from base_time
+    meta: Dict[str, any]                  # Shared by every row
+    row_meta: Dict[str, np.ndarray] = field(default_factory=dict)  # Per-row metadata columns
+    merchant_ids: Optional[np.ndarray] = None
+    merchant_categories: Optional[np.ndarray] = None
+    currency: str = _USD
+    
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+        
+    @classmethod
+    def empty(cls, base_time: datetime) -> "FraudTxnBatch":
+        """Batch with no rows"""
+        no_rows = np.empty(0, dtype=np.int64)
+        return cls(
+            transaction_type=TransactionType.WITHDRAWAL, description_prefix="", reference_prefix="",
+            sequence=no_rows, amount_cents=no_rows, channels=no_rows.astype(np.int8), channel_table=(),
+            from_accounts=None, to_accounts=None, base_time=base_time, offsets_s=no_rows, meta={}
+        )
+        
+    def to_pending_list(self) -> List[PendingTransaction]:
+        """Materialize one PendingTransaction per row"""
+        n = len(self.amount_cents)
+        if n == 0:
+            return []
+            
+        transaction_type, currency, channel_table = self.transaction_type, self.currency, self.channel_table
+        description_prefix, reference_prefix, shared = self.description_prefix, self.reference_prefix, self.meta
+        row_keys = tuple(self.row_meta)
+        row_values = zip(*(column.tolist() for column in self.row_meta.values())) if row_keys else itertools.repeat((), n)
+        
+        transactions = []
+        append = transactions.append
+        for seq, amount, channel, from_account, to_account, merchant_id, category, timestamp, extra in zip(
+            self.sequence.tolist(), (self.amount_cents / 100).tolist(), self.channels.tolist(),
+            _column(self.from_accounts, n), _column(self.to_accounts, n),
+            _column(self.merchant_ids, n), _column(self.merchant_categories, n),
+            _offset_timestamps(self.base_time, self.offsets_s), row_values
+        ):
+            metadata = _MetaView(shared, dict(zip(row_keys, extra)) if row_keys else None)
+            number = str(seq)  # Rendered once, shared by description and reference
+            append(_acquire_pt(
+                transaction_type, amount, currency, description_prefix + number,
+                channel_table[channel], from_account, to_account,
+                merchant_id, category,
+                reference_prefix + number, timestamp, metadata
+            ))
+            
+        return transactions
+
+        
+    def to_record_batch(self) -> "pa.RecordBatch":
+        """Write the rows straight into an Arrow record batch, without PendingTransaction objects"""
+        n = len(self.amount_cents)
+        numbers = [str(seq) for seq in self.sequence.tolist()]
+        description_prefix, reference_prefix = self.description_prefix, self.reference_prefix
+        channel_values = np.array([c.value for c in self.channel_table], dtype=object)
+        base = np.datetime64(self.base_time.replace(tzinfo=None), "ns")
+        
+        shared = self.meta
+        row_keys = tuple(self.row_meta)
+        if row_keys:
+            metadata = [
+                json.dumps({**shared, **dict(zip(row_keys, extra))})
+                for extra in zip(*(column.tolist() for column in self.row_meta.values()))
+            ]
+        else:
+            metadata = [json.dumps(shared)] * n
+            
+        return pa.RecordBatch.from_arrays([
+            pa.array([self.transaction_type.value] * n, type=pa.string()),
+            pa.array(self.amount_cents / 100, type=pa.float64()),
+            pa.array([self.currency] * n, type=pa.string()),
+            pa.array([description_prefix + number for number in numbers], type=pa.string()),
+            pa.array(channel_values[self.channels], type=pa.string()),
+            pa.array(list(_column(self.from_accounts, n)), type=pa.string()),
+            pa.array(list(_column(self.to_accounts, n)), type=pa.string()),
+            pa.array(list(_column(self.merchant_ids, n)), type=pa.string()),
+            pa.array(list(_column(self.merchant_categories, n)), type=pa.string()),
+            pa.array([reference_prefix + number for number in numbers], type=pa.string()),
+            pa.array(base + self.offsets_s.astype("timedelta64[s]"), type=pa.timestamp("ns")),
+            pa.array(metadata, type=pa.string()),
+        ], schema=FRAUD_ARROW_SCHEMA)
+
+
+# Arrow schema of streamed fraud transactions: PendingTransaction fields in order,
+# enums as their values and metadata as a JSON string
+if HAS_PYARROW:
+    FRAUD_ARROW_SCHEMA = pa.schema([
+        ("transaction_type", pa.string()),
+        ("amount", pa.float64()),
+        ("currency", pa.string()),
+        ("description", pa.string()),
+        ("channel", pa.string()),
+        ("from_account_id", pa.string()),
+        ("to_account_id", pa.string()),
+        ("merchant_id", pa.string()),
+        ("merchant_category", pa.string()),
+        ("reference", pa.string()),
+        ("timestamp", pa.timestamp("ns")),
+        ("metadata", pa.string()),
+    ])
+else:
+    FRAUD_ARROW_SCHEMA = None
+
+
+@dataclass(slots=True)
+class TransactionBatch:
+    """Fraud transactions of many profiles as flat typed columns for vectorized scans
+    
+    Rows are the concatenation of the source FraudTxnBatch rows, so objects are
+    only materialized when a caller asks for them.
+    """
+    types: np.ndarray           # int8 index into _TXN_TYPE_TABLE
+    channels: np.ndarray        # int8 index into _CHANNEL_TABLE
+    amount_cents: np.ndarray    # int64
+    timestamps_ns: np.ndarray   # int64 wall-clock epoch nanoseconds
+    from_accounts: np.ndarray   # int32 code into account_table, -1 when external
+    to_accounts: np.ndarray     # int32 code into account_table, -1 when external
+    account_table: List[str]
+    sources: List[FraudTxnBatch] = field(repr=False)
+    
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+        
+    def as_pending_transactions(self) -> List[PendingTransaction]:
+        """Materialize every row as a PendingTransaction"""
+        return list(itertools.chain.from_iterable(source.to_pending_list() for source in self.sources))
+
+
+def _structuring_core(draws: np.ndarray, target_amount: float) -> np.ndarray:
+    """Split target_amount into deposits of the drawn sizes
+    
+    Deposits continue until the running total reaches the target or the draws
+    run out; the last one only covers what remains. Pure array code with no
+    Python-level loop over deposits.
+    """
+    if draws.size == 0:
+        return draws
+        
+    totals = np.cumsum(draws)
+    n = min(int(np.searchsorted(totals, target_amount, side="left")) + 1, draws.size)
+    amounts = draws[:n].copy()
+    if totals[n - 1] >= target_amount:
+        amounts[-1] = target_amount - (totals[n - 2] if n > 1 else 0.0)
+    return amounts
+
+
+_worker_generator: Optional["FraudGenerator"] = None
+
+
+def _init_fraud_worker(generator: "FraudGenerator"):
+    """Process pool initializer: keep one generator copy per worker"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_profile_transactions(fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    """Worker entry point: generate transactions for one fraud profile"""
+    _worker_generator._rng = _worker_generator._profile_rng(fraud_profile, current_time)
+    return _worker_generator.generate_fraud_transactions(fraud_profile, current_time)
+
+
+def _build_network_profile(fraud_type: FraudType, fraud_id: str, kwargs: Dict[str, any]) -> FraudProfile:
+    """Worker entry point: build one fraud network member profile"""
+    _worker_generator._rng = _worker_generator._keyed_rng(_fraud_key(fraud_id))
+    return _worker_generator._attack_dispatch[fraud_type](fraud_id, **kwargs)
 
 
 class FraudGenerator:
     """Generates various fraud patterns for testing"""
     
     def __init__(self, seed: Optional[int] = None):
-        if seed is not None:
-            random.seed(seed)
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
             
         self._initialize_fraud_templates()
         self._active_fraud_profiles: List[FraudProfile] = []
+        
+        # Columnar time index over _active_fraud_profiles; buffers grow by doubling
+        # and are re-sorted by start time on the first query after an insert
+        self._starts_ns = np.empty(16, dtype=np.int64)
+        self._ends_ns = np.empty(16, dtype=np.int64)
+        self._profiles_arr = np.empty(16, dtype=object)
+        self._n_profiles = 0
+        self._max_span_ns = 0
+        self._index_dirty = False
         self._fraud_networks: List[FraudNetwork] = []
         
+        # Fraud type -> builder tables; unlisted types use the generic builders, and the
+        # transaction table is filled for every type so dispatch is a single lookup
+        self._attack_dispatch = {
+            FraudType.CARD_TESTING: self._generate_card_testing,
+            FraudType.VELOCITY_ATTACK: self._generate_velocity_attack,
+            FraudType.LARGE_AMOUNT: self._generate_large_amount_fraud,
+            FraudType.ACCOUNT_TAKEOVER: self._generate_account_takeover,
+            FraudType.LAYERING: self._generate_layering_attack,
+            FraudType.STRUCTURING: self._generate_structuring_attack,
+            FraudType.UNUSUAL_LOCATION: self._generate_unusual_location_fraud,
+        }
+        self._transaction_dispatch = {
+            FraudType.CARD_TESTING: self._generate_card_testing_transactions,
+            FraudType.VELOCITY_ATTACK: self._generate_velocity_transactions,
+            FraudType.LARGE_AMOUNT: self._generate_large_amount_transactions,
+            FraudType.ACCOUNT_TAKEOVER: self._generate_account_takeover_transactions,
+            FraudType.LAYERING: self._generate_layering_transactions,
+            FraudType.STRUCTURING: self._generate_structuring_transactions,
+            FraudType.UNUSUAL_LOCATION: self._generate_unusual_location_transactions,
+        }
+        for fraud_type in FraudType:
+            self._transaction_dispatch.setdefault(fraud_type, self._generate_generic_fraud_transactions)
+        
+        # Flat customer -> accounts index (see set_account_mapping)
+        self._account_mapping: Optional[Dict[str, List[str]]] = None
+        self._cust_row: Dict[str, int] = {}
+        self._acct_offsets = np.zeros(1, dtype=np.int64)
+        self._flat_accts = np.empty(0, dtype=object)
+        
+        # Account ID dictionary shared by every TransactionBatch this generator builds
+        self._acct_codes: Dict[str, int] = {}
+        self._acct_table: List[str] = []
+        
+    def _randint(self, low: int, high: int) -> int:
+        """Random integer in [low, high], inclusive like random.randint"""
+        return int(self._rng.integers(low, high + 1))
+        
+    def _uniform(self, low: float, high: float) -> float:
+        """Random float in [low, high)"""
+        return float(self._rng.uniform(low, high))
+        
+    def _choice(self, options):
+        """Pick a random element from a sequence"""
+        return options[int(self._rng.integers(len(options)))]
+        
+    def _pick_accounts(self, accounts: np.ndarray, n: int) -> np.ndarray:
+        """Draw n accounts (with replacement) using one batched index draw"""
+        return accounts[self._rng.integers(0, len(accounts), n)]
+        
+    def set_account_mapping(self, account_mapping: Dict[str, List[str]]):
+        """Index a customer -> accounts mapping as flat offset/account arrays"""
+        counts = np.fromiter((len(a) for a in account_mapping.values()), dtype=np.int64, count=len(account_mapping))
+        
+        self._account_mapping = account_mapping
+        self._cust_row = {customer_id: row for row, customer_id in enumerate(account_mapping)}
+        self._acct_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._acct_offsets[1:])
+        self._flat_accts = np.array([a for accounts in account_mapping.values() for a in accounts], dtype=object)
+        
+    def _collect_accounts(self, customers: List[CustomerProfile], account_mapping: Dict[str, List[str]]) -> List[str]:
+        """Concatenate the account IDs of several customers"""
+        if account_mapping is not self._account_mapping:
+            # Not the indexed mapping - fall back to dict lookups
+            all_accounts = []
+            for customer in customers:
+                all_accounts.extend(account_mapping[customer.customer_id])
+            return all_accounts
+            
+        offsets = self._acct_offsets
+        rows = [self._cust_row[c.customer_id] for c in customers]
+        return np.concatenate([self._flat_accts[offsets[r]:offsets[r + 1]] for r in rows]).tolist()
+        
+    def _sample_customers(self, customers: List[CustomerProfile], count: int) -> List[CustomerProfile]:
+        """Pick distinct customers by sampling indices without replacement"""
+        indices = self._rng.choice(len(customers), size=count, replace=False, shuffle=False)
+        return [customers[i] for i in indices.tolist()]
+        
     def _initialize_fraud_templates(self):
         """Initialize templates for different fraud types"""
         # Define typical patterns for each fraud type
@@ -101,7 +527,7 @@ class FraudGenerator:
                 "transaction_count": (10, 50),
                 "amount_range": (0.01, 5.00),
                 "time_window_minutes": (5, 30),
-                "preferred_channels": [TransactionChannel.CARD, TransactionChannel.ONLINE],
+                "preferred_channels": (TransactionChannel.CARD, TransactionChannel.ONLINE),
                 "merchant_categories": ["small_retail", "online", "gas_station"],
                 "geographic_spread": False,
                 "detection_difficulty": 0.2  # Easy to detect
@@ -111,7 +537,7 @@ class FraudGenerator:
                 "transaction_count": (20, 100),
                 "amount_range": (50, 500),
                 "time_window_minutes": (1, 10),
-                "preferred_channels": [TransactionChannel.CARD, TransactionChannel.ATM],
+                "preferred_channels": (TransactionChannel.CARD, TransactionChannel.ATM),
                 "burst_pattern": True,
                 "detection_difficulty": 0.3
             },
@@ -120,7 +546,7 @@ class FraudGenerator:
                 "transaction_count": (1, 5),
                 "amount_range": (5000, 50000),
                 "time_window_minutes": (10, 120),
-                "preferred_channels": [TransactionChannel.WIRE, TransactionChannel.ONLINE],
+                "preferred_channels": _WIRE_OR_ONLINE,
                 "timing": "outside_normal_hours",
                 "detection_difficulty": 0.6
             },
@@ -169,6 +595,18 @@ class FraudGenerator:
             }
         }
         
+        # Flattened specs for the patterns generated from simple ranges
+        self._pattern_specs = {
+            fraud_type: FraudPatternSpec.from_template(self.fraud_patterns[fraud_type])
+            for fraud_type in (FraudType.CARD_TESTING, FraudType.VELOCITY_ATTACK, FraudType.LARGE_AMOUNT)
+        }
+        
+        # Account takeover phase duration bounds as an (n_phases, 2) array
+        self._ato_phase_bounds = np.array([
+            phase.get("duration_minutes", (30, 180))
+            for phase in self.fraud_patterns[FraudType.ACCOUNT_TAKEOVER]["phases"]
+        ], dtype=np.int64)
+        
         # Suspicious locations for geographic fraud
         self.suspicious_locations = [
             {"country": "RU", "city": "Moscow", "risk_score": 0.9},
@@ -184,39 +622,28 @@ class FraudGenerator:
                             account_mapping: Dict[str, List[str]], start_time: datetime,
                             intensity: float = 1.0, **kwargs) -> FraudProfile:
         """Generate a specific fraud attack"""
-        fraud_id = f"FRAUD_{int(start_time.timestamp())}_{random.randint(1000, 9999)}"
-        
-        if fraud_type == FraudType.CARD_TESTING:
-            return self._generate_card_testing(fraud_id, target_customers, account_mapping, start_time, intensity)
-        elif fraud_type == FraudType.VELOCITY_ATTACK:
-            return self._generate_velocity_attack(fraud_id, target_customers, account_mapping, start_time, intensity)
-        elif fraud_type == FraudType.LARGE_AMOUNT:
-            return self._generate_large_amount_fraud(fraud_id, target_customers, account_mapping, start_time, intensity)
-        elif fraud_type == FraudType.ACCOUNT_TAKEOVER:
-            return self._generate_account_takeover(fraud_id, target_customers, account_mapping, start_time, intensity)
-        elif fraud_type == FraudType.LAYERING:
-            return self._generate_layering_attack(fraud_id, target_customers, account_mapping, start_time, intensity, **kwargs)
-        elif fraud_type == FraudType.STRUCTURING:
-            return self._generate_structuring_attack(fraud_id, target_customers, account_mapping, start_time, intensity, **kwargs)
-        elif fraud_type == FraudType.UNUSUAL_LOCATION:
-            return self._generate_unusual_location_fraud(fraud_id, target_customers, account_mapping, start_time, intensity)
-        else:
+        fraud_id = f"FRAUD_{int(start_time.timestamp())}_{self._randint(1000, 9999)}"
+        
+        generate = self._attack_dispatch.get(fraud_type)
+        if generate is None:
             # Generic fraud pattern
             return self._generate_generic_fraud(fraud_id, fraud_type, target_customers, account_mapping, start_time, intensity)
             
+        return generate(fraud_id, target_customers, account_mapping, start_time, intensity, **kwargs)
+        
     def _generate_card_testing(self, fraud_id: str, customers: List[CustomerProfile],
-                              account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
+                              account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate card testing fraud pattern"""
-        pattern = self.fraud_patterns[FraudType.CARD_TESTING]
+        pattern = self._pattern_specs[FraudType.CARD_TESTING]
         
         # Select random customer as victim
-        target_customer = random.choice(customers)
+        target_customer = self._choice(customers)
         target_accounts = account_mapping[target_customer.customer_id]
         
-        transaction_count = random.randint(*pattern["transaction_count"])
+        transaction_count = self._randint(pattern.min_transactions, pattern.max_transactions)
         transaction_count = int(transaction_count * intensity)
         
-        duration_minutes = random.randint(*pattern["time_window_minutes"])
+        duration_minutes = self._randint(pattern.min_window_minutes, pattern.max_window_minutes)
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -230,25 +657,25 @@ class FraudGenerator:
             sophistication=0.2,
             metadata={
                 "transaction_count": transaction_count,
-                "amount_range": pattern["amount_range"],
-                "preferred_channels": pattern["preferred_channels"],
-                "merchant_categories": pattern["merchant_categories"]
+                "amount_range": pattern.amount_range,
+                "preferred_channels": pattern.preferred_channels,
+                "merchant_categories": pattern.merchant_categories
             }
         )
         
     def _generate_velocity_attack(self, fraud_id: str, customers: List[CustomerProfile],
-                                 account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
+                                 account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate velocity attack fraud pattern"""
-        pattern = self.fraud_patterns[FraudType.VELOCITY_ATTACK]
+        pattern = self._pattern_specs[FraudType.VELOCITY_ATTACK]
         
-        target_customer = random.choice(customers)
+        target_customer = self._choice(customers)
         target_accounts = account_mapping[target_customer.customer_id]
         
-        transaction_count = random.randint(*pattern["transaction_count"])
+        transaction_count = self._randint(pattern.min_transactions, pattern.max_transactions)
         transaction_count = int(transaction_count * intensity)
         
         # Very short time window for velocity attacks
-        duration_minutes = random.randint(*pattern["time_window_minutes"])
+        duration_minutes = self._randint(pattern.min_window_minutes, pattern.max_window_minutes)
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -262,20 +689,20 @@ class FraudGenerator:
             sophistication=0.3,
             metadata={
                 "transaction_count": transaction_count,
-                "amount_range": pattern["amount_range"],
+                "amount_range": pattern.amount_range,
                 "burst_pattern": True,
-                "preferred_channels": pattern["preferred_channels"]
+                "preferred_channels": pattern.preferred_channels
             }
         )
         
     def _generate_large_amount_fraud(self, fraud_id: str, customers: List[CustomerProfile],
-                                   account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
+                                   account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate large amount fraud pattern"""
-        pattern = self.fraud_patterns[FraudType.LARGE_AMOUNT]
+        pattern = self._pattern_specs[FraudType.LARGE_AMOUNT]
         
         # Target customers with higher balances
-        high_value_customers = [c for c in customers if c.income_level.value in ["high", "ultra_high"]]
-        target_customer = random.choice(high_value_customers if high_value_customers else customers)
+        high_value_customers = [c for c in customers if c.income_level in _HV_LEVELS]
+        target_customer = self._choice(high_value_customers if high_value_customers else customers)
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -283,25 +710,25 @@ class FraudGenerator:
             customer_ids=[target_customer.customer_id],
             account_ids=account_mapping[target_customer.customer_id],
             start_time=start_time,
-            duration_minutes=random.randint(*pattern["time_window_minutes"]),
+            duration_minutes=self._randint(pattern.min_window_minutes, pattern.max_window_minutes),
             intensity=intensity,
             success_rate=0.3,  # Large amounts should be scrutinized
             sophistication=0.6,
             metadata={
-                "transaction_count": random.randint(*pattern["transaction_count"]),
-                "amount_range": pattern["amount_range"],
+                "transaction_count": self._randint(pattern.min_transactions, pattern.max_transactions),
+                "amount_range": pattern.amount_range,
                 "timing": "outside_normal_hours",
-                "preferred_channels": pattern["preferred_channels"]
+                "preferred_channels": pattern.preferred_channels
             }
         )
         
     def _generate_account_takeover(self, fraud_id: str, customers: List[CustomerProfile],
-                                  account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
+                                  account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate account takeover fraud pattern"""
-        target_customer = random.choice(customers)
+        target_customer = self._choice(customers)
         
         # Account takeover happens in phases
-        total_duration = random.randint(120, 480)  # 2-8 hours
+        total_duration = self._randint(120, 480)  # 2-8 hours
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -315,9 +742,10 @@ class FraudGenerator:
             sophistication=0.7,
             metadata={
                 "phases": self.fraud_patterns[FraudType.ACCOUNT_TAKEOVER]["phases"],
+                "phase_bounds": self._ato_phase_bounds,
                 "location_change": True,
                 "device_change": True,
-                "suspicious_location": random.choice(self.suspicious_locations)
+                "suspicious_location": self._choice(self.suspicious_locations)
             }
         )
         
@@ -326,14 +754,13 @@ class FraudGenerator:
         """Generate money laundering layering pattern"""
         # Select multiple customers to participate in layering
         num_customers = min(kwargs.get("hops", 5), len(customers))
-        involved_customers = random.sample(customers, num_customers)
+        involved_customers = self._sample_customers(customers, num_customers)
         
-        all_accounts = []
-        for customer in involved_customers:
-            all_accounts.extend(account_mapping[customer.customer_id])
-            
-        hops = kwargs.get("hops", random.randint(3, num_customers))
-        amounts = kwargs.get("amounts", [random.uniform(1000, 25000) for _ in range(hops)])
+        all_accounts = self._collect_accounts(involved_customers, account_mapping)
+        
+        # Draw defaults only when not supplied; groups under 3 customers still get 3 hops
+        hops = kwargs["hops"] if "hops" in kwargs else self._randint(3, max(3, num_customers))
+        amounts = kwargs["amounts"] if "amounts" in kwargs else [self._uniform(1000, 25000) for _ in range(hops)]
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -341,7 +768,7 @@ class FraudGenerator:
             customer_ids=[c.customer_id for c in involved_customers],
             account_ids=all_accounts,
             start_time=start_time,
-            duration_minutes=random.randint(60, 480),  # 1-8 hours
+            duration_minutes=self._randint(60, 480),  # 1-8 hours
             intensity=intensity,
             success_rate=0.8,  # Individual transactions look normal
             sophistication=0.9,
@@ -356,30 +783,29 @@ class FraudGenerator:
     def _generate_structuring_attack(self, fraud_id: str, customers: List[CustomerProfile],
                                     account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate structuring (smurfing) fraud pattern"""
-        target_amount = kwargs.get("threshold", random.uniform(10000, 50000))
-        individual_max = kwargs.get("split_into", [9999])[0] if "split_into" in kwargs else 9999
+        target_amount = kwargs.get("threshold", self._uniform(10000, 50000))
+        split_into = kwargs.get("split_into")
+        individual_max = split_into[0] if split_into else 9999
         
-        # Calculate how many transactions needed
-        transaction_count = math.ceil(target_amount / individual_max)
+        # Calculate how many transactions needed (ceiling division)
+        transaction_count = int(-(-target_amount // individual_max))
         
         # Select customer(s) - could be one customer or multiple
-        if random.random() < 0.7:  # 70% single customer
-            involved_customers = [random.choice(customers)]
+        if self._rng.random() < 0.7:  # 70% single customer
+            involved_customers = [self._choice(customers)]
         else:  # 30% multiple customers (smurfing)
-            num_customers = min(random.randint(2, 5), len(customers))
-            involved_customers = random.sample(customers, num_customers)
-            
-        all_accounts = []
-        for customer in involved_customers:
-            all_accounts.extend(account_mapping[customer.customer_id])
+            num_customers = min(self._randint(2, 5), len(customers))
+            involved_customers = self._sample_customers(customers, num_customers)
             
+        all_accounts = self._collect_accounts(involved_customers, account_mapping)
+        
         return FraudProfile(
             fraud_id=fraud_id,
             fraud_type=FraudType.STRUCTURING,
             customer_ids=[c.customer_id for c in involved_customers],
             account_ids=all_accounts,
             start_time=start_time,
-            duration_minutes=random.randint(60, 10080),  # 1 hour to 1 week
+            duration_minutes=self._randint(60, 10080),  # 1 hour to 1 week
             intensity=intensity,
             success_rate=0.9,  # Individual transactions under threshold
             sophistication=0.8,
@@ -392,10 +818,10 @@ class FraudGenerator:
         )
         
     def _generate_unusual_location_fraud(self, fraud_id: str, customers: List[CustomerProfile],
-                                       account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
+                                       account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float, **kwargs) -> FraudProfile:
         """Generate transactions from suspicious locations"""
-        target_customer = random.choice(customers)
-        suspicious_location = random.choice(self.suspicious_locations)
+        target_customer = self._choice(customers)
+        suspicious_location = self._choice(self.suspicious_locations)
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -403,13 +829,13 @@ class FraudGenerator:
             customer_ids=[target_customer.customer_id],
             account_ids=account_mapping[target_customer.customer_id],
             start_time=start_time,
-            duration_minutes=random.randint(30, 240),  # 30 minutes to 4 hours
+            duration_minutes=self._randint(30, 240),  # 30 minutes to 4 hours
             intensity=intensity,
             success_rate=0.6,
             sophistication=0.4,
             metadata={
                 "suspicious_location": suspicious_location,
-                "transaction_count": random.randint(2, 10),
+                "transaction_count": self._randint(2, 10),
                 "amount_range": (100, 2000),
                 "geographic_anomaly": True
             }
@@ -418,7 +844,7 @@ class FraudGenerator:
     def _generate_generic_fraud(self, fraud_id: str, fraud_type: FraudType, customers: List[CustomerProfile],
                               account_mapping: Dict[str, List[str]], start_time: datetime, intensity: float) -> FraudProfile:
         """Generate a generic fraud pattern"""
-        target_customer = random.choice(customers)
+        target_customer = self._choice(customers)
         
         return FraudProfile(
             fraud_id=fraud_id,
@@ -426,444 +852,462 @@ class FraudGenerator:
             customer_ids=[target_customer.customer_id],
             account_ids=account_mapping[target_customer.customer_id],
             start_time=start_time,
-            duration_minutes=random.randint(30, 180),
+            duration_minutes=self._randint(30, 180),
             intensity=intensity,
             success_rate=0.5,
             sophistication=0.5,
             metadata={"pattern": "generic"}
         )
         
-    def generate_fraud_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
-        """Generate fraudulent transactions for an active fraud profile"""
+    def generate_fraud_transactions(self, fraud_profile: FraudProfile, current_time: datetime,
+                                    as_batch: bool = False) -> Union[List[PendingTransaction], FraudTxnBatch]:
+        """Generate fraudulent transactions for an active fraud profile
+        
+        With as_batch=True the columnar FraudTxnBatch is returned as-is; callers
+        that need objects call its to_pending_list().
+        """
         if current_time < fraud_profile.start_time or current_time > fraud_profile.end_time:
-            return []
+            return FraudTxnBatch.empty(current_time) if as_batch else []
             
-        transactions = []
+        batch = self._transaction_dispatch[fraud_profile.fraud_type](fraud_profile, current_time)
+        return batch if as_batch else batch.to_pending_list()
+        
+    def generate_transaction_batch(self, fraud_profiles: List[FraudProfile], current_time: datetime) -> TransactionBatch:
+        """Generate transactions for several fraud profiles into one columnar TransactionBatch"""
+        sources = [
+            batch for batch in (self.generate_fraud_transactions(p, current_time, as_batch=True) for p in fraud_profiles)
+            if len(batch)
+        ]
         
-        if fraud_profile.fraud_type == FraudType.CARD_TESTING:
-            transactions = self._generate_card_testing_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.VELOCITY_ATTACK:
-            transactions = self._generate_velocity_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.LARGE_AMOUNT:
-            transactions = self._generate_large_amount_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.ACCOUNT_TAKEOVER:
-            transactions = self._generate_account_takeover_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.LAYERING:
-            transactions = self._generate_layering_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.STRUCTURING:
-            transactions = self._generate_structuring_transactions(fraud_profile, current_time)
-        elif fraud_profile.fraud_type == FraudType.UNUSUAL_LOCATION:
-            transactions = self._generate_unusual_location_transactions(fraud_profile, current_time)
-        else:
-            transactions = self._generate_generic_fraud_transactions(fraud_profile, current_time)
+        types, channels, timestamps = [], [], []
+        for batch in sources:
+            n = len(batch)
+            types.append(np.full(n, _TXN_TYPE_CODES[batch.transaction_type], dtype=np.int8))
+            channel_codes = np.array([_CHANNEL_CODES[c] for c in batch.channel_table], dtype=np.int8)
+            channels.append(channel_codes[batch.channels])
+            base = np.datetime64(batch.base_time.replace(tzinfo=None), "ns")
+            timestamps.append((base + batch.offsets_s.astype("timedelta64[s]")).astype(np.int64))
             
-        # Mark all transactions as fraudulent
-        for txn in transactions:
-            txn.metadata["is_fraud"] = True
-            txn.metadata["fraud_type"] = fraud_profile.fraud_type.value
-            txn.metadata["fraud_id"] = fraud_profile.fraud_id
-            txn.metadata["sophistication"] = fraud_profile.sophistication
+        def concat(parts, dtype):
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
             
-        return transactions
+        return TransactionBatch(
+            types=concat(types, np.int8),
+            channels=concat(channels, np.int8),
+            amount_cents=concat([b.amount_cents for b in sources], np.int64),
+            timestamps_ns=concat(timestamps, np.int64),
+            from_accounts=concat([self._encode_accounts(b.from_accounts, len(b)) for b in sources], np.int32),
+            to_accounts=concat([self._encode_accounts(b.to_accounts, len(b)) for b in sources], np.int32),
+            account_table=self._acct_table,
+            sources=sources
+        )
         
-    def _generate_card_testing_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
-        """Generate card testing transactions"""
-        transactions = []
-        metadata = fraud_profile.metadata
+    def stream(self, fraud_profiles: List[FraudProfile], current_time: datetime, writer) -> int:
+        """Write each profile's transactions to an Arrow writer as one record batch
         
-        # Generate small test transactions
-        for i in range(metadata["transaction_count"]):
-            if random.random() > fraud_profile.success_rate:
-                continue  # Transaction would be declined
-                
-            amount = random.uniform(*metadata["amount_range"])
-            channel = random.choice(metadata["preferred_channels"])
+        The writer is any pyarrow writer with write_batch() opened on
+        FRAUD_ARROW_SCHEMA, e.g. pyarrow.ipc.new_stream(sink, FRAUD_ARROW_SCHEMA).
+        Returns the number of rows written.
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow not installed. Run: pip install pyarrow")
             
-            # Small random time offset within the attack window
-            time_offset = random.randint(0, fraud_profile.duration_minutes)
-            txn_time = fraud_profile.start_time + timedelta(minutes=time_offset)
+        rows = 0
+        for fraud_profile in fraud_profiles:
+            batch = self.generate_fraud_transactions(fraud_profile, current_time, as_batch=True)
+            if len(batch):
+                writer.write_batch(batch.to_record_batch())
+                rows += len(batch)
+        return rows
+        
+    def _encode_accounts(self, accounts: Optional[np.ndarray], n: int) -> np.ndarray:
+        """Dictionary-encode an account column to int32 codes, -1 for external"""
+        if accounts is None:
+            return np.full(n, -1, dtype=np.int32)
             
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.ONLINE_PURCHASE,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Card Test Transaction #{i+1}",
-                channel=channel,
-                from_account_id=random.choice(fraud_profile.account_ids),
-                to_account_id=None,
-                merchant_id=f"TEST_MERCHANT_{random.randint(1000, 9999)}",
-                merchant_category=random.choice(metadata["merchant_categories"]),
-                reference=f"CARDTEST_{fraud_profile.fraud_id}_{i+1}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "card_testing",
-                    "test_sequence": i + 1,
-                    "rapid_succession": True
-                }
-            )
+        codes, table = self._acct_codes, self._acct_table
+        encoded = np.empty(n, dtype=np.int32)
+        for i, account_id in enumerate(accounts.tolist()):
+            code = codes.get(account_id)
+            if code is None:
+                code = codes[account_id] = len(table)
+                table.append(account_id)
+            encoded[i] = code
+        return encoded
+        
+    def generate_batch(self, fraud_profiles: List[FraudProfile], current_time: datetime,
+                     workers: Optional[int] = None) -> List[PendingTransaction]:
+        """Generate transactions for many independent fraud profiles in worker processes"""
+        if not fraud_profiles:
+            return []
             
-            transactions.append(transaction)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_fraud_worker, initargs=(self,)) as executor:
+            results = executor.map(
+                _generate_profile_transactions, fraud_profiles, itertools.repeat(current_time), chunksize=16
+            )
+            return list(itertools.chain.from_iterable(results))
             
-        return transactions
+    def _profile_rng(self, fraud_profile: FraudProfile, current_time: datetime) -> np.random.Generator:
+        """Generator keyed by seed, fraud ID and tick, so output is independent of worker placement"""
+        return self._keyed_rng(fraud_profile.seed_key, int(current_time.timestamp()))
+        
+    def _keyed_rng(self, *keys: int) -> np.random.Generator:
+        """Fresh PCG64 stream seeded from the given keys and the generator seed
+        
+        Only used at worker boundaries; in-process generation keeps drawing from
+        the single self._rng stream.
+        """
+        entropy = list(keys)
+        if self._seed is not None:
+            entropy.append(self._seed)
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(entropy)))
+        
+    @staticmethod
+    def _fraud_meta(fraud_profile: FraudProfile, pattern_meta: Dict[str, any], **fields) -> Dict[str, any]:
+        """Shared transaction metadata: pattern fields plus the tags marking it fraudulent"""
+        return {
+            **pattern_meta,
+            **fields,
+            "is_fraud": True,
+            "fraud_type": fraud_profile.fraud_type.value,
+            "fraud_id": fraud_profile.fraud_id,
+            "sophistication": fraud_profile.sophistication
+        }
         
-    def _generate_velocity_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
-        """Generate velocity attack transactions"""
-        transactions = []
+    def _generate_card_testing_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
+        """Generate card testing transactions"""
         metadata = fraud_profile.metadata
+        channels = metadata["preferred_channels"]
+        categories = metadata["merchant_categories"]
+        
+        # Only successful attempts become transactions; their count is a single binomial
+        # draw, then every per-transaction value is drawn in batch
+        n = int(self._rng.binomial(metadata["transaction_count"], fraud_profile.success_rate))
+        amounts = _to_cents(self._rng.uniform(*metadata["amount_range"], n))
+        channel_idx = self._rng.integers(0, len(channels), n)
+        time_offsets = self._rng.integers(0, fraud_profile.duration_minutes + 1, n) * 60  # Within attack window, in seconds
+        from_accounts = self._pick_accounts(fraud_profile.account_array, n)
+        merchant_ids = self._rng.choice(_TEST_MERCHANT_POOL, n)
+        category_idx = self._rng.integers(0, len(categories), n)
+        sequence = np.arange(1, n + 1)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.ONLINE_PURCHASE,
+            description_prefix="Card Test Transaction #",
+            reference_prefix=f"CARDTEST_{fraud_profile.fraud_id}_",
+            sequence=sequence,
+            amount_cents=amounts,
+            channels=channel_idx.astype(np.int8),
+            channel_table=channels,
+            from_accounts=from_accounts,
+            to_accounts=None,
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets,
+            meta=self._fraud_meta(fraud_profile, _CARD_TESTING_BASE_META),
+            row_meta={"test_sequence": sequence},
+            merchant_ids=merchant_ids,
+            merchant_categories=np.asarray(categories, dtype=object)[category_idx]
+        )
         
-        # Generate burst of transactions in short time window
-        for i in range(metadata["transaction_count"]):
-            if random.random() > fraud_profile.success_rate:
-                continue
-                
-            amount = random.uniform(*metadata["amount_range"])
-            
-            # Very tight timing - all within minutes
-            time_offset_seconds = random.randint(0, fraud_profile.duration_minutes * 60)
-            txn_time = fraud_profile.start_time + timedelta(seconds=time_offset_seconds)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.WITHDRAWAL,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Rapid Transaction #{i+1}",
-                channel=random.choice(metadata["preferred_channels"]),
-                from_account_id=random.choice(fraud_profile.account_ids),
-                to_account_id=None,
-                merchant_id=None,
-                merchant_category=None,
-                reference=f"VELOCITY_{fraud_profile.fraud_id}_{i+1}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "velocity_attack",
-                    "burst_sequence": i + 1,
-                    "time_window_minutes": fraud_profile.duration_minutes
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
+    def _generate_velocity_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
+        """Generate velocity attack transactions"""
+        metadata = fraud_profile.metadata
+        channels = metadata["preferred_channels"]
+        accounts = fraud_profile.account_ids
+        
+        # Generate burst of transactions in short time window, drawn in batch
+        n, amounts, time_offsets, channel_idx, account_idx = _velocity_draws(
+            self._rng, metadata["transaction_count"], fraud_profile.success_rate,
+            metadata["amount_range"], fraud_profile.duration_minutes * 60,
+            len(channels), len(accounts)
+        )
+        sequence = np.arange(1, n + 1)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.WITHDRAWAL,
+            description_prefix="Rapid Transaction #",
+            reference_prefix=f"VELOCITY_{fraud_profile.fraud_id}_",
+            sequence=sequence,
+            amount_cents=amounts,
+            channels=channel_idx.astype(np.int8),
+            channel_table=channels,
+            from_accounts=fraud_profile.account_array[account_idx],
+            to_accounts=None,
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets,
+            meta=self._fraud_meta(fraud_profile, _VELOCITY_BASE_META, time_window_minutes=fraud_profile.duration_minutes),
+            row_meta={"burst_sequence": sequence}
+        )
         
-    def _generate_large_amount_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_large_amount_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate large amount fraud transactions"""
-        transactions = []
         metadata = fraud_profile.metadata
+        channels = _WIRE_OR_ONLINE
+        
+        # Generate 1-3 large transactions; successful count is one binomial draw
+        n = int(self._rng.binomial(metadata["transaction_count"], fraud_profile.success_rate))
+        amounts = self._rng.uniform(*metadata["amount_range"], n)
+        
+        # Random time within fraud window, in seconds
+        time_offsets = self._rng.integers(0, fraud_profile.duration_minutes + 1, n) * 60
+        channel_idx = self._rng.integers(0, len(channels), n)
+        from_accounts = self._pick_accounts(fraud_profile.account_array, n)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.TRANSFER,
+            description_prefix="Large Amount Transfer #",
+            reference_prefix=f"LARGE_{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, n + 1),
+            amount_cents=_to_cents(amounts),
+            channels=channel_idx.astype(np.int8),
+            channel_table=channels,
+            from_accounts=from_accounts,
+            to_accounts=None,  # External transfer
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets,
+            meta=self._fraud_meta(
+                fraud_profile, _LARGE_AMOUNT_BASE_META,
+                unusual_timing=metadata.get("timing") == "outside_normal_hours"
+            ),
+            row_meta={"amount_threshold_breach": amounts > 10000}
+        )
         
-        # Generate 1-3 large transactions
-        for i in range(metadata["transaction_count"]):
-            if random.random() > fraud_profile.success_rate:
-                continue
-                
-            amount = random.uniform(*metadata["amount_range"])
-            
-            # Random time within fraud window
-            time_offset_minutes = random.randint(0, fraud_profile.duration_minutes)
-            txn_time = fraud_profile.start_time + timedelta(minutes=time_offset_minutes)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.TRANSFER,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Large Amount Transfer #{i+1}",
-                channel=random.choice([TransactionChannel.WIRE, TransactionChannel.ONLINE]),
-                from_account_id=random.choice(fraud_profile.account_ids),
-                to_account_id=None,  # External transfer
-                merchant_id=None,
-                merchant_category=None,
-                reference=f"LARGE_{fraud_profile.fraud_id}_{i+1}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "large_amount",
-                    "amount_threshold_breach": amount > 10000,
-                    "unusual_timing": metadata.get("timing") == "outside_normal_hours"
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
-        
-    def _generate_account_takeover_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_account_takeover_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate account takeover fraud transactions"""
-        transactions = []
         metadata = fraud_profile.metadata
         phases = metadata["phases"]
         
         # Determine which phase we're in based on time elapsed
         elapsed_minutes = (current_time - fraud_profile.start_time).total_seconds() / 60
         
-        current_phase = None
-        cumulative_duration = 0
-        
-        for phase in phases:
-            phase_duration = phase.get("duration_minutes", (30, 180))
-            if isinstance(phase_duration, tuple):
-                duration = random.randint(*phase_duration)
-            else:
-                duration = phase_duration
-                
-            if elapsed_minutes <= cumulative_duration + duration:
-                current_phase = phase
-                break
-            cumulative_duration += duration
-            
-        if not current_phase:
-            return transactions
+        # Draw all phase durations at once; the current phase is the first whose
+        # cumulative end is at or past the elapsed time
+        bounds = metadata["phase_bounds"]
+        durations = self._rng.integers(bounds[:, 0], bounds[:, 1] + 1)
+        phase_idx = int(np.searchsorted(np.cumsum(durations), elapsed_minutes, side="left"))
+        
+        if phase_idx >= len(phases):
+            return FraudTxnBatch.empty(current_time)
+        current_phase = phases[phase_idx]
+        
+        # Phase constants come from the spec table, so there is no per-call branching
+        spec = _ATO_PHASE_SPECS.get(current_phase["type"])
+        if spec is None:
+            return FraudTxnBatch.empty(current_time)
+        transaction_type, description_prefix, reference_tag, base_meta, default_count, default_range, meta_fields = spec
+        
+        count = self._randint(*current_phase.get("transaction_count", default_count))
+        amount_range = current_phase.get("amount_range", default_range)
+        meta = self._fraud_meta(
+            fraud_profile, base_meta, **{key: metadata.get(key, default) for key, default in meta_fields}
+        )
             
-        # Generate transactions based on current phase
-        if current_phase["type"] == "small_test":
-            # Small test transactions
-            for i in range(current_phase.get("transaction_count", random.randint(2, 5))):
-                amount = random.uniform(*current_phase.get("amount_range", (10, 100)))
-                
-                transaction = PendingTransaction(
-                    transaction_type=TransactionType.WITHDRAWAL,
-                    amount=round(amount, 2),
-                    currency="USD",
-                    description=f"Test Transaction #{i+1}",
-                    channel=TransactionChannel.ONLINE,
-                    from_account_id=random.choice(fraud_profile.account_ids),
-                    to_account_id=None,
-                    merchant_id=None,
-                    merchant_category=None,
-                    reference=f"ATO_TEST_{fraud_profile.fraud_id}_{i+1}",
-                    timestamp=current_time,
-                    metadata={
-                        "fraud_pattern": "account_takeover",
-                        "phase": "testing",
-                        "location_change": metadata.get("location_change", False),
-                        "device_change": metadata.get("device_change", False)
-                    }
-                )
-                
-                transactions.append(transaction)
-                
-        elif current_phase["type"] == "drain_account":
-            # Large drain transactions
-            for i in range(current_phase.get("transaction_count", random.randint(3, 10))):
-                amount = random.uniform(*current_phase.get("amount_range", (1000, 10000)))
-                
-                transaction = PendingTransaction(
-                    transaction_type=TransactionType.TRANSFER,
-                    amount=round(amount, 2),
-                    currency="USD",
-                    description=f"Account Drain #{i+1}",
-                    channel=TransactionChannel.ONLINE,
-                    from_account_id=random.choice(fraud_profile.account_ids),
-                    to_account_id=None,  # External transfer
-                    merchant_id=None,
-                    merchant_category=None,
-                    reference=f"ATO_DRAIN_{fraud_profile.fraud_id}_{i+1}",
-                    timestamp=current_time,
-                    metadata={
-                        "fraud_pattern": "account_takeover",
-                        "phase": "draining",
-                        "location_change": True,
-                        "device_change": True,
-                        "suspicious_location": metadata.get("suspicious_location")
-                    }
-                )
-                
-                transactions.append(transaction)
-                
-        return transactions
+        from_accounts = self._pick_accounts(fraud_profile.account_array, count)
+        amounts = _to_cents(self._rng.uniform(*amount_range, count))
+        
+        return FraudTxnBatch(
+            transaction_type=transaction_type,
+            description_prefix=description_prefix,
+            reference_prefix=f"{reference_tag}{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, count + 1),
+            amount_cents=amounts,
+            channels=np.zeros(count, dtype=np.int8),
+            channel_table=(TransactionChannel.ONLINE,),
+            from_accounts=from_accounts,
+            to_accounts=None,
+            base_time=current_time,
+            offsets_s=np.zeros(count, dtype=np.int64),
+            meta=meta
+        )
         
-    def _generate_layering_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_layering_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate money laundering layering transactions"""
-        transactions = []
         metadata = fraud_profile.metadata
         
-        accounts = fraud_profile.account_ids.copy()
-        random.shuffle(accounts)
-        
-        for hop in range(metadata["hops"]):
-            if hop >= len(accounts) - 1:
-                break
-                
-            from_account = accounts[hop]
-            to_account = accounts[hop + 1]
-            amount = metadata["amounts"][hop] if hop < len(metadata["amounts"]) else random.uniform(1000, 25000)
-            
-            # Add some variation to amounts to obfuscate
-            amount_variation = random.uniform(-0.1, 0.1)
-            amount = amount * (1 + amount_variation)
-            
-            # Vary timing between hops
-            time_offset_minutes = hop * random.randint(10, 60)
-            txn_time = fraud_profile.start_time + timedelta(minutes=time_offset_minutes)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.TRANSFER,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Layer Transfer {hop+1}",
-                channel=random.choice([TransactionChannel.ONLINE, TransactionChannel.WIRE]),
-                from_account_id=from_account,
-                to_account_id=to_account,
-                merchant_id=None,
-                merchant_category=None,
-                reference=f"LAYER_{fraud_profile.fraud_id}_{hop+1}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "layering",
-                    "hop_sequence": hop + 1,
-                    "total_hops": metadata["hops"],
-                    "obfuscation": "amount_timing_variation"
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
+        # Hop i moves money from the i-th to the (i+1)-th account of a random ordering
+        accounts = self._rng.permutation(fraud_profile.account_array)
+        n = max(min(metadata["hops"], len(accounts) - 1), 0)
+        
+        # Planned amounts, topped up with fresh draws past the end of the plan
+        planned = np.asarray(metadata["amounts"][:n], dtype=np.float64)
+        base_amounts = np.concatenate([planned, self._rng.uniform(1000, 25000, n - planned.size)])
+        
+        # Add some variation to amounts to obfuscate
+        amounts = _to_cents(base_amounts * (1 + self._rng.uniform(-0.1, 0.1, n)))
+        
+        # Vary timing between hops
+        time_offsets = np.arange(n) * self._rng.integers(10, 61, n) * 60
+        channel_idx = self._rng.integers(0, len(_WIRE_OR_ONLINE), n)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.TRANSFER,
+            description_prefix="Layer Transfer ",
+            reference_prefix=f"LAYER_{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, n + 1),
+            amount_cents=amounts,
+            channels=channel_idx.astype(np.int8),
+            channel_table=_WIRE_OR_ONLINE,
+            from_accounts=accounts[:n],
+            to_accounts=accounts[1:n + 1],
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets,
+            meta=self._fraud_meta(fraud_profile, _LAYERING_BASE_META, total_hops=metadata["hops"]),
+            row_meta={"hop_sequence": np.arange(1, n + 1)}
+        )
         
-    def _generate_structuring_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_structuring_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate structuring (breaking up large amounts) transactions"""
-        transactions = []
         metadata = fraud_profile.metadata
         
         target_amount = metadata["target_amount"]
         individual_max = metadata["individual_max"]
-        remaining_amount = target_amount
-        
-        sequence = 0
-        while remaining_amount > 0 and sequence < metadata["transaction_count"]:
-            # Amount just under threshold, with some variation
-            amount = min(remaining_amount, random.uniform(individual_max * 0.8, individual_max))
-            remaining_amount -= amount
-            sequence += 1
-            
-            # Spread transactions over time
-            time_offset_hours = random.randint(0, fraud_profile.duration_minutes // 60)
-            txn_time = fraud_profile.start_time + timedelta(hours=time_offset_hours)
-            
-            # Pick random account if smurfing across multiple accounts
-            from_account = random.choice(fraud_profile.account_ids)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.DEPOSIT,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Structured Deposit {sequence}",
-                channel=random.choice([TransactionChannel.BRANCH, TransactionChannel.ATM]),
-                from_account_id=None,  # External deposit
-                to_account_id=from_account,
-                merchant_id=None,
-                merchant_category=None,
-                reference=f"STRUCT_{fraud_profile.fraud_id}_{sequence}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "structuring",
-                    "sequence": sequence,
-                    "target_total": target_amount,
-                    "under_threshold": amount < individual_max
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
+        max_count = metadata["transaction_count"]
+        
+        # Draw every stream for the maximum count up front and trim to the
+        # transactions actually needed
+        draws = self._rng.uniform(individual_max * 0.8, individual_max, max_count)  # Just under threshold
+        time_offsets = self._rng.integers(0, fraud_profile.duration_minutes // 60 + 1, max_count) * 3600  # Spread over time
+        channel_idx = self._rng.integers(0, len(_BRANCH_OR_ATM), max_count)
+        
+        # Pick random account if smurfing across multiple accounts
+        accounts = self._pick_accounts(fraud_profile.account_array, max_count)
+        
+        amounts = _structuring_core(draws, target_amount)
+        n = amounts.size
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.DEPOSIT,
+            description_prefix="Structured Deposit ",
+            reference_prefix=f"STRUCT_{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, n + 1),
+            amount_cents=_to_cents(amounts),
+            channels=channel_idx[:n].astype(np.int8),
+            channel_table=_BRANCH_OR_ATM,
+            from_accounts=None,  # External deposit
+            to_accounts=accounts[:n],
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets[:n],
+            meta=self._fraud_meta(fraud_profile, _STRUCTURING_BASE_META, target_total=target_amount),
+            row_meta={"sequence": np.arange(1, n + 1), "under_threshold": amounts < individual_max}
+        )
         
-    def _generate_unusual_location_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_unusual_location_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate transactions from unusual locations"""
-        transactions = []
         metadata = fraud_profile.metadata
         suspicious_location = metadata["suspicious_location"]
         
-        for i in range(metadata["transaction_count"]):
-            amount = random.uniform(*metadata["amount_range"])
-            
-            time_offset = random.randint(0, fraud_profile.duration_minutes)
-            txn_time = fraud_profile.start_time + timedelta(minutes=time_offset)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.SHOPPING,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"International Purchase {i+1}",
-                channel=TransactionChannel.CARD,
-                from_account_id=random.choice(fraud_profile.account_ids),
-                to_account_id=None,
-                merchant_id=f"INTL_MERCHANT_{random.randint(1000, 9999)}",
-                merchant_category="international",
-                reference=f"UNUSUAL_LOC_{fraud_profile.fraud_id}_{i+1}",
-                timestamp=txn_time,
-                metadata={
-                    "fraud_pattern": "unusual_location",
-                    "transaction_country": suspicious_location["country"],
-                    "transaction_city": suspicious_location["city"],
-                    "location_risk_score": suspicious_location["risk_score"],
-                    "geographic_anomaly": True
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
+        n = metadata["transaction_count"]
+        
+        from_accounts = self._pick_accounts(fraud_profile.account_array, n)
+        amounts = _to_cents(self._rng.uniform(*metadata["amount_range"], n))
+        time_offsets = self._rng.integers(0, fraud_profile.duration_minutes + 1, n) * 60
+        merchant_ids = self._rng.choice(_INTL_MERCHANT_POOL, n)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.SHOPPING,
+            description_prefix="International Purchase ",
+            reference_prefix=f"UNUSUAL_LOC_{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, n + 1),
+            amount_cents=amounts,
+            channels=np.zeros(n, dtype=np.int8),
+            channel_table=(TransactionChannel.CARD,),
+            from_accounts=from_accounts,
+            to_accounts=None,
+            base_time=fraud_profile.start_time,
+            offsets_s=time_offsets,
+            meta=self._fraud_meta(
+                fraud_profile, _UNUSUAL_LOCATION_BASE_META,
+                transaction_country=suspicious_location["country"],
+                transaction_city=suspicious_location["city"],
+                location_risk_score=suspicious_location["risk_score"]
+            ),
+            merchant_ids=merchant_ids,
+            merchant_categories=np.full(n, "international", dtype=object)
+        )
         
-    def _generate_generic_fraud_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> List[PendingTransaction]:
+    def _generate_generic_fraud_transactions(self, fraud_profile: FraudProfile, current_time: datetime) -> FraudTxnBatch:
         """Generate generic fraudulent transactions"""
-        transactions = []
-        
         # Generate 2-5 suspicious transactions
-        for i in range(random.randint(2, 5)):
-            amount = random.uniform(100, 5000)
-            
-            transaction = PendingTransaction(
-                transaction_type=TransactionType.WITHDRAWAL,
-                amount=round(amount, 2),
-                currency="USD",
-                description=f"Suspicious Transaction {i+1}",
-                channel=random.choice([TransactionChannel.ONLINE, TransactionChannel.CARD]),
-                from_account_id=random.choice(fraud_profile.account_ids),
-                to_account_id=None,
-                merchant_id=None,
-                merchant_category=None,
-                reference=f"GENERIC_{fraud_profile.fraud_id}_{i+1}",
-                timestamp=current_time,
-                metadata={
-                    "fraud_pattern": "generic_suspicious",
-                    "anomaly_score": random.uniform(0.6, 1.0)
-                }
-            )
-            
-            transactions.append(transaction)
-            
-        return transactions
+        n = self._randint(2, 5)
+        
+        # Channels are indices into the module-level tuple, drawn with everything else
+        from_accounts = self._pick_accounts(fraud_profile.account_array, n)
+        amounts = _to_cents(self._rng.uniform(100, 5000, n))
+        channel_idx = self._rng.integers(0, len(_ONLINE_OR_CARD), n)
+        anomaly_scores = self._rng.uniform(0.6, 1.0, n)
+        
+        return FraudTxnBatch(
+            transaction_type=TransactionType.WITHDRAWAL,
+            description_prefix="Suspicious Transaction ",
+            reference_prefix=f"GENERIC_{fraud_profile.fraud_id}_",
+            sequence=np.arange(1, n + 1),
+            amount_cents=amounts,
+            channels=channel_idx.astype(np.int8),
+            channel_table=_ONLINE_OR_CARD,
+            from_accounts=from_accounts,
+            to_accounts=None,
+            base_time=current_time,
+            offsets_s=np.zeros(n, dtype=np.int64),
+            meta=self._fraud_meta(fraud_profile, _GENERIC_BASE_META),
+            row_meta={"anomaly_score": anomaly_scores}
+        )
         
     def create_fraud_network(self, network_type: str, customers: List[CustomerProfile],
-                           account_mapping: Dict[str, List[str]], start_time: datetime) -> FraudNetwork:
-        """Create a coordinated fraud network"""
-        network_id = f"NET_{int(start_time.timestamp())}_{random.randint(100, 999)}"
+                           account_mapping: Dict[str, List[str]], start_time: datetime,
+                           workers: Optional[int] = None) -> FraudNetwork:
+        """Create a coordinated fraud network
+        
+        With workers > 1, member profiles of mule and generic networks are built in
+        worker processes, each drawing from a generator keyed by its fraud ID.
+        """
+        network_id = f"NET_{int(start_time.timestamp())}_{self._randint(100, 999)}"
         
         if network_type == "mule_network":
-            return self._create_mule_network(network_id, customers, account_mapping, start_time)
+            return self._create_mule_network(network_id, customers, account_mapping, start_time, workers)
         elif network_type == "synthetic_identity_ring":
             return self._create_synthetic_identity_ring(network_id, customers, account_mapping, start_time)
         else:
             # Generic coordinated fraud
-            return self._create_generic_network(network_id, customers, account_mapping, start_time)
+            return self._create_generic_network(network_id, customers, account_mapping, start_time, workers)
+            
+    def _build_network_profiles(self, members: List[Tuple[FraudType, str, Dict[str, any]]],
+                                workers: Optional[int]) -> List[FraudProfile]:
+        """Build (fraud type, fraud ID, builder kwargs) members, in worker processes if requested"""
+        if not workers or workers <= 1 or len(members) < 2:
+            return [self._attack_dispatch[fraud_type](fraud_id, **kwargs) for fraud_type, fraud_id, kwargs in members]
+            
+        # Ship each task only the accounts of its own customers
+        tasks = [
+            (fraud_type, fraud_id, {
+                **kwargs,
+                "account_mapping": {c.customer_id: kwargs["account_mapping"][c.customer_id] for c in kwargs["customers"]}
+            })
+            for fraud_type, fraud_id, kwargs in members
+        ]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_fraud_worker, initargs=(self,)) as executor:
+            return list(executor.map(_build_network_profile, *zip(*tasks)))
             
     def _create_mule_network(self, network_id: str, customers: List[CustomerProfile],
-                           account_mapping: Dict[str, List[str]], start_time: datetime) -> FraudNetwork:
+                           account_mapping: Dict[str, List[str]], start_time: datetime,
+                           workers: Optional[int] = None) -> FraudNetwork:
         """Create a money mule network"""
         # Select 5-15 customers as mules
-        mule_count = random.randint(5, min(15, len(customers)))
-        mule_customers = random.sample(customers, mule_count)
-        
-        fraud_profiles = []
+        mule_count = self._randint(5, min(15, len(customers)))
+        mule_customers = self._sample_customers(customers, mule_count)
         
         # Create layering fraud profiles connecting the mules
-        for i in range(mule_count - 1):
-            fraud_profile = self._generate_layering_attack(
-                fraud_id=f"{network_id}_LAYER_{i}",
-                customers=mule_customers[i:i+3],  # Overlapping groups
-                account_mapping=account_mapping,
-                start_time=start_time + timedelta(hours=i),  # Staggered start times
-                intensity=1.5,
-                hops=random.randint(3, 5)
-            )
-            fraud_profiles.append(fraud_profile)
+        id_prefix = f"{network_id}_LAYER_"
+        members = [
+            (FraudType.LAYERING, id_prefix + str(i), {
+                "customers": mule_customers[i:i+3],  # Overlapping groups
+                "account_mapping": account_mapping,
+                "start_time": start_time + timedelta(hours=i),  # Staggered start times
+                "intensity": 1.5,
+                "hops": self._randint(3, 5)
+            })
+            for i in range(mule_count - 1)
+        ]
+        fraud_profiles = self._build_network_profiles(members, workers)
             
         return FraudNetwork(
             network_id=network_id,
@@ -876,25 +1320,26 @@ class FraudGenerator:
                                       account_mapping: Dict[str, List[str]], start_time: datetime) -> FraudNetwork:
         """Create synthetic identity fraud ring"""
         # Select customers with newer accounts (synthetic identities)
-        synthetic_customers = random.sample(customers, min(8, len(customers)))
+        synthetic_customers = self._sample_customers(customers, min(8, len(customers)))
         
         fraud_profiles = []
+        id_prefix = f"{network_id}_SYNTH_"
         
         for i, customer in enumerate(synthetic_customers):
             # Each synthetic identity runs a bust-out scheme
             fraud_profile = FraudProfile(
-                fraud_id=f"{network_id}_SYNTH_{i}",
+                fraud_id=id_prefix + str(i),
                 fraud_type=FraudType.SYNTHETIC_IDENTITY,
                 customer_ids=[customer.customer_id],
                 account_ids=account_mapping[customer.customer_id],
                 start_time=start_time + timedelta(days=i),  # Coordinated but not simultaneous
-                duration_minutes=random.randint(480, 1440),  # 8-24 hours
+                duration_minutes=self._randint(480, 1440),  # 8-24 hours
                 intensity=1.0,
                 success_rate=0.8,
                 sophistication=0.95,
                 metadata={
                     "buildup_complete": True,  # Assume identity was built up previously
-                    "bust_out_amount": random.uniform(10000, 100000),
+                    "bust_out_amount": self._uniform(10000, 100000),
                     "coordination_group": network_id
                 }
             )
@@ -908,24 +1353,24 @@ class FraudGenerator:
         )
         
     def _create_generic_network(self, network_id: str, customers: List[CustomerProfile],
-                              account_mapping: Dict[str, List[str]], start_time: datetime) -> FraudNetwork:
+                              account_mapping: Dict[str, List[str]], start_time: datetime,
+                              workers: Optional[int] = None) -> FraudNetwork:
         """Create a generic coordinated fraud network"""
-        network_customers = random.sample(customers, min(6, len(customers)))
+        network_customers = self._sample_customers(customers, min(6, len(customers)))
         
-        fraud_profiles = []
         fraud_types = [FraudType.VELOCITY_ATTACK, FraudType.LARGE_AMOUNT, FraudType.ACCOUNT_TAKEOVER]
         
-        for i, customer in enumerate(network_customers):
-            fraud_type = random.choice(fraud_types)
-            fraud_profile = self.generate_fraud_attack(
-                fraud_type=fraud_type,
-                target_customers=[customer],
-                account_mapping=account_mapping,
-                start_time=start_time + timedelta(minutes=i*30),  # Staggered attacks
-                intensity=1.2
-            )
-            fraud_profile.fraud_id = f"{network_id}_COORD_{i}"
-            fraud_profiles.append(fraud_profile)
+        id_prefix = f"{network_id}_COORD_"
+        members = [
+            (self._choice(fraud_types), id_prefix + str(i), {
+                "customers": [customer],
+                "account_mapping": account_mapping,
+                "start_time": start_time + timedelta(minutes=i*30),  # Staggered attacks
+                "intensity": 1.2
+            })
+            for i, customer in enumerate(network_customers)
+        ]
+        fraud_profiles = self._build_network_profiles(members, workers)
             
         return FraudNetwork(
             network_id=network_id,
@@ -936,23 +1381,57 @@ class FraudGenerator:
         
     def get_active_fraud_profiles(self, current_time: datetime) -> List[FraudProfile]:
         """Get all fraud profiles active at current time"""
-        active_profiles = []
+        if self._index_dirty:
+            self._sort_profile_index()
+            
+        # Individual fraud profiles: bound the candidates by start time, then mask on end time.
+        # Only profiles starting within the longest span before now can still be active.
+        now = _to_ns(current_time)
+        lo = int(np.searchsorted(self._starts_ns[:self._n_profiles], now - self._max_span_ns, side="left"))
+        hi = int(np.searchsorted(self._starts_ns[:self._n_profiles], now, side="right"))
+        active_profiles = self._profiles_arr[lo:hi][self._ends_ns[lo:hi] >= now].tolist()
         
-        # Individual fraud profiles
-        for profile in self._active_fraud_profiles:
-            if profile.start_time <= current_time <= profile.end_time:
-                active_profiles.append(profile)
-                
         # Network fraud profiles
         for network in self._fraud_networks:
             active_profiles.extend(network.get_active_profiles(current_time))
             
         return active_profiles
         
+    def release_transactions(self, transactions: List[PendingTransaction]):
+        """Return fully consumed fraud transactions to the reuse pool
+        
+        The caller must not keep any reference to them afterwards; their fields
+        are overwritten by later generate_fraud_transactions calls.
+        """
+        room = _PT_POOL_MAX - len(_pt_pool)
+        if room > 0:
+            _pt_pool.extend(transactions[:room])
+            
     def add_fraud_profile(self, fraud_profile: FraudProfile):
         """Add a fraud profile to active tracking"""
         self._active_fraud_profiles.append(fraud_profile)
         
+        n = self._n_profiles
+        if n == len(self._starts_ns):
+            self._starts_ns = np.resize(self._starts_ns, 2 * n)
+            self._ends_ns = np.resize(self._ends_ns, 2 * n)
+            self._profiles_arr = np.resize(self._profiles_arr, 2 * n)
+        self._starts_ns[n] = fraud_profile.start_ts
+        self._ends_ns[n] = fraud_profile.end_ts
+        self._profiles_arr[n] = fraud_profile
+        self._n_profiles = n + 1
+        self._max_span_ns = max(self._max_span_ns, fraud_profile.end_ts - fraud_profile.start_ts)
+        self._index_dirty = True
+        
+    def _sort_profile_index(self):
+        """Order the profile time index by start time"""
+        n = self._n_profiles
+        order = np.argsort(self._starts_ns[:n], kind="stable")
+        self._starts_ns[:n] = self._starts_ns[:n][order]
+        self._ends_ns[:n] = self._ends_ns[:n][order]
+        self._profiles_arr[:n] = self._profiles_arr[:n][order]
+        self._index_dirty = False
+        
     def add_fraud_network(self, fraud_network: FraudNetwork):
         """Add a fraud network to active tracking"""
         self._fraud_networks.append(fraud_network)
@@ -4,13 +4,20 @@ Generates realistic transaction patterns based on customer profiles,
 including regular payments, shopping patterns, and seasonal variations.
 """
 
-import random
+import copy
+import itertools
 import math
-from datetime import datetime, time, timedelta
-from typing import List, Dict, Optional, Tuple
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from datetime import date, datetime, time, tzinfo
+from typing import Callable, List, Dict, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from collections.abc import MutableMapping
+
+import numpy as np
 
 from .customers import CustomerProfile, IncomeLevel, BehaviorPattern, CustomerLifeStage
 
@@ -52,6 +59,55 @@ class TransactionChannel(Enum):
     ACH = "ach"
 
 
+# Code tables for int8 transaction type and channel columns
+_TXN_TYPE_TABLE = tuple(TransactionType)
+_TXN_TYPE_CODES = {t: code for code, t in enumerate(_TXN_TYPE_TABLE)}
+_CHANNEL_TABLE = tuple(TransactionChannel)
+_CHANNEL_CODES = {c: code for code, c in enumerate(_CHANNEL_TABLE)}
+
+# Transaction types that are incoming deposits to the customer's account
+_INCOMING_CODES = np.array([_TXN_TYPE_CODES[TransactionType.SALARY], _TXN_TYPE_CODES[TransactionType.DEPOSIT]], dtype=np.int8)
+
+# Rendered "_NNNN" merchant ID suffixes, indexed by the 4-digit suffix number
+_MERCHANT_SUFFIX_LO, _MERCHANT_SUFFIX_HI = 1000, 10000
+_MERCHANT_SUFFIXES = tuple(f"_{n}" for n in range(_MERCHANT_SUFFIX_LO, _MERCHANT_SUFFIX_HI))
+
+# Behavior pattern codes and their expected-volume multipliers (IRREGULAR is drawn per customer)
+_BEHAVIOR_TABLE = tuple(BehaviorPattern)
+_BEHAVIOR_CODES = {b: code for code, b in enumerate(_BEHAVIOR_TABLE)}
+_VOLUME_MULTIPLIER = np.array(
+    [{BehaviorPattern.SAVER: 0.7, BehaviorPattern.SPENDER: 1.3}.get(b, 1.0) for b in _BEHAVIOR_TABLE]
+)
+
+# Amount multiplier per income level
+_INCOME_MULTIPLIER = MappingProxyType({
+    IncomeLevel.LOW: 0.6,
+    IncomeLevel.MEDIUM: 1.0,
+    IncomeLevel.HIGH: 1.8,
+    IncomeLevel.ULTRA_HIGH: 3.0
+})
+
+# Transaction types savers keep at their full frequency
+_SAVER_ESSENTIALS = frozenset({TransactionType.SALARY, TransactionType.RENT_MORTGAGE, TransactionType.UTILITY_BILL})
+
+# Life stage -> transaction type -> (frequency, amount_min, amount_max) multipliers
+_LIFE_STAGE_ADJUSTMENTS = MappingProxyType({
+    # Students have less regular income, more irregular spending
+    CustomerLifeStage.STUDENT: MappingProxyType({
+        TransactionType.SALARY: (0.3, 0.4, 0.4),        # Part-time work
+        TransactionType.RESTAURANT: (1.5, 1.0, 1.0),    # Fast food
+        TransactionType.INVESTMENT: (0.1, 1.0, 1.0),    # Minimal investing
+    }),
+    # Retirees have fixed income, different spending patterns
+    CustomerLifeStage.RETIREE: MappingProxyType({
+        TransactionType.SALARY: (0.5, 0.6, 0.8),        # Pension/SS
+        TransactionType.SHOPPING: (0.7, 1.0, 1.0),
+        TransactionType.RESTAURANT: (0.8, 1.0, 1.0),
+        TransactionType.ONLINE_PURCHASE: (0.8, 1.0, 1.0),
+    }),
+})
+
+
 @dataclass
 class TransactionTemplate:
     """Template for generating transactions of a specific type"""
@@ -66,46 +122,251 @@ class TransactionTemplate:
     merchant_categories: Optional[List[str]] = None
     is_recurring: bool = False
     amount_distribution: str = "uniform"  # uniform, normal, log_normal
+
+
+# Amount distribution codes of the sampling kernel
+_UNIFORM, _NORMAL, _LOG_NORMAL = 0, 1, 2
+_DISTRIBUTION_CODES = MappingProxyType({"uniform": _UNIFORM, "normal": _NORMAL, "log_normal": _LOG_NORMAL})
+
+
+@dataclass(slots=True, frozen=True)
+class _TemplateArrays:
+    """Customer-independent template parameters flattened into parallel arrays"""
+    tx_types: Tuple[TransactionType, ...]
+    tx_codes: np.ndarray      # int8 code into _TXN_TYPE_TABLE
+    distribution: np.ndarray  # int8 code per template
+    second_lo: np.ndarray     # int64 first second of day in the preferred hours
+    second_hi: np.ndarray     # int64 end second of day of the preferred hours, exclusive
+    season: np.ndarray        # (templates, 13) multiplier by month, 1 where unset
+    day_weight: np.ndarray    # (templates, 32) relative rate by day of month
+    channels: np.ndarray      # (templates, max channels) int8 code into _CHANNEL_TABLE
+    n_channels: np.ndarray    # int64 preferred channel count
+    is_recurring: np.ndarray  # bool
+    
+    @classmethod
+    def from_templates(cls, templates: Dict[TransactionType, "TransactionTemplate"]) -> "_TemplateArrays":
+        """Flatten templates in dict order"""
+        count = len(templates)
+        season = np.ones((count, 13))
+        day_weight = np.ones((count, 32))
+        channels = np.zeros((count, max(len(t.preferred_channels) for t in templates.values())), dtype=np.int8)
+        for i, template in enumerate(templates.values()):
+            channels[i, :len(template.preferred_channels)] = [_CHANNEL_CODES[c] for c in template.preferred_channels]
+            for month, multiplier in template.seasonal_multiplier.items():
+                season[i, month] = multiplier
+            if template.day_of_month_preference and template.is_recurring:
+                # 90% strict about due dates: off-preference days keep a tenth of the rate
+                day_weight[i] = 0.1
+                day_weight[i, template.day_of_month_preference] = 1.0
+                
+        return cls(
+            tx_types=tuple(templates),
+            tx_codes=np.array([_TXN_TYPE_CODES[t] for t in templates], dtype=np.int8),
+            distribution=np.array([_DISTRIBUTION_CODES[t.amount_distribution] for t in templates.values()], dtype=np.int8),
+            second_lo=np.array([t.preferred_hours[0] * 3600 for t in templates.values()], dtype=np.int64),
+            second_hi=np.array([(t.preferred_hours[1] + 1) * 3600 for t in templates.values()], dtype=np.int64),
+            season=season,
+            day_weight=day_weight,
+            channels=channels,
+            n_channels=np.array([len(t.preferred_channels) for t in templates.values()], dtype=np.int64),
+            is_recurring=np.array([t.is_recurring for t in templates.values()], dtype=bool)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _MerchantArrays:
+    """Merchant database flattened for vectorized per-template merchant draws
     
-    def generate_amount(self) -> float:
-        """Generate transaction amount based on distribution"""
-        if self.amount_distribution == "normal":
-            # Normal distribution centered between min and max
-            mean = (self.amount_min + self.amount_max) / 2
-            std = (self.amount_max - self.amount_min) / 6  # 99.7% within range
-            amount = random.normalvariate(mean, std)
-            return max(self.amount_min, min(self.amount_max, amount))
-        elif self.amount_distribution == "log_normal":
-            # Log-normal distribution (more small amounts)
-            log_min = math.log(max(0.01, self.amount_min))
-            log_max = math.log(self.amount_max)
-            log_mean = (log_min + log_max) / 2
-            log_std = (log_max - log_min) / 6
-            log_amount = random.normalvariate(log_mean, log_std)
-            amount = math.exp(log_amount)
-            return max(self.amount_min, min(self.amount_max, amount))
-        else:  # uniform
-            return random.uniform(self.amount_min, self.amount_max)
+    A template draws one of its categories uniformly, then a merchant of that
+    category; categories without known merchants yield no merchant.
+    """
+    codes: np.ndarray          # object, merchant codes of every category back to back
+    category_names: Tuple[str, ...]
+    n_categories: np.ndarray   # (templates,) int64 merchant category count, 0 for none
+    category_idx: np.ndarray   # (templates, max categories) int8 into category_names, -1 without merchants
+    offset: np.ndarray         # (templates, max categories) int64 first index into codes
+    count: np.ndarray          # (templates, max categories) int64 merchants in the category
     
-    def should_generate(self, current_month: int, customer: CustomerProfile) -> bool:
-        """Determine if this transaction type should be generated now"""
-        # Apply seasonal multiplier
-        base_prob = self.frequency_per_month / 30  # Daily probability
-        seasonal_mult = self.seasonal_multiplier.get(current_month, 1.0)
-        adjusted_prob = base_prob * seasonal_mult
+    @classmethod
+    def from_templates(cls, templates: Dict[TransactionType, "TransactionTemplate"],
+                       merchants: Dict[str, List[Tuple[str, str]]]) -> "_MerchantArrays":
+        """Flatten the merchant database against templates in dict order"""
+        category_names = tuple(merchants)
+        offsets = np.cumsum([0] + [len(merchants[c]) for c in category_names])
+        width = max(len(t.merchant_categories or ()) for t in templates.values())
         
-        # Apply customer behavior modifiers
-        if customer.behavior_pattern == BehaviorPattern.SAVER:
-            adjusted_prob *= 0.7
-        elif customer.behavior_pattern == BehaviorPattern.SPENDER:
-            adjusted_prob *= 1.3
-        elif customer.behavior_pattern == BehaviorPattern.IRREGULAR:
-            adjusted_prob *= random.uniform(0.2, 2.0)
-            
-        return random.random() < adjusted_prob
+        category_idx = np.full((len(templates), width), -1, dtype=np.int8)
+        offset = np.zeros((len(templates), width), dtype=np.int64)
+        count = np.zeros((len(templates), width), dtype=np.int64)
+        for i, template in enumerate(templates.values()):
+            for j, category in enumerate(template.merchant_categories or ()):
+                if category in merchants:
+                    c = category_names.index(category)
+                    category_idx[i, j] = c
+                    offset[i, j] = offsets[c]
+                    count[i, j] = len(merchants[category])
+                    
+        return cls(
+            codes=np.array([code for c in category_names for _, code in merchants[c]], dtype=object),
+            category_names=category_names,
+            n_categories=np.array([len(t.merchant_categories or ()) for t in templates.values()], dtype=np.int64),
+            category_idx=category_idx,
+            offset=offset,
+            count=count
+        )
 
 
-@dataclass
+def _sample_events(rate: np.ndarray, weight: np.ndarray, amount_min: np.ndarray, amount_max: np.ndarray,
+                   arrays: _TemplateArrays, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Numeric sampling kernel over a window of days
+    
+    rate is the daily rate per template, or per template and day, and weight the
+    calendar weight per template and day. Each (template, day) cell draws a
+    Poisson count; events then get a time within the template's
+    preferred hours and an amount from its distribution. Returns template indices,
+    int64 second offsets from midnight of the first day and float64 amounts.
+    """
+    # Expected events per (template, day), then every cell's count in one draw
+    counts = rng.poisson(rate * weight)
+    cells = np.repeat(np.arange(counts.size), counts.ravel())
+    template_idx, day_idx = np.divmod(cells, counts.shape[1])
+    n = cells.size
+    
+    # Time of day: a uniform second within the preferred hours
+    offsets = day_idx * 86400 + rng.integers(arrays.second_lo[template_idx], arrays.second_hi[template_idx])
+    
+    # Amounts; normal and log-normal are centered between the bounds with 99.7% inside
+    lo, hi = amount_min[template_idx], amount_max[template_idx]
+    code = arrays.distribution[template_idx]
+    amounts = np.empty(n)
+    
+    normal = code == _NORMAL
+    normal_lo, normal_hi = lo[normal], hi[normal]
+    amounts[normal] = (normal_lo + normal_hi) / 2 + (normal_hi - normal_lo) / 6 * rng.standard_normal(normal_lo.size)
+    
+    log_normal = code == _LOG_NORMAL
+    log_lo, log_hi = np.log(np.maximum(lo[log_normal], 0.01)), np.log(hi[log_normal])
+    amounts[log_normal] = rng.lognormal((log_lo + log_hi) / 2, (log_hi - log_lo) / 6)
+    
+    uniform = code == _UNIFORM
+    amounts[uniform] = rng.uniform(lo[uniform], hi[uniform])
+    
+    np.clip(amounts, lo, hi, out=amounts)
+    
+    return template_idx, offsets, amounts
+
+
+def _to_cents(amounts: np.ndarray) -> np.ndarray:
+    """Round float dollar amounts to exact int64 cents"""
+    return np.rint(amounts * 100).astype(np.int64)
+
+
+@lru_cache(maxsize=32)
+def _window_calendar(first_day: date, n_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Month and day of month of each day in a window, as int64 arrays
+    
+    Cached since every customer of a simulation tick shares the same window.
+    Preferred days of month are matched through _TemplateArrays.day_weight.
+    """
+    days = np.datetime64(first_day, "D") + np.arange(n_days)
+    months = (days.astype("datetime64[M]").astype(np.int64) % 12) + 1
+    days_of_month = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+    months.flags.writeable = False
+    days_of_month.flags.writeable = False
+    return months, days_of_month
+
+
+def _utc_offsets(wall: np.ndarray, tz: Optional[tzinfo]) -> np.ndarray:
+    """UTC offset in seconds of each wall-clock datetime64 in tz (local time when None)"""
+    wall_s = wall.astype("datetime64[s]")
+    posix = [int(dt.replace(tzinfo=tz).timestamp()) for dt in wall_s.tolist()]
+    return wall_s.astype(np.int64) - np.array(posix, dtype=np.int64)
+
+
+def _posix_seconds(wall: np.ndarray, tz: Optional[tzinfo]) -> np.ndarray:
+    """int(datetime.timestamp()) of each wall-clock datetime64[us] in tz, without per-row calls
+    
+    The UTC offset is looked up once per midnight in the window; only a window
+    that crosses a DST change falls back to one lookup per distinct minute.
+    """
+    wall_s = wall.astype("datetime64[s]").astype(np.int64)
+    if wall.size == 0:
+        return wall_s
+        
+    days = wall.astype("datetime64[D]")
+    offsets = _utc_offsets(np.arange(days.min(), days.max() + 2), tz)
+    if (offsets == offsets[0]).all():
+        return wall_s - offsets[0]
+        
+    minutes, inverse = np.unique(wall.astype("datetime64[m]"), return_inverse=True)
+    return wall_s - _utc_offsets(minutes, tz)[inverse]
+
+
+def _offset_timestamps(start_time: datetime, offsets_s: np.ndarray) -> List[datetime]:
+    """Materialize start_time + integer-second offsets with one vectorized add"""
+    base = np.datetime64(start_time.replace(tzinfo=None), "us")
+    timestamps = (base + offsets_s.astype("timedelta64[s]")).tolist()
+    if start_time.tzinfo is not None:
+        timestamps = [ts.replace(tzinfo=start_time.tzinfo) for ts in timestamps]
+    return timestamps
+
+
+class _MetaView(MutableMapping):
+    """Transaction metadata as a shared per-batch template plus the row's own fields
+    
+    Rows only allocate their varying fields; writes land in the row's own dict so
+    the template is never mutated. Deep copies (dataclasses.asdict) produce a plain
+    dict, so serialized payloads are unchanged.
+    """
+    __slots__ = ("_tpl", "_extra")
+    
+    def __init__(self, tpl: Dict[str, any], extra: Optional[Dict[str, any]] = None):
+        self._tpl = tpl
+        self._extra = extra
+        
+    def __getitem__(self, key):
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        return self._tpl[key]
+        
+    def __setitem__(self, key, value):
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+        
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in self._tpl:
+            # Detach from the shared template before removing one of its keys
+            self._tpl, self._extra = {}, dict(self)
+        del self._extra[key]
+        
+    def __iter__(self):
+        extra = self._extra
+        if not extra:
+            yield from self._tpl
+            return
+        for key in self._tpl:
+            if key not in extra:
+                yield key
+        yield from extra
+        
+    def __len__(self) -> int:
+        extra = self._extra
+        if not extra:
+            return len(self._tpl)
+        return len(self._tpl) + sum(1 for key in extra if key not in self._tpl)
+        
+    def __deepcopy__(self, memo) -> Dict[str, any]:
+        return copy.deepcopy(dict(self), memo)
+        
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(slots=True)
 class PendingTransaction:
     """A transaction ready to be submitted"""
     transaction_type: TransactionType
@@ -120,6 +381,127 @@ class PendingTransaction:
     reference: Optional[str]
     timestamp: datetime
     metadata: Dict[str, any]
+    
+    def reset(self, transaction_type: TransactionType, amount: float, currency: str, description: str,
+              channel: TransactionChannel, from_account_id: Optional[str], to_account_id: Optional[str],
+              merchant_id: Optional[str], merchant_category: Optional[str], reference: Optional[str],
+              timestamp: datetime, metadata: Dict[str, any]) -> "PendingTransaction":
+        """Reassign every field in place so a released instance can be reused"""
+        self.transaction_type = transaction_type
+        self.amount = amount
+        self.currency = currency
+        self.description = description
+        self.channel = channel
+        self.from_account_id = from_account_id
+        self.to_account_id = to_account_id
+        self.merchant_id = merchant_id
+        self.merchant_category = merchant_category
+        self.reference = reference
+        self.timestamp = timestamp
+        self.metadata = metadata
+        return self
+
+
+@dataclass(slots=True)
+class PendingTransactionBatch:
+    """Column-oriented transactions of one customer, materialized as objects on demand"""
+    customer: CustomerProfile
+    account_ids: List[str]
+    tx_type: np.ndarray            # int8 code into _TXN_TYPE_TABLE
+    amount_cents: np.ndarray       # int64, exact money amounts in cents
+    channel: np.ndarray            # int8 code into _CHANNEL_TABLE
+    timestamp: np.ndarray          # datetime64[us] wall-clock time
+    epoch_s: np.ndarray            # int64 POSIX seconds of timestamp
+    from_account_idx: np.ndarray   # int32 index into account_ids, -1 when external
+    to_account_idx: np.ndarray     # int32 index into account_ids, -1 when external
+    merchant_idx: np.ndarray       # int32 index into merchants.codes, -1 without a merchant
+    merchant_suffix: np.ndarray    # int64 index into _MERCHANT_SUFFIXES
+    merchant_cat_idx: np.ndarray   # int8 index into merchants.category_names, -1 without a merchant
+    merchants: _MerchantArrays = field(repr=False)
+    reference_nonce: np.ndarray    # int64
+    is_recurring: np.ndarray       # bool
+    describe: Callable[[TransactionType, Optional[str], float], str] = field(repr=False)
+    tzinfo: Optional[tzinfo] = None
+    
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+        
+    def to_pending_list(self) -> List[PendingTransaction]:
+        """Materialize one PendingTransaction per row"""
+        customer, describe = self.customer, self.describe
+        accounts = self.account_ids + [None]  # Index -1 is an external account
+        timestamps = self.timestamp.tolist()
+        if self.tzinfo is not None:
+            timestamps = [ts.replace(tzinfo=self.tzinfo) for ts in timestamps]
+            
+        # Merchant IDs are the merchant code plus a numeric suffix
+        codes, category_names = self.merchants.codes.tolist(), self.merchants.category_names
+        merchant_ids = [
+            codes[m] + _MERCHANT_SUFFIXES[suffix] if m >= 0 else None
+            for m, suffix in zip(self.merchant_idx.tolist(), self.merchant_suffix.tolist())
+        ]
+        merchant_categories = [category_names[c] if c >= 0 else None for c in self.merchant_cat_idx.tolist()]
+        references = [
+            f"REF_{epoch}_{nonce}" for epoch, nonce in zip(self.epoch_s.tolist(), self.reference_nonce.tolist())
+        ]
+        
+        # Customer-level metadata is shared by every row; hour and weekday come from the columns
+        shared = {
+            "customer_risk_score": customer.risk_score,
+            "customer_life_stage": customer.life_stage.value,
+            "customer_income_level": customer.income_level.value,
+            "customer_location": f"{customer.city}, {customer.state}, {customer.country}",
+            "primary_channel": customer.primary_channel
+        }
+        days = self.timestamp.astype("datetime64[D]")
+        hours = (self.timestamp.astype("datetime64[h]") - days).astype(np.int64).tolist()
+        weekends = ((days.astype(np.int64) + 3) % 7 >= 5).tolist()  # 1970-01-01 was a Thursday
+        
+        transactions: List[Optional[PendingTransaction]] = [None] * len(self)
+        for i, (code, amount, channel, timestamp, from_idx, to_idx, merchant_id, category, reference,
+                hour, weekend, recurring) in enumerate(zip(
+            self.tx_type.tolist(), (self.amount_cents / 100).tolist(), self.channel.tolist(), timestamps,
+            self.from_account_idx.tolist(), self.to_account_idx.tolist(),
+            merchant_ids, merchant_categories, references,
+            hours, weekends, self.is_recurring.tolist()
+        )):
+            tx_type = _TXN_TYPE_TABLE[code]
+            
+            # Metadata for fraud detection
+            metadata = _MetaView(shared, {"transaction_hour": hour, "is_weekend": weekend, "is_recurring": recurring})
+            
+            transactions[i] = PendingTransaction(
+                transaction_type=tx_type,
+                amount=amount,
+                currency="USD",
+                description=describe(tx_type, merchant_id, amount),
+                channel=_CHANNEL_TABLE[channel],
+                from_account_id=accounts[from_idx],
+                to_account_id=accounts[to_idx],
+                merchant_id=merchant_id,
+                merchant_category=category,
+                reference=reference,
+                timestamp=timestamp,
+                metadata=metadata
+            )
+            
+        return transactions
+
+
+# Per-process generator copy used by generate_all workers
+_worker_generator: Optional["TransactionGenerator"] = None
+
+
+def _init_transaction_worker(generator: "TransactionGenerator"):
+    """Process pool initializer: keep one generator copy per worker"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_customer_transactions(customer: CustomerProfile, account_ids: List[str], simulation_start: datetime,
+                                    duration_hours: int, seed: np.random.SeedSequence) -> List[PendingTransaction]:
+    """Worker entry point: generate one customer's transactions from its own seed"""
+    return _worker_generator._generate_seeded(customer, account_ids, simulation_start, duration_hours, seed)
 
 
 class TransactionGenerator:
@@ -128,9 +510,18 @@ class TransactionGenerator:
     def __init__(self, seed: Optional[int] = None):
         if seed is not None:
             random.seed(seed)
+        self._rng = np.random.default_rng(seed)
+        self._seed_seq = np.random.SeedSequence(seed)  # Spawns per-customer streams for generate_all
             
         self._initialize_templates()
+        self._template_arrays = _TemplateArrays.from_templates(self.templates)
+        self._adjusted_cache: Dict[tuple, tuple] = {}
+        self._weight_key: Optional[Tuple[date, int]] = None
+        self._weight: Optional[np.ndarray] = None
+        self._base_total_frequency = sum(t.frequency_per_month for t in self.templates.values())
         self._initialize_merchants()
+        self._merchant_arrays = _MerchantArrays.from_templates(self.templates, self.merchants)
+        self._initialize_descriptions()
         
     def _initialize_templates(self):
         """Initialize transaction templates for different types"""
@@ -371,247 +762,277 @@ class TransactionGenerator:
     def generate_transactions_for_customer(self, customer: CustomerProfile, account_ids: List[str], 
                                          simulation_start: datetime, duration_hours: int) -> List[PendingTransaction]:
         """Generate realistic transactions for a customer over the simulation period"""
-        transactions = []
-        current_time = simulation_start
-        end_time = simulation_start + timedelta(hours=duration_hours)
+        return self.generate_transaction_batch(customer, account_ids, simulation_start, duration_hours).to_pending_list()
         
-        # Adjust transaction templates based on customer profile
-        adjusted_templates = self._adjust_templates_for_customer(customer)
+    def generate_all(self, customers: List[CustomerProfile], customer_accounts: Dict[str, List[str]],
+                     simulation_start: datetime, duration_hours: int,
+                     workers: Optional[int] = None) -> List[PendingTransaction]:
+        """Generate transactions for many customers, in worker processes when workers > 1
+        
+        Each customer draws from its own SeedSequence child, so output does not
+        depend on the number of workers.
+        """
+        seeds = self._seed_seq.spawn(len(customers))
+        accounts = [customer_accounts.get(customer.customer_id, []) for customer in customers]
+        repeat = itertools.repeat
         
-        # Generate transactions day by day
-        while current_time < end_time:
-            daily_transactions = self._generate_daily_transactions(
-                customer, account_ids, current_time, adjusted_templates
+        if not workers or workers <= 1:
+            results = map(
+                self._generate_seeded, customers, accounts, repeat(simulation_start), repeat(duration_hours), seeds
             )
-            transactions.extend(daily_transactions)
-            current_time += timedelta(days=1)
+            return list(itertools.chain.from_iterable(results))
             
-        return transactions
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_transaction_worker, initargs=(self,)) as executor:
+            results = executor.map(
+                _generate_customer_transactions, customers, accounts,
+                repeat(simulation_start), repeat(duration_hours), seeds, chunksize=16
+            )
+            return list(itertools.chain.from_iterable(results))
+            
+    def _generate_seeded(self, customer: CustomerProfile, account_ids: List[str], simulation_start: datetime,
+                         duration_hours: int, seed: np.random.SeedSequence) -> List[PendingTransaction]:
+        """Generate a customer's transactions drawing from a generator built from seed"""
+        if not account_ids:
+            return []
+            
+        shared_rng, self._rng = self._rng, np.random.default_rng(seed)
+        try:
+            return self.generate_transactions_for_customer(customer, account_ids, simulation_start, duration_hours)
+        finally:
+            self._rng = shared_rng
+            
+    def generate_transaction_batch(self, customer: CustomerProfile, account_ids: List[str],
+                                   simulation_start: datetime, duration_hours: int) -> PendingTransactionBatch:
+        """Generate a customer's transactions over the simulation period as columns"""
+        rng = self._rng
+        arrays = self._template_arrays
+        
+        # Midnight of each day in the window (microseconds kept from the start time)
+        midnight = simulation_start.replace(hour=0, minute=0, second=0)
+        weight = self._window_weight(midnight.date(), math.ceil(max(duration_hours, 0) / 24))
+        
+        # Adjust transaction templates based on customer profile
+        _, amount_min, amount_max, rate = self._customer_template_arrays(customer)
+        
+        # Irregular customers get a frequency jitter per template and a rate jitter per template and day
+        if customer.behavior_pattern == BehaviorPattern.IRREGULAR:
+            rate = rate * rng.uniform(0.5, 1.8, (len(rate), 1)) * rng.uniform(0.2, 2.0, weight.shape)
+            
+        template_idx, offsets, amounts = _sample_events(rate, weight, amount_min, amount_max, arrays, rng)
+        
+        order = np.argsort(offsets, kind="stable")
+        template_idx, offsets, amounts = template_idx[order], offsets[order], amounts[order]
+        n = template_idx.size
+        
+        tx_codes = arrays.tx_codes[template_idx]
+        channel = arrays.channels[template_idx, rng.integers(0, arrays.n_channels[template_idx])]
+        from_idx, to_idx = self._assign_accounts(tx_codes, len(account_ids))
+        merchant_idx, merchant_cat_idx = self._pick_merchants(template_idx)
+        timestamps = np.datetime64(midnight.replace(tzinfo=None), "us") + offsets.astype("timedelta64[s]")
+        
+        return PendingTransactionBatch(
+            customer=customer,
+            account_ids=account_ids,
+            tx_type=tx_codes,
+            amount_cents=_to_cents(amounts),
+            channel=channel,
+            timestamp=timestamps,
+            epoch_s=_posix_seconds(timestamps, simulation_start.tzinfo),
+            from_account_idx=from_idx,
+            to_account_idx=to_idx,
+            merchant_idx=merchant_idx,
+            merchant_suffix=rng.integers(_MERCHANT_SUFFIX_LO, _MERCHANT_SUFFIX_HI, n) - _MERCHANT_SUFFIX_LO,
+            merchant_cat_idx=merchant_cat_idx,
+            merchants=self._merchant_arrays,
+            reference_nonce=rng.integers(1000, 10000, n),
+            is_recurring=arrays.is_recurring[template_idx],
+            describe=self._generate_description,
+            tzinfo=simulation_start.tzinfo
+        )
+        
+    def _assign_accounts(self, tx_codes: np.ndarray, n_accounts: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick from/to account indices per row; -1 marks an external account"""
+        rng = self._rng
+        n = tx_codes.size
+        if n == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+            
+        # Select account (prefer primary checking/savings for most transactions)
+        from_idx = rng.integers(0, n_accounts, n).astype(np.int32)
+        to_idx = np.full(n, -1, dtype=np.int32)
+        
+        # P2P could be incoming (40%) or outgoing; 30% of outgoing go to another own account
+        p2p = tx_codes == _TXN_TYPE_CODES[TransactionType.P2P_TRANSFER]
+        p2p_incoming = p2p & (rng.random(n) < 0.4)
+        p2p_internal = p2p & ~p2p_incoming & (rng.random(n) < 0.3)
+        
+        # Incoming money - this is a deposit
+        incoming = np.isin(tx_codes, _INCOMING_CODES) | p2p_incoming
+        
+        # Internal transfers go to a different account, if the customer has one
+        if n_accounts > 1:
+            internal = (tx_codes == _TXN_TYPE_CODES[TransactionType.TRANSFER]) | p2p_internal
+            other = (from_idx + rng.integers(1, n_accounts, n)) % n_accounts
+            to_idx[internal] = other[internal]
+            
+        to_idx[incoming] = from_idx[incoming]
+        from_idx[incoming] = -1
+        return from_idx, to_idx
+        
+    def _pick_merchants(self, template_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw merchant and merchant category indices per row; -1 where there is none"""
+        rng = self._rng
+        merchants = self._merchant_arrays
+        
+        # One category per row, uniformly among the template's categories
+        n_categories = merchants.n_categories[template_idx]
+        column = rng.integers(0, np.maximum(n_categories, 1))
+        category_idx = np.where(n_categories > 0, merchants.category_idx[template_idx, column], -1).astype(np.int8)
+        
+        # Then one merchant of that category
+        count = merchants.count[template_idx, column]
+        merchant_idx = merchants.offset[template_idx, column] + rng.integers(0, np.maximum(count, 1))
+        merchant_idx = np.where(category_idx >= 0, merchant_idx, -1).astype(np.int32)
+        return merchant_idx, category_idx
         
     def _adjust_templates_for_customer(self, customer: CustomerProfile) -> Dict[TransactionType, TransactionTemplate]:
         """Adjust transaction templates based on customer profile"""
-        adjusted = {}
+        return self._customer_template_arrays(customer)[0]
         
-        for tx_type, template in self.templates.items():
-            # Create a copy of the template
-            new_template = TransactionTemplate(
-                transaction_type=template.transaction_type,
-                amount_min=template.amount_min,
-                amount_max=template.amount_max,
-                frequency_per_month=template.frequency_per_month,
-                preferred_channels=template.preferred_channels.copy(),
-                preferred_hours=template.preferred_hours,
-                seasonal_multiplier=template.seasonal_multiplier.copy(),
-                day_of_month_preference=template.day_of_month_preference,
-                merchant_categories=template.merchant_categories,
-                is_recurring=template.is_recurring,
-                amount_distribution=template.amount_distribution
-            )
+    def _window_weight(self, first_day: date, n_days: int) -> np.ndarray:
+        """Seasonal times day-of-month rate weight per (template, window day)
+        
+        The last window's table is kept, since every customer of a simulation tick
+        shares it.
+        """
+        key = (first_day, n_days)
+        if self._weight_key != key:
+            months, days_of_month = _window_calendar(first_day, n_days)
+            arrays = self._template_arrays
+            self._weight = arrays.season[:, months] * arrays.day_weight[:, days_of_month]
+            self._weight_key = key
+        return self._weight
+        
+    def _customer_template_arrays(self, customer: CustomerProfile):
+        """Adjusted templates with their amount bounds and daily rates as arrays
+        
+        Memoized on the profile fields the adjustment reads; the IRREGULAR jitter is
+        applied per customer at sampling time instead.
+        """
+        key = (customer.income_level, customer.behavior_pattern, customer.life_stage, customer.international_activity)
+        cached = self._adjusted_cache.get(key)
+        if cached is None:
+            adjusted = self._build_adjusted_templates(*key)
+            templates = adjusted.values()
             
-            # Adjust amounts based on income level
-            income_multiplier = {
-                IncomeLevel.LOW: 0.6,
-                IncomeLevel.MEDIUM: 1.0,
-                IncomeLevel.HIGH: 1.8,
-                IncomeLevel.ULTRA_HIGH: 3.0
-            }[customer.income_level]
+            # Daily rate with the customer behavior modifier folded in
+            rate = np.array([t.frequency_per_month / 30 for t in templates])[:, None]
+            rate *= _VOLUME_MULTIPLIER[_BEHAVIOR_CODES[key[1]]]
             
-            new_template.amount_min *= income_multiplier
-            new_template.amount_max *= income_multiplier
+            cached = self._adjusted_cache[key] = (
+                adjusted,
+                np.array([t.amount_min for t in templates]),
+                np.array([t.amount_max for t in templates]),
+                rate
+            )
+        return cached
+        
+    def _build_adjusted_templates(self, income_level: IncomeLevel, behavior: BehaviorPattern,
+                                  life_stage: CustomerLifeStage,
+                                  international_activity: bool) -> Dict[TransactionType, TransactionTemplate]:
+        """Adjust transaction templates for a customer profile
+        
+        Only the amount bounds and frequency change; the adjusted templates share
+        channels, hours and seasonal tables with the base templates.
+        """
+        adjusted = {}
+        
+        # Adjust amounts based on income level
+        income_multiplier = _INCOME_MULTIPLIER[income_level]
+        life_stage_adjustments = _LIFE_STAGE_ADJUSTMENTS.get(life_stage, {})
+        international_multiplier = 3.0 if international_activity else 0.1
+        
+        for tx_type, template in self.templates.items():
+            frequency_multiplier = 1.0
+            min_multiplier = max_multiplier = income_multiplier
             
             # Adjust frequency based on behavior pattern
-            if customer.behavior_pattern == BehaviorPattern.SAVER:
-                if tx_type not in [TransactionType.SALARY, TransactionType.RENT_MORTGAGE, TransactionType.UTILITY_BILL]:
-                    new_template.frequency_per_month *= 0.7
-            elif customer.behavior_pattern == BehaviorPattern.SPENDER:
-                if tx_type not in [TransactionType.SALARY]:
-                    new_template.frequency_per_month *= 1.3
-            elif customer.behavior_pattern == BehaviorPattern.IRREGULAR:
-                new_template.frequency_per_month *= random.uniform(0.5, 1.8)
-                
+            if behavior == BehaviorPattern.SAVER:
+                if tx_type not in _SAVER_ESSENTIALS:
+                    frequency_multiplier *= 0.7
+            elif behavior == BehaviorPattern.SPENDER:
+                if tx_type != TransactionType.SALARY:
+                    frequency_multiplier *= 1.3
             # Life stage specific adjustments
-            if customer.life_stage == CustomerLifeStage.STUDENT:
-                # Students have less regular income, more irregular spending
-                if tx_type == TransactionType.SALARY:
-                    new_template.frequency_per_month *= 0.3  # Part-time work
-                    new_template.amount_min *= 0.4
-                    new_template.amount_max *= 0.4
-                elif tx_type == TransactionType.RESTAURANT:
-                    new_template.frequency_per_month *= 1.5  # Fast food
-                elif tx_type == TransactionType.INVESTMENT:
-                    new_template.frequency_per_month *= 0.1  # Minimal investing
-                    
-            elif customer.life_stage == CustomerLifeStage.RETIREE:
-                # Retirees have fixed income, different spending patterns
-                if tx_type == TransactionType.SALARY:
-                    new_template.frequency_per_month *= 0.5  # Pension/SS
-                    new_template.amount_min *= 0.6
-                    new_template.amount_max *= 0.8
-                elif tx_type == TransactionType.SHOPPING:
-                    new_template.frequency_per_month *= 0.7
-                elif tx_type in [TransactionType.RESTAURANT, TransactionType.ONLINE_PURCHASE]:
-                    new_template.frequency_per_month *= 0.8
-                    
+            stage_adjustment = life_stage_adjustments.get(tx_type)
+            if stage_adjustment is not None:
+                frequency_multiplier *= stage_adjustment[0]
+                min_multiplier *= stage_adjustment[1]
+                max_multiplier *= stage_adjustment[2]
+                
             # International activity
-            if not customer.international_activity:
-                if tx_type == TransactionType.INTERNATIONAL:
-                    new_template.frequency_per_month *= 0.1
-            else:
-                if tx_type == TransactionType.INTERNATIONAL:
-                    new_template.frequency_per_month *= 3.0
-                    
+            if tx_type == TransactionType.INTERNATIONAL:
+                frequency_multiplier *= international_multiplier
+                
             # Skip certain transaction types for some customers
-            if tx_type == TransactionType.INVESTMENT and customer.income_level == IncomeLevel.LOW:
-                new_template.frequency_per_month *= 0.2
+            if tx_type == TransactionType.INVESTMENT and income_level == IncomeLevel.LOW:
+                frequency_multiplier *= 0.2
                 
-            adjusted[tx_type] = new_template
+            adjusted[tx_type] = replace(
+                template,
+                amount_min=template.amount_min * min_multiplier,
+                amount_max=template.amount_max * max_multiplier,
+                frequency_per_month=template.frequency_per_month * frequency_multiplier
+            )
             
         return adjusted
         
-    def _generate_daily_transactions(self, customer: CustomerProfile, account_ids: List[str], 
-                                   day: datetime, templates: Dict[TransactionType, TransactionTemplate]) -> List[PendingTransaction]:
-        """Generate transactions for a single day"""
-        transactions = []
-        
-        for tx_type, template in templates.items():
-            if template.should_generate(day.month, customer):
-                # Skip if wrong day of month for recurring transactions
-                if template.day_of_month_preference and day.day not in template.day_of_month_preference:
-                    if template.is_recurring and random.random() < 0.9:  # 90% strict about due dates
-                        continue
-                        
-                # Generate transaction time
-                start_hour, end_hour = template.preferred_hours
-                hour = random.randint(start_hour, end_hour)
-                minute = random.randint(0, 59)
-                tx_time = day.replace(hour=hour, minute=minute, second=random.randint(0, 59))
-                
-                # Generate transaction
-                transaction = self._create_transaction(
-                    customer, account_ids, tx_type, template, tx_time
-                )
-                
-                transactions.append(transaction)
-                
-        return transactions
-        
-    def _create_transaction(self, customer: CustomerProfile, account_ids: List[str],
-                          tx_type: TransactionType, template: TransactionTemplate, 
-                          timestamp: datetime) -> PendingTransaction:
-        """Create a single transaction"""
-        amount = template.generate_amount()
-        channel = random.choice(template.preferred_channels)
-        
-        # Select account (prefer primary checking/savings for most transactions)
-        from_account = random.choice(account_ids)
-        to_account = None
-        
-        # Determine transaction direction and accounts
-        if tx_type in [TransactionType.SALARY, TransactionType.DEPOSIT]:
-            # Incoming money - this is a deposit
-            to_account = from_account
-            from_account = None
-        elif tx_type == TransactionType.P2P_TRANSFER:
-            # Could be incoming or outgoing
-            if random.random() < 0.4:  # 40% incoming
-                to_account = from_account
-                from_account = None
-            else:  # 60% outgoing - select different account or external
-                if len(account_ids) > 1 and random.random() < 0.3:
-                    to_account = random.choice([aid for aid in account_ids if aid != from_account])
-                else:
-                    to_account = None  # External P2P
-        elif tx_type == TransactionType.TRANSFER:
-            # Internal transfer between accounts
-            if len(account_ids) > 1:
-                to_account = random.choice([aid for aid in account_ids if aid != from_account])
-            else:
-                # Convert to withdrawal if only one account
-                to_account = None
-                
-        # Generate merchant information
-        merchant_id = None
-        merchant_category = None
-        if template.merchant_categories:
-            category = random.choice(template.merchant_categories)
-            if category in self.merchants:
-                merchant_name, merchant_code = random.choice(self.merchants[category])
-                merchant_id = f"{merchant_code}_{random.randint(1000, 9999)}"
-                merchant_category = category
-                
-        # Generate description
-        description = self._generate_description(tx_type, merchant_id, amount)
-        
-        # Generate reference
-        reference = f"REF_{int(timestamp.timestamp())}_{random.randint(1000, 9999)}"
-        
-        # Metadata for fraud detection
-        metadata = {
-            "customer_risk_score": customer.risk_score,
-            "customer_life_stage": customer.life_stage.value,
-            "customer_income_level": customer.income_level.value,
-            "transaction_hour": timestamp.hour,
-            "is_weekend": timestamp.weekday() >= 5,
-            "is_recurring": template.is_recurring,
-            "customer_location": f"{customer.city}, {customer.state}, {customer.country}",
-            "primary_channel": customer.primary_channel
-        }
-        
-        return PendingTransaction(
-            transaction_type=tx_type,
-            amount=round(amount, 2),
-            currency="USD",
-            description=description,
-            channel=channel,
-            from_account_id=from_account,
-            to_account_id=to_account,
-            merchant_id=merchant_id,
-            merchant_category=merchant_category,
-            reference=reference,
-            timestamp=timestamp,
-            metadata=metadata
-        )
+    def _initialize_descriptions(self):
+        """Precompute description format strings per transaction type"""
+        self._pretty_name = {t: t.value.replace('_', ' ').title() for t in TransactionType}
+        self._desc_templates = {t: f"{name} - ${{:.2f}}" for t, name in self._pretty_name.items()}
+        self._desc_templates.update({
+            TransactionType.SALARY: "Salary Deposit - Direct Deposit",
+            TransactionType.RENT_MORTGAGE: "Rent/Mortgage Payment - ${:.2f}",
+            TransactionType.UTILITY_BILL: "Utility Payment - ${:.2f}",
+            TransactionType.ATM_WITHDRAWAL: "ATM Withdrawal - ${:.2f}",
+            TransactionType.P2P_TRANSFER: "P2P Transfer - ${:.2f}",
+            TransactionType.INVESTMENT: "Investment Transfer - ${:.2f}",
+            TransactionType.CREDIT_PAYMENT: "Credit Card Payment - ${:.2f}",
+            TransactionType.LOAN_PAYMENT: "Loan Payment - ${:.2f}",
+            TransactionType.SUBSCRIPTION: "Subscription Service - ${:.2f}",
+            TransactionType.INTERNATIONAL: "International Transaction - ${:.2f}"
+        })
         
     def _generate_description(self, tx_type: TransactionType, merchant_id: Optional[str], amount: float) -> str:
         """Generate human-readable transaction description"""
         if merchant_id:
             merchant_name = merchant_id.split('_')[0]
-            return f"{merchant_name} - {tx_type.value.replace('_', ' ').title()}"
-        
-        descriptions = {
-            TransactionType.SALARY: "Salary Deposit - Direct Deposit",
-            TransactionType.RENT_MORTGAGE: f"Rent/Mortgage Payment - ${amount:.2f}",
-            TransactionType.UTILITY_BILL: f"Utility Payment - ${amount:.2f}",
-            TransactionType.ATM_WITHDRAWAL: f"ATM Withdrawal - ${amount:.2f}",
-            TransactionType.P2P_TRANSFER: f"P2P Transfer - ${amount:.2f}",
-            TransactionType.INVESTMENT: f"Investment Transfer - ${amount:.2f}",
-            TransactionType.CREDIT_PAYMENT: f"Credit Card Payment - ${amount:.2f}",
-            TransactionType.LOAN_PAYMENT: f"Loan Payment - ${amount:.2f}",
-            TransactionType.SUBSCRIPTION: f"Subscription Service - ${amount:.2f}",
-            TransactionType.INTERNATIONAL: f"International Transaction - ${amount:.2f}"
-        }
-        
-        return descriptions.get(tx_type, f"{tx_type.value.replace('_', ' ').title()} - ${amount:.2f}")
+            return f"{merchant_name} - {self._pretty_name[tx_type]}"
+            
+        return self._desc_templates[tx_type].format(amount)
         
     def get_expected_daily_volume(self, customer: CustomerProfile) -> float:
         """Get expected daily transaction volume for a customer"""
-        total_frequency = 0
-        for template in self.templates.values():
-            total_frequency += template.frequency_per_month
+        total_frequency = self._base_total_frequency
             
         # Adjust for customer behavior
-        if customer.behavior_pattern == BehaviorPattern.SAVER:
-            total_frequency *= 0.7
-        elif customer.behavior_pattern == BehaviorPattern.SPENDER:
-            total_frequency *= 1.3
-        elif customer.behavior_pattern == BehaviorPattern.IRREGULAR:
-            total_frequency *= random.uniform(0.5, 1.8)
+        if customer.behavior_pattern == BehaviorPattern.IRREGULAR:
+            total_frequency *= self._rng.uniform(0.5, 1.8)
+        else:
+            total_frequency *= _VOLUME_MULTIPLIER[_BEHAVIOR_CODES[customer.behavior_pattern]]
             
         return total_frequency / 30  # Convert to daily
         
     def estimate_simulation_volume(self, customers: List[CustomerProfile], duration_hours: int) -> Dict[str, int]:
         """Estimate total transaction volume for simulation planning"""
-        total_daily_volume = sum(self.get_expected_daily_volume(customer) for customer in customers)
+        # Behavior multiplier per customer; irregular customers draw theirs in one call
+        codes = np.fromiter((_BEHAVIOR_CODES[c.behavior_pattern] for c in customers), dtype=np.int8, count=len(customers))
+        multipliers = _VOLUME_MULTIPLIER[codes]
+        irregular = codes == _BEHAVIOR_CODES[BehaviorPattern.IRREGULAR]
+        multipliers[irregular] = self._rng.uniform(0.5, 1.8, int(irregular.sum()))
+        
+        total_daily_volume = self._base_total_frequency * float(multipliers.sum()) / 30
         simulation_days = duration_hours / 24
         
         total_transactions = int(total_daily_volume * simulation_days)
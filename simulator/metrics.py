@@ -9,24 +9,82 @@ import asyncio
 import time
 import csv
 import json
-from collections import deque, defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
-from statistics import mean, median
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .config import MetricsConfig
 
 
+def json_default(obj: Any) -> Any:
+    """json.dumps fallback: read-only metric views as dicts, anything else as str"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _ring_write(buffer: np.ndarray, head: int, values: np.ndarray) -> int:
+    """Write values into a ring buffer starting at head; returns the new head"""
+    capacity, n = buffer.size, values.size
+    if n >= capacity:
+        buffer[:] = values[-capacity:]
+        return 0
+    end = head + n
+    if end <= capacity:
+        buffer[head:end] = values
+    else:
+        split = capacity - head
+        buffer[head:] = values[:split]
+        buffer[:end - capacity] = values[split:]
+    return end % capacity
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Local wall-clock datetime for an epoch timestamp in nanoseconds"""
+    seconds, ns = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000)
+
+
+def _iso_timestamps(timestamps_ns: np.ndarray) -> List[str]:
+    """Local-time ISO strings for epoch-ns timestamps, formatted in one vectorized call
+    
+    The whole batch uses the UTC offset of its newest timestamp. Microseconds are
+    always included, unlike datetime.isoformat on a whole second.
+    """
+    if not timestamps_ns.size:
+        return []
+    offset_ns = time.localtime(int(timestamps_ns[-1]) // 1_000_000_000).tm_gmtoff * 1_000_000_000
+    local = (timestamps_ns + offset_ns).view("datetime64[ns]").astype("datetime64[us]")
+    return np.datetime_as_string(local).tolist()
+
+
 @dataclass
 class MetricPoint:
-    """A single metric data point"""
-    timestamp: datetime
+    """A single metric data point, timestamped in epoch nanoseconds
+    
+    labels is the owning series' dict, shared by all its points; treat it as read-only.
+    """
+    timestamp_ns: int
     metric_name: str
     value: float
     labels: Dict[str, str] = field(default_factory=dict)
     
+    @property
+    def timestamp(self) -> datetime:
+        return _ns_to_datetime(self.timestamp_ns)
+        
     def to_dict(self) -> Dict[str, Any]:
         return {
             "timestamp": self.timestamp.isoformat(),
@@ -38,38 +96,199 @@ class MetricPoint:
 
 @dataclass
 class TimeSeries:
-    """Time series data for a metric"""
+    """Time series data for a metric
+    
+    Points live in ring buffers of epoch-ns timestamps, float64 values and the
+    running total after each value, with labels kept once per series rather than
+    per point. Window sums are a difference of two running totals.
+    """
     name: str
-    data_points: deque = field(default_factory=lambda: deque(maxlen=1000))
     labels: Dict[str, str] = field(default_factory=dict)
+    capacity: int = 1000
+    timestamps_ns: np.ndarray = field(init=False, repr=False)
+    values: np.ndarray = field(init=False, repr=False)
+    running_totals: np.ndarray = field(init=False, repr=False)
+    total: float = field(default=0.0, init=False)   # Sum of every value ever added
+    head: int = field(default=0, init=False)    # Next slot to write
+    count: int = field(default=0, init=False)   # Points held, oldest at head - count
     
+    def __post_init__(self):
+        self.labels = dict(self.labels)  # Owned copy, shared read-only with every point
+        self.timestamps_ns = np.empty(self.capacity, dtype=np.int64)
+        self.values = np.empty(self.capacity, dtype=np.float64)
+        self.running_totals = np.empty(self.capacity, dtype=np.float64)
+        
+    def __len__(self) -> int:
+        return self.count
+        
     def add_point(self, value: float, timestamp: Optional[datetime] = None):
         """Add a data point to the time series"""
-        if timestamp is None:
-            timestamp = datetime.now()
-        point = MetricPoint(timestamp, self.name, value, self.labels.copy())
-        self.data_points.append(point)
-        
-    def get_recent_values(self, minutes: int = 5) -> List[float]:
+        head = self.head
+        self.timestamps_ns[head] = time.time_ns() if timestamp is None else int(timestamp.timestamp() * 1e9)
+        self.values[head] = value
+        self.total += value
+        self.running_totals[head] = self.total
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+            
+    def extend(self, timestamps_ns: np.ndarray, values: np.ndarray):
+        """Add many time-ordered points at once"""
+        if not values.size:
+            return
+        running = self.total + np.cumsum(values)
+        head = self.head
+        _ring_write(self.timestamps_ns, head, timestamps_ns)
+        _ring_write(self.values, head, values)
+        self.head = _ring_write(self.running_totals, head, running)
+        self.total = float(running[-1])
+        self.count = min(self.count + values.size, self.capacity)
+        
+    def samples(self) -> np.ndarray:
+        """Held values in buffer rather than time order, as a view when the buffer is full"""
+        if self.count == self.capacity:
+            return self.values
+        return self._latest(self.count)[1]
+        
+    def _latest(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values of the newest k points, oldest first
+        
+        These are views into the buffers unless the k points wrap around its end.
+        """
+        head = self.head
+        if k <= head:
+            return self.timestamps_ns[head - k:head], self.values[head - k:head]
+        return (
+            np.concatenate((self.timestamps_ns[head - k:], self.timestamps_ns[:head])),
+            np.concatenate((self.values[head - k:], self.values[:head]))
+        )
+        
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values of the held points, oldest first"""
+        return self._latest(self.count)
+        
+    def _count_before(self, cutoff_ns: int) -> int:
+        """Number of held points older than the cutoff
+        
+        Points are appended in time order, so each of the ring's two segments is
+        sorted and can be binary searched.
+        """
+        start, head = self.head - self.count, self.head
+        if start < 0:
+            older = self.timestamps_ns[start:]
+            n_old = int(np.searchsorted(older, cutoff_ns))
+            if n_old < older.size:
+                return n_old
+            return n_old + int(np.searchsorted(self.timestamps_ns[:head], cutoff_ns))
+        return int(np.searchsorted(self.timestamps_ns[start:head], cutoff_ns))
+        
+    def _since(self, cutoff_ns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values of the points at or after the cutoff, oldest first"""
+        return self._latest(self.count - self._count_before(cutoff_ns))
+        
+    def window_sum(self, minutes: int) -> Tuple[int, float]:
+        """Count and sum of the values from the last N minutes"""
+        k = self.count - self._count_before(time.time_ns() - minutes * 60_000_000_000)
+        if not k:
+            return 0, 0.0
+        first = (self.head - k) % self.capacity
+        return k, self.total - float(self.running_totals[first] - self.values[first])
+        
+    def get_recent_values(self, minutes: int = 5) -> np.ndarray:
         """Get values from the last N minutes"""
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        return [point.value for point in self.data_points if point.timestamp >= cutoff]
+        return self._since(time.time_ns() - minutes * 60_000_000_000)[1]
+        
+    def get_points(self, minutes: Optional[int] = None) -> List[MetricPoint]:
+        """Materialize the points of the last N minutes, or all of them"""
+        if minutes is None:
+            timestamps, values = self._ordered()
+        else:
+            timestamps, values = self._since(time.time_ns() - minutes * 60_000_000_000)
+        return [
+            MetricPoint(ts, self.name, value, self.labels)
+            for ts, value in zip(timestamps.tolist(), values.tolist())
+        ]
         
     def get_latest(self) -> Optional[MetricPoint]:
         """Get the most recent data point"""
-        return self.data_points[-1] if self.data_points else None
+        if not self.count:
+            return None
+        last = self.head - 1
+        return MetricPoint(int(self.timestamps_ns[last]), self.name, float(self.values[last]), self.labels)
+        
+    def drop_before(self, cutoff_ns: int):
+        """Forget points older than the cutoff"""
+        self.count -= self._count_before(cutoff_ns)
         
     def get_average(self, minutes: int = 5) -> float:
         """Get average value over last N minutes"""
-        values = self.get_recent_values(minutes)
-        return mean(values) if values else 0.0
+        n, total = self.window_sum(minutes)
+        return total / n if n else 0.0
         
     def get_rate(self, minutes: int = 1) -> float:
         """Get rate of change (per minute)"""
         values = self.get_recent_values(minutes)
         if len(values) < 2:
             return 0.0
-        return (values[-1] - values[0]) / minutes
+        return float(values[-1] - values[0]) / minutes
+
+
+def _latency_stats(values: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """p50, p95, p99, mean, max and min of a non-empty float64 sample
+    
+    One partial sort places the min, max and percentile ranks in O(n).
+    """
+    n = values.size
+    ranks = [0, int(n * 0.5), int(n * 0.95), int(n * 0.99), n - 1]
+    low, p50, p95, p99, high = np.partition(values, ranks)[ranks].tolist()
+    return p50, p95, p99, float(values.mean()), high, low
+
+
+def _iso_rows(timestamps_ns: np.ndarray, values: np.ndarray) -> Iterable[Tuple[str, float]]:
+    """(ISO timestamp, value) CSV rows, formatted where the generator is consumed"""
+    yield from zip(_iso_timestamps(timestamps_ns), values.tolist())
+
+
+def _write_csv(path: Path, header: List[str], rows: Iterable[Any]):
+    """Write one CSV export file; blocking, so run it in an executor"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+# Buffered timings are flushed at least this often, bounding the buffer
+_TIMING_FLUSH_SIZE = 4096
+
+# Time series created when the collector starts
+_CORE_SERIES = (
+    "transactions_per_second",
+    "fraud_transactions_per_second",
+    "nexum_api_latency_ms",
+    "bastion_api_latency_ms",
+    "nexum_success_rate",
+    "bastion_success_rate",
+    "average_risk_score",
+    "fraud_detection_rate",
+    "false_positive_rate",
+    "memory_usage_mb",
+)
+
+# Series written by the convenience recorders (counters record into "<name>_rate")
+_RECORDED_SERIES = (
+    "transactions_total_rate",
+    "fraud_transactions_total_rate",
+    "nexum_requests_total_rate",
+    "bastion_requests_total_rate",
+    "nexum_errors_total_rate",
+    "bastion_errors_total_rate",
+    "true_positives_rate",
+    "false_positives_rate",
+    "false_negatives_rate",
+    "true_negatives_rate",
+    "latest_risk_score",
+    "cpu_usage_percent",
+)
 
 
 class MetricsCollector:
@@ -85,11 +304,28 @@ class MetricsCollector:
         self.time_series: Dict[str, TimeSeries] = {}
         self.counters: Dict[str, int] = defaultdict(int)
         self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self.histograms: Dict[str, TimeSeries] = {}   # Latency etc. series; their values are the samples
         
         # Real-time aggregations
         self.aggregations: Dict[str, Dict[str, Any]] = defaultdict(dict)
         
+        # Read-only live views handed out by get_current_metrics
+        self._counters_view = MappingProxyType(self.counters)
+        self._gauges_view = MappingProxyType(self.gauges)
+        self._aggregations_view = MappingProxyType(self.aggregations)
+        self._aggregated_at: Optional[int] = None   # Wall-clock second of the last refresh
+        
+        # Timings waiting for _flush_timings, as (name, duration_ms, timestamp_ns)
+        self._pending_timings: List[Tuple[str, float, int]] = []
+        
+        # Rate series of each counter, so record_counter skips building "<name>_rate"
+        self._counter_series: Dict[str, TimeSeries] = {}
+        
+        # Counters and gauges changed since the last callback notification
+        self._dirty_counters: Set[str] = set()
+        self._dirty_gauges: Set[str] = set()
+        self._delta_started = False
+        
         # Collection task
         self.collection_task: Optional[asyncio.Task] = None
         self.running = False
@@ -100,6 +336,8 @@ class MetricsCollector:
         
         # Callbacks for real-time updates
         self.update_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._sync_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._async_callbacks: List[Callable[[Dict[str, Any]], Any]] = []
         
         # Start time for simulation metrics
         self.simulation_start_time = datetime.now()
@@ -135,18 +373,18 @@ class MetricsCollector:
             
     def _initialize_metrics(self):
         """Initialize core simulation metrics"""
-        self.time_series["transactions_per_second"] = TimeSeries("transactions_per_second")
-        self.time_series["fraud_transactions_per_second"] = TimeSeries("fraud_transactions_per_second")
-        self.time_series["nexum_api_latency_ms"] = TimeSeries("nexum_api_latency_ms")
-        self.time_series["bastion_api_latency_ms"] = TimeSeries("bastion_api_latency_ms")
-        self.time_series["nexum_success_rate"] = TimeSeries("nexum_success_rate")
-        self.time_series["bastion_success_rate"] = TimeSeries("bastion_success_rate")
-        self.time_series["average_risk_score"] = TimeSeries("average_risk_score")
-        self.time_series["fraud_detection_rate"] = TimeSeries("fraud_detection_rate")
-        self.time_series["false_positive_rate"] = TimeSeries("false_positive_rate")
-        self.time_series["memory_usage_mb"] = TimeSeries("memory_usage_mb")
-        
-        # Initialize counters
+        for name in _CORE_SERIES:
+            self.time_series[name] = TimeSeries(name)
+        self._counter_series.clear()
+        self.histograms.clear()
+            
+        # Series fed by the record_* convenience methods, so their hot path never creates one
+        for name in _RECORDED_SERIES:
+            if name not in self.time_series:
+                self.time_series[name] = TimeSeries(name)
+                
+        # Initialize counters (the next callback notification sends a full snapshot)
+        self._delta_started = False
         self.counters["transactions_total"] = 0
         self.counters["fraud_transactions_total"] = 0
         self.counters["nexum_requests_total"] = 0
@@ -164,7 +402,7 @@ class MetricsCollector:
         try:
             while self.running:
                 await self._collect_system_metrics()
-                await self._calculate_aggregations()
+                self._flush_timings()
                 await self._notify_callbacks()
                 await self._cleanup_old_data()
                 
@@ -195,37 +433,47 @@ class MetricsCollector:
         except Exception as e:
             print(f"System metrics error: {e}")
             
-    async def _calculate_aggregations(self):
+    def _refresh_aggregations(self):
+        """Recompute aggregations on read, at most once per wall-clock second"""
+        second = int(time.time())
+        if second != self._aggregated_at:
+            self._aggregated_at = second
+            self._calculate_aggregations()
+            
+    def _calculate_aggregations(self):
         """Calculate real-time aggregations"""
+        self._flush_timings()
         current_time = datetime.now()
         
         # Transaction rates
         for metric_name in ["transactions_per_second", "fraud_transactions_per_second"]:
             if metric_name in self.time_series:
                 ts = self.time_series[metric_name]
+                latest = ts.get_latest()
+                
+                # One 5-minute window; the last minute is its tail
+                now_ns = time.time_ns()
+                timestamps, values = ts._since(now_ns - 5 * 60_000_000_000)
+                last_minute = values[np.searchsorted(timestamps, now_ns - 60_000_000_000):]
                 self.aggregations[metric_name] = {
-                    "current": ts.get_latest().value if ts.get_latest() else 0,
-                    "avg_1min": ts.get_average(1),
-                    "avg_5min": ts.get_average(5),
-                    "peak_1min": max(ts.get_recent_values(1)) if ts.get_recent_values(1) else 0
+                    "current": latest.value if latest else 0,
+                    "avg_1min": float(last_minute.mean()) if last_minute.size else 0.0,
+                    "avg_5min": float(values.mean()) if values.size else 0.0,
+                    "peak_1min": float(last_minute.max()) if last_minute.size else 0
                 }
                 
         # Latency percentiles
         for metric_name in ["nexum_api_latency_ms", "bastion_api_latency_ms"]:
             if metric_name in self.histograms and self.histograms[metric_name]:
-                values = list(self.histograms[metric_name])
-                values.sort()
-                n = len(values)
-                
-                if n > 0:
-                    self.aggregations[metric_name] = {
-                        "p50": values[int(n * 0.5)],
-                        "p95": values[int(n * 0.95)],
-                        "p99": values[int(n * 0.99)],
-                        "avg": mean(values),
-                        "max": max(values),
-                        "min": min(values)
-                    }
+                p50, p95, p99, avg, high, low = _latency_stats(self.histograms[metric_name].samples())
+                self.aggregations[metric_name] = {
+                    "p50": p50,
+                    "p95": p95,
+                    "p99": p99,
+                    "avg": avg,
+                    "max": high,
+                    "min": low
+                }
                     
         # Error rates
         total_nexum = self.counters["nexum_requests_total"]
@@ -273,24 +521,29 @@ class MetricsCollector:
         if not self.update_callbacks:
             return
             
-        metrics_snapshot = self.get_current_metrics()
+        metrics_snapshot = self.get_metrics_delta()
         
-        for callback in self.update_callbacks:
+        for callback in self._sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(metrics_snapshot)
-                else:
-                    callback(metrics_snapshot)
+                callback(metrics_snapshot)
             except Exception as e:
                 print(f"Metrics callback error: {e}")
                 
+        # Coroutine callbacks run concurrently
+        if self._async_callbacks:
+            results = await asyncio.gather(
+                *(callback(metrics_snapshot) for callback in self._async_callbacks), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Metrics callback error: {result}")
+                    
     async def _cleanup_old_data(self):
         """Remove old data points based on retention policy"""
-        cutoff = datetime.now() - timedelta(minutes=self.retention_minutes)
+        cutoff_ns = time.time_ns() - self.retention_minutes * 60_000_000_000
         
         for ts in self.time_series.values():
-            while ts.data_points and ts.data_points[0].timestamp < cutoff:
-                ts.data_points.popleft()
+            ts.drop_before(cutoff_ns)
                 
     # Public API methods
     def record_counter(self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None):
@@ -299,39 +552,79 @@ class MetricsCollector:
             return
             
         self.counters[name] += value
+        self._dirty_counters.add(name)
         
         # Also track as time series for rates
-        if f"{name}_rate" not in self.time_series:
-            self.time_series[f"{name}_rate"] = TimeSeries(f"{name}_rate", labels=labels or {})
-        self.time_series[f"{name}_rate"].add_point(value)
+        ts = self._counter_series.get(name)
+        if ts is None:
+            series_name = f"{name}_rate"
+            ts = self.time_series.get(series_name)
+            if ts is None:
+                ts = self.time_series[series_name] = TimeSeries(series_name, labels=labels or {})
+            self._counter_series[name] = ts
+        ts.add_point(value)
         
     def record_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record a gauge value"""
         if not self.enabled:
             return
             
-        self.gauges[name] = value
-        
+        if self.gauges.get(name) != value:
+            self.gauges[name] = value
+            self._dirty_gauges.add(name)
+            
         # Track as time series
-        if name not in self.time_series:
-            self.time_series[name] = TimeSeries(name, labels=labels or {})
-        self.time_series[name].add_point(value)
+        ts = self.time_series.get(name)
+        if ts is None:
+            ts = self.time_series[name] = TimeSeries(name, labels=labels or {})
+        ts.add_point(value)
         
     def record_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record a histogram value (for latencies, sizes, etc.)"""
         if not self.enabled:
             return
             
-        self.histograms[name].append(value)
-        
-        # Also track as time series for visualization
-        if name not in self.time_series:
-            self.time_series[name] = TimeSeries(name, labels=labels or {})
-        self.time_series[name].add_point(value)
+        self._histogram_series(name, labels).add_point(value)
+        
+    def _histogram_series(self, name: str, labels: Optional[Dict[str, str]] = None) -> TimeSeries:
+        """Time series holding a histogram's samples, also charted as the metric's series"""
+        ts = self.histograms.get(name)
+        if ts is None:
+            ts = self.time_series.get(name)
+            if ts is None:
+                ts = self.time_series[name] = TimeSeries(name, labels=labels or {})
+            self.histograms[name] = ts
+        return ts
         
     def record_timing(self, name: str, duration_ms: float, labels: Optional[Dict[str, str]] = None):
-        """Record a timing metric in milliseconds"""
-        self.record_histogram(name, duration_ms, labels)
+        """Record a timing metric in milliseconds
+        
+        Timings are buffered and written to their histogram series in bulk by
+        _flush_timings, which runs before metrics are read.
+        """
+        if not self.enabled:
+            return
+            
+        if labels:
+            self._histogram_series(name, labels)
+        pending = self._pending_timings
+        pending.append((name, duration_ms, time.time_ns()))
+        if len(pending) >= _TIMING_FLUSH_SIZE:
+            self._flush_timings()
+            
+    def _flush_timings(self):
+        """Write buffered timings into their histogram series, one bulk write per metric"""
+        if not self._pending_timings:
+            return
+        pending, self._pending_timings = self._pending_timings, []
+        
+        names, values, timestamps = zip(*pending)
+        names = np.array(names, dtype=object)
+        values = np.array(values, dtype=np.float64)
+        timestamps = np.array(timestamps, dtype=np.int64)
+        for name in set(pending_name for pending_name, _, _ in pending):
+            selected = names == name
+            self._histogram_series(name).extend(timestamps[selected], values[selected])
         
     # Convenience methods for simulation events
     def record_transaction(self, is_fraud: bool = False):
@@ -369,48 +662,72 @@ class MetricsCollector:
             
     def calculate_rates(self, window_minutes: int = 1) -> Dict[str, float]:
         """Calculate current rates (per second)"""
+        self._flush_timings()
         rates = {}
         
         for name, ts in self.time_series.items():
             if name.endswith("_rate"):
                 continue
                 
-            values = ts.get_recent_values(window_minutes)
-            if len(values) >= 2:
-                total_value = sum(values)
+            n, total_value = ts.window_sum(window_minutes)
+            if n >= 2:
                 rate_per_second = total_value / (window_minutes * 60)
                 rates[f"{name}_per_second"] = rate_per_second
                 
         return rates
         
-    def get_current_metrics(self) -> Dict[str, Any]:
-        """Get current metrics snapshot"""
+    def get_current_metrics(self, fresh: bool = False) -> Dict[str, Any]:
+        """Get current metrics snapshot
+        
+        Counters, gauges and aggregations are read-only live views; call .copy()
+        on them to keep a point-in-time copy. Aggregations are recomputed at most
+        once per second unless fresh is set, as final reports should.
+        """
+        if fresh:
+            self._aggregated_at = int(time.time())
+            self._calculate_aggregations()
+        else:
+            self._refresh_aggregations()
         return {
             "timestamp": datetime.now().isoformat(),
-            "counters": dict(self.counters),
-            "gauges": dict(self.gauges),
-            "aggregations": dict(self.aggregations),
+            "counters": self._counters_view,
+            "gauges": self._gauges_view,
+            "aggregations": self._aggregations_view,
             "rates": self.calculate_rates(),
             "simulation_runtime_seconds": (datetime.now() - self.simulation_start_time).total_seconds()
         }
         
+    def get_metrics_delta(self) -> Dict[str, Any]:
+        """Get metrics changed since the previous delta
+        
+        Same shape as get_current_metrics, but counters and gauges only hold the
+        entries that changed. The first call returns the full snapshot.
+        """
+        metrics = self.get_current_metrics()
+        if self._delta_started:
+            metrics["counters"] = {name: self.counters[name] for name in self._dirty_counters}
+            metrics["gauges"] = {name: self.gauges[name] for name in self._dirty_gauges}
+        self._delta_started = True
+        self._dirty_counters.clear()
+        self._dirty_gauges.clear()
+        return metrics
+        
     def get_time_series_data(self, metric_name: str, minutes: int = 10) -> List[Dict[str, Any]]:
         """Get time series data for a specific metric"""
+        self._flush_timings()
         if metric_name not in self.time_series:
             return []
             
         ts = self.time_series[metric_name]
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        
+        timestamps, values = ts._since(time.time_ns() - minutes * 60_000_000_000)
         return [
-            point.to_dict() 
-            for point in ts.data_points 
-            if point.timestamp >= cutoff
+            {"timestamp": iso, "metric": metric_name, "value": value, "labels": ts.labels}
+            for iso, value in zip(_iso_timestamps(timestamps), values.tolist())
         ]
         
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get formatted data for dashboard consumption"""
-        current_metrics = self.get_current_metrics()
+        current_metrics = self.get_current_metrics()  # Also refreshes aggregations
         
         # Format for dashboard
         dashboard_data = {
@@ -451,46 +768,56 @@ class MetricsCollector:
     # Export functionality
     async def export_to_csv(self):
         """Export metrics to CSV files"""
+        self._flush_timings()
         if not self.export_path.exists():
             self.export_path.mkdir(parents=True)
             
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Export counters
-        counters_file = self.export_path / f"counters_{timestamp}.csv"
-        with open(counters_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(["metric", "value"])
-            for name, value in self.counters.items():
-                writer.writerow([name, value])
-                
-        # Export gauges
-        gauges_file = self.export_path / f"gauges_{timestamp}.csv"
-        with open(gauges_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(["metric", "value"])
-            for name, value in self.gauges.items():
-                writer.writerow([name, value])
-                
-        # Export time series
+        # Snapshot on the event loop; formatting and disk writes run in executor threads
+        header = ["metric", "value"]
+        files = [
+            (self.export_path / f"counters_{timestamp}.csv", header, list(self.counters.items())),
+            (self.export_path / f"gauges_{timestamp}.csv", header, list(self.gauges.items()))
+        ]
         for name, ts in self.time_series.items():
-            ts_file = self.export_path / f"timeseries_{name}_{timestamp}.csv"
-            with open(ts_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "value"])
-                for point in ts.data_points:
-                    writer.writerow([point.timestamp.isoformat(), point.value])
-                    
+            timestamps, values = ts._ordered()
+            files.append((
+                self.export_path / f"timeseries_{name}_{timestamp}.csv",
+                ["timestamp", "value"],
+                _iso_rows(timestamps.copy(), values.copy())
+            ))
+            
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, _write_csv, *file) for file in files))
+        
     def export_to_json(self) -> str:
         """Export current metrics to JSON string"""
-        return json.dumps(self.get_current_metrics(), indent=2, default=str)
+        if HAS_ORJSON:
+            return orjson.dumps(
+                self.get_current_metrics(), default=json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        return json.dumps(self.get_current_metrics(), indent=2, default=json_default)
         
     # Callback management
     def add_update_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Add callback for real-time metric updates"""
         self.update_callbacks.append(callback)
-        
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
+            
+        # Deltas are shared by all callbacks; the next one is a full snapshot so
+        # the new callback gets a baseline
+        self._delta_started = False
+            
     def remove_update_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Remove callback"""
         if callback in self.update_callbacks:
-            self.update_callbacks.remove(callback)
\ No newline at end of file
+            self.update_callbacks.remove(callback)
+            if callback in self._async_callbacks:
+                self._async_callbacks.remove(callback)
+            else:
+                self._sync_callbacks.remove(callback)
\ No newline at end of file
@@ -6,18 +6,249 @@ recommendations for optimization.
 """
 
 import json
-import csv
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Callable
 from pathlib import Path
-from dataclasses import dataclass
+from string import Template
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from statistics import mean, median, stdev
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .config import RuntimeStats
 from .metrics import MetricsCollector
 
 
-@dataclass
+# Column order of the ratios returned by fraud_ratios_batch
+_FRAUD_METRIC_NAMES = ("accuracy", "precision", "recall", "false_positive_rate", "false_negative_rate")
+
+
+def fraud_ratios_batch(counts: np.ndarray) -> np.ndarray:
+    """Fraud detection ratios for an (N, 4) array of [tp, fp, tn, fn] rows.
+    
+    Returns an (N, 5) float array with columns in _FRAUD_METRIC_NAMES order;
+    ratios with a zero denominator are 0.0.
+    """
+    counts = np.asarray(counts, dtype=np.float64).reshape(-1, 4)
+    tp, fp, tn, fn = counts.T
+    
+    # Actual-fraud total is the denominator of both recall and FNR
+    actual_fraud = tp + fn
+    actual_legit = fp + tn
+    
+    numerators = np.stack([tp + tn, tp, tp, fp, fn], axis=1)
+    denominators = np.stack(
+        [actual_fraud + actual_legit, tp + fp, actual_fraud, actual_legit, actual_fraud], axis=1
+    )
+    return np.divide(numerators, denominators, out=np.zeros_like(numerators),
+                     where=denominators > 0)
+
+
+@lru_cache(maxsize=32)
+def _fraud_ratios(tp: int, fp: int, tn: int, fn: int) -> Tuple[float, ...]:
+    """Fraud detection ratios for a single set of confusion-matrix counts"""
+    return tuple(fraud_ratios_batch(np.array([tp, fp, tn, fn]))[0].tolist())
+
+
+def _json_ready(value: Any) -> Any:
+    """Datetimes as isoformat strings, containers copied so the report stays frozen"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return deepcopy(value)
+
+
+def _flat_items(data: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) pairs with nested dicts dotted and lists joined"""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                yield f"{key}.{sub_key}", sub_value
+        elif isinstance(value, list):
+            yield key, "; ".join(map(str, value))
+        else:
+            yield key, value
+
+
+# (rule(runtime_stats, nexum_latency_ms, bastion_latency_ms, fraud_metrics), message), in report order
+_RECOMMENDATION_RULES: Tuple[Tuple[Callable[..., bool], str], ...] = (
+    # Performance
+    (lambda rs, nexum_ms, bastion_ms, fm: rs.actual_tps < 10,
+     "Consider increasing speed multiplier for higher transaction throughput"),
+    (lambda rs, nexum_ms, bastion_ms, fm: rs.errors > rs.transactions_processed * 0.01,
+     "High error rate detected - check API connectivity and configuration"),
+    
+    # API performance
+    (lambda rs, nexum_ms, bastion_ms, fm: nexum_ms > 100,
+     "Nexum API latency is high - consider optimizing database queries or scaling"),
+    (lambda rs, nexum_ms, bastion_ms, fm: bastion_ms > 50,
+     "Bastion scoring latency is high - consider model optimization or caching"),
+    
+    # Fraud detection
+    (lambda rs, nexum_ms, bastion_ms, fm: fm["false_positive_rate"] > 0.05,
+     "High false positive rate - consider tuning fraud detection thresholds"),
+    (lambda rs, nexum_ms, bastion_ms, fm: fm["false_negative_rate"] > 0.1,
+     "High false negative rate - consider enhancing fraud detection rules"),
+    (lambda rs, nexum_ms, bastion_ms, fm: fm["precision"] < 0.8,
+     "Low precision in fraud detection - review and optimize detection models"),
+    
+    # Scalability
+    (lambda rs, nexum_ms, bastion_ms, fm: rs.customers_created > 1000,
+     "Large simulation completed successfully - system handles high customer volumes well"),
+    (lambda rs, nexum_ms, bastion_ms, fm: rs.customers_created <= 1000,
+     "Consider testing with larger customer counts to validate scalability"),
+)
+
+
+# CSS braces are literal since placeholders use $name
+_HTML_SOURCE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Banking Simulation Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
+        .header { background: #f4f4f4; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .section { margin-bottom: 30px; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }
+        .metric-card { background: #f9f9f9; padding: 15px; border-radius: 6px; text-align: center; }
+        .metric-value { font-size: 24px; font-weight: bold; color: #333; }
+        .metric-label { font-size: 12px; color: #666; text-transform: uppercase; }
+        .recommendations { background: #e8f5e8; padding: 15px; border-radius: 6px; }
+        .recommendations ul { margin: 0; padding-left: 20px; }
+        table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+        th, td { text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Banking Simulation Report</h1>
+        <p><strong>Simulation:</strong> $simulation_name</p>
+        <p><strong>Duration:</strong> $duration seconds</p>
+        <p><strong>Period:</strong> $start_time to $end_time</p>
+    </div>
+    
+    <div class="section">
+        <h2>Overview</h2>
+        <div class="metrics-grid">
+            <div class="metric-card">
+                <div class="metric-value">$customers_created</div>
+                <div class="metric-label">Customers Created</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$accounts_created</div>
+                <div class="metric-label">Accounts Created</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$transactions_processed</div>
+                <div class="metric-label">Transactions Processed</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$fraud_transactions</div>
+                <div class="metric-label">Fraud Transactions</div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>Performance</h2>
+        <div class="metrics-grid">
+            <div class="metric-card">
+                <div class="metric-value">$average_tps</div>
+                <div class="metric-label">Average TPS</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$peak_tps</div>
+                <div class="metric-label">Peak TPS</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">${nexum_avg_latency}ms</div>
+                <div class="metric-label">Nexum Latency</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">${bastion_avg_latency}ms</div>
+                <div class="metric-label">Bastion Latency</div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>Fraud Detection</h2>
+        <div class="metrics-grid">
+            <div class="metric-card">
+                <div class="metric-value">$accuracy</div>
+                <div class="metric-label">Accuracy</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$precision</div>
+                <div class="metric-label">Precision</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$recall</div>
+                <div class="metric-label">Recall</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">$false_positive_rate</div>
+                <div class="metric-label">False Positive Rate</div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="section recommendations">
+        <h2>Recommendations</h2>
+        <ul>
+            $recommendations_html
+        </ul>
+    </div>
+</body>
+</html>
+"""
+
+
+def _compile_template(source: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a $name template into (literal, name) segments; name is None at the end"""
+    segments = []
+    literal = ""
+    position = 0
+    for match in Template.pattern.finditer(source):
+        literal += source[position:match.start()]
+        position = match.end()
+        if match.group("escaped") is not None:
+            literal += "$"
+            continue
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(f"Invalid placeholder in template at offset {match.start()}")
+        segments.append((literal, name))
+        literal = ""
+    segments.append((literal + source[position:], None))
+    return tuple(segments)
+
+
+# Parsed once at import and rendered segment by segment
+_HTML_SEGMENTS = _compile_template(_HTML_SOURCE)
+
+
+def _render_segments(segments: Tuple[Tuple[str, Optional[str]], ...],
+                     values: Dict[str, Any]) -> Iterator[str]:
+    """Yield the template's literal chunks interleaved with substituted values"""
+    for literal, name in segments:
+        yield literal
+        if name is not None:
+            yield str(values[name])
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationReport:
     """Comprehensive simulation report"""
     simulation_name: str
@@ -49,6 +280,8 @@ class SimulationReport:
     # API performance
     nexum_stats: Dict[str, Any]
     bastion_stats: Dict[str, Any]
+    nexum_avg_latency_ms: float
+    bastion_avg_latency_ms: float
     
     # System performance
     memory_usage_mb: float
@@ -57,32 +290,42 @@ class SimulationReport:
     # Recommendations
     recommendations: List[str]
     
+    # Derived values computed on first use; slots leave no __dict__ for cached_property
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def _memo(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return a cached derived value, building it on first access"""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+            
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Report as a JSON-ready dictionary, built once and shared by all exporters"""
+        return self._memo("as_dict", lambda: {
+            f.name: _json_ready(getattr(self, f.name)) for f in fields(self) if f.init
+        })
+        
     def to_dict(self) -> Dict[str, Any]:
-        """Convert report to dictionary"""
-        return {
-            "simulation_name": self.simulation_name,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "duration_seconds": self.duration_seconds,
-            "customers_created": self.customers_created,
-            "accounts_created": self.accounts_created,
-            "transactions_processed": self.transactions_processed,
-            "fraud_transactions": self.fraud_transactions,
-            "legitimate_transactions": self.legitimate_transactions,
-            "peak_tps": self.peak_tps,
-            "average_tps": self.average_tps,
-            "total_api_calls": self.total_api_calls,
-            "fraud_detection_accuracy": self.fraud_detection_accuracy,
-            "false_positive_rate": self.false_positive_rate,
-            "false_negative_rate": self.false_negative_rate,
-            "precision": self.precision,
-            "recall": self.recall,
-            "nexum_stats": self.nexum_stats,
-            "bastion_stats": self.bastion_stats,
-            "memory_usage_mb": self.memory_usage_mb,
-            "cpu_usage_percent": self.cpu_usage_percent,
-            "recommendations": self.recommendations
-        }
+        """Convert report to dictionary; a deep copy, so the cached as_dict stays intact"""
+        return deepcopy(self.as_dict)
+        
+    @property
+    def filename_timestamp(self) -> str:
+        """Start time as used in report file names"""
+        return self._memo("filename_timestamp", lambda: self.start_time.strftime("%Y%m%d_%H%M%S"))
+        
+    @property
+    def start_time_str(self) -> str:
+        """Start time as shown in the HTML report"""
+        return self._memo("start_time_str", lambda: self.start_time.strftime("%Y-%m-%d %H:%M:%S"))
+        
+    @property
+    def end_time_str(self) -> str:
+        """End time as shown in the HTML report"""
+        return self._memo("end_time_str", lambda: self.end_time.strftime("%Y-%m-%d %H:%M:%S"))
 
 
 class SimulationReporter:
@@ -98,15 +341,19 @@ class SimulationReporter:
         """Generate comprehensive simulation report"""
         
         # Calculate fraud detection metrics
-        current_metrics = metrics_collector.get_current_metrics()
+        current_metrics = metrics_collector.get_current_metrics(fresh=True)
         fraud_metrics = self._calculate_fraud_metrics(current_metrics)
         
         # Calculate performance metrics
         performance_metrics = self._calculate_performance_metrics(current_metrics, runtime_stats)
         
+        # Average API latencies, read once for recommendations and rendering
+        nexum_avg_latency_ms = float(nexum_stats.get("average_latency_ms", 0.0))
+        bastion_avg_latency_ms = float(bastion_stats.get("average_scoring_latency_ms", 0.0))
+        
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            runtime_stats, nexum_stats, bastion_stats, fraud_metrics
+            runtime_stats, nexum_avg_latency_ms, bastion_avg_latency_ms, fraud_metrics
         )
         
         # Create report
@@ -130,6 +377,8 @@ class SimulationReporter:
             recall=fraud_metrics["recall"],
             nexum_stats=nexum_stats,
             bastion_stats=bastion_stats,
+            nexum_avg_latency_ms=nexum_avg_latency_ms,
+            bastion_avg_latency_ms=bastion_avg_latency_ms,
             memory_usage_mb=performance_metrics["memory_usage_mb"],
             cpu_usage_percent=performance_metrics["cpu_usage_percent"],
             recommendations=recommendations
@@ -141,37 +390,14 @@ class SimulationReporter:
         """Calculate fraud detection accuracy metrics"""
         counters = metrics.get("counters", {})
         
-        true_positives = counters.get("true_positives", 0)
-        false_positives = counters.get("false_positives", 0)
-        true_negatives = counters.get("true_negatives", 0)
-        false_negatives = counters.get("false_negatives", 0)
-        
-        total = true_positives + false_positives + true_negatives + false_negatives
-        
-        if total == 0:
-            return {
-                "accuracy": 0.0,
-                "precision": 0.0,
-                "recall": 0.0,
-                "false_positive_rate": 0.0,
-                "false_negative_rate": 0.0
-            }
-            
-        accuracy = (true_positives + true_negatives) / total
-        
-        precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
-        recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0.0
-        
-        false_positive_rate = false_positives / (false_positives + true_negatives) if (false_positives + true_negatives) > 0 else 0.0
-        false_negative_rate = false_negatives / (false_negatives + true_positives) if (false_negatives + true_positives) > 0 else 0.0
+        ratios = _fraud_ratios(
+            counters.get("true_positives", 0),
+            counters.get("false_positives", 0),
+            counters.get("true_negatives", 0),
+            counters.get("false_negatives", 0)
+        )
         
-        return {
-            "accuracy": accuracy,
-            "precision": precision,
-            "recall": recall,
-            "false_positive_rate": false_positive_rate,
-            "false_negative_rate": false_negative_rate
-        }
+        return dict(zip(_FRAUD_METRIC_NAMES, ratios))
         
     def _calculate_performance_metrics(self, metrics: Dict[str, Any], runtime_stats: RuntimeStats) -> Dict[str, float]:
         """Calculate system performance metrics"""
@@ -192,43 +418,14 @@ class SimulationReporter:
             "cpu_usage_percent": cpu_usage
         }
         
-    def _generate_recommendations(self, runtime_stats: RuntimeStats, nexum_stats: Dict[str, Any],
-                                bastion_stats: Dict[str, Any], fraud_metrics: Dict[str, float]) -> List[str]:
+    def _generate_recommendations(self, runtime_stats: RuntimeStats, nexum_avg_latency_ms: float,
+                                bastion_avg_latency_ms: float, fraud_metrics: Dict[str, float]) -> List[str]:
         """Generate optimization recommendations"""
-        recommendations = []
+        recommendations = [
+            message for rule, message in _RECOMMENDATION_RULES
+            if rule(runtime_stats, nexum_avg_latency_ms, bastion_avg_latency_ms, fraud_metrics)
+        ]
         
-        # Performance recommendations
-        if runtime_stats.actual_tps < 10:
-            recommendations.append("Consider increasing speed multiplier for higher transaction throughput")
-            
-        if runtime_stats.errors > runtime_stats.transactions_processed * 0.01:
-            recommendations.append("High error rate detected - check API connectivity and configuration")
-            
-        # API performance recommendations
-        avg_nexum_latency = nexum_stats.get("average_latency_ms", 0)
-        if avg_nexum_latency > 100:
-            recommendations.append("Nexum API latency is high - consider optimizing database queries or scaling")
-            
-        avg_bastion_latency = bastion_stats.get("average_scoring_latency_ms", 0)
-        if avg_bastion_latency > 50:
-            recommendations.append("Bastion scoring latency is high - consider model optimization or caching")
-            
-        # Fraud detection recommendations
-        if fraud_metrics["false_positive_rate"] > 0.05:
-            recommendations.append("High false positive rate - consider tuning fraud detection thresholds")
-            
-        if fraud_metrics["false_negative_rate"] > 0.1:
-            recommendations.append("High false negative rate - consider enhancing fraud detection rules")
-            
-        if fraud_metrics["precision"] < 0.8:
-            recommendations.append("Low precision in fraud detection - review and optimize detection models")
-            
-        # Scalability recommendations
-        if runtime_stats.customers_created > 1000:
-            recommendations.append("Large simulation completed successfully - system handles high customer volumes well")
-        else:
-            recommendations.append("Consider testing with larger customer counts to validate scalability")
-            
         if not recommendations:
             recommendations.append("Simulation completed successfully with good performance metrics")
             
@@ -236,14 +433,20 @@ class SimulationReporter:
         
     def save_report(self, report: SimulationReport, format: str = "json") -> Path:
         """Save report to file"""
-        timestamp = report.start_time.strftime("%Y%m%d_%H%M%S")
+        timestamp = report.filename_timestamp
         
         if format == "json":
             filename = f"simulation_report_{timestamp}.json"
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w') as f:
-                json.dump(report.to_dict(), f, indent=2, default=str)
+            if HAS_ORJSON:
+                filepath.write_bytes(orjson.dumps(
+                    report.as_dict, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(report.as_dict, f, indent=2, default=str)
                 
         elif format == "csv":
             filename = f"simulation_report_{timestamp}.csv"
@@ -252,12 +455,31 @@ class SimulationReporter:
             # Flatten the report for CSV
             flattened = self._flatten_report(report)
             
-            with open(filepath, 'w', newline='') as f:
+            import csv
+            
+            with open(filepath, 'w', newline='', buffering=1 << 16) as f:
                 writer = csv.writer(f)
                 writer.writerow(["Metric", "Value"])
-                for key, value in flattened.items():
-                    writer.writerow([key, value])
-                    
+                writer.writerows(flattened.items())
+                
+        elif format == "parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("pyarrow not installed. Run: pip install pyarrow")
+                
+            filename = f"simulation_report_{timestamp}.parquet"
+            filepath = self.output_dir / filename
+            
+            # Same metric/value layout as the CSV, values as strings since types are mixed
+            flattened = self._flatten_report(report)
+            table = pa.Table.from_pydict({
+                "metric": list(flattened),
+                "value": [str(value) for value in flattened.values()]
+            })
+            pq.write_table(table, filepath, compression="zstd")
+            
         else:
             raise ValueError(f"Unsupported format: {format}")
             
@@ -265,158 +487,45 @@ class SimulationReporter:
         
     def _flatten_report(self, report: SimulationReport) -> Dict[str, Any]:
         """Flatten report structure for CSV export"""
-        flattened = {}
-        report_dict = report.to_dict()
-        
-        for key, value in report_dict.items():
-            if isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    flattened[f"{key}.{sub_key}"] = sub_value
-            elif isinstance(value, list):
-                flattened[key] = "; ".join(str(item) for item in value)
-            else:
-                flattened[key] = value
-                
-        return flattened
+        return dict(_flat_items(report.as_dict))
         
     def generate_html_report(self, report: SimulationReport) -> str:
         """Generate HTML report"""
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Banking Simulation Report</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
-        .header { background: #f4f4f4; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .section { margin-bottom: 30px; }
-        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }
-        .metric-card { background: #f9f9f9; padding: 15px; border-radius: 6px; text-align: center; }
-        .metric-value { font-size: 24px; font-weight: bold; color: #333; }
-        .metric-label { font-size: 12px; color: #666; text-transform: uppercase; }
-        .recommendations { background: #e8f5e8; padding: 15px; border-radius: 6px; }
-        .recommendations ul { margin: 0; padding-left: 20px; }
-        table { width: 100%; border-collapse: collapse; margin-top: 10px; }
-        th, td { text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }
-        th { background-color: #f2f2f2; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Banking Simulation Report</h1>
-        <p><strong>Simulation:</strong> {simulation_name}</p>
-        <p><strong>Duration:</strong> {duration:.1f} seconds</p>
-        <p><strong>Period:</strong> {start_time} to {end_time}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Overview</h2>
-        <div class="metrics-grid">
-            <div class="metric-card">
-                <div class="metric-value">{customers_created}</div>
-                <div class="metric-label">Customers Created</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{accounts_created}</div>
-                <div class="metric-label">Accounts Created</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{transactions_processed}</div>
-                <div class="metric-label">Transactions Processed</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{fraud_transactions}</div>
-                <div class="metric-label">Fraud Transactions</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Performance</h2>
-        <div class="metrics-grid">
-            <div class="metric-card">
-                <div class="metric-value">{average_tps:.1f}</div>
-                <div class="metric-label">Average TPS</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{peak_tps:.1f}</div>
-                <div class="metric-label">Peak TPS</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{nexum_avg_latency:.0f}ms</div>
-                <div class="metric-label">Nexum Latency</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{bastion_avg_latency:.0f}ms</div>
-                <div class="metric-label">Bastion Latency</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Fraud Detection</h2>
-        <div class="metrics-grid">
-            <div class="metric-card">
-                <div class="metric-value">{accuracy:.1%}</div>
-                <div class="metric-label">Accuracy</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{precision:.1%}</div>
-                <div class="metric-label">Precision</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{recall:.1%}</div>
-                <div class="metric-label">Recall</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{false_positive_rate:.1%}</div>
-                <div class="metric-label">False Positive Rate</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section recommendations">
-        <h2>Recommendations</h2>
-        <ul>
-            {recommendations_html}
-        </ul>
-    </div>
-</body>
-</html>
-"""
+        return "".join(_render_segments(_HTML_SEGMENTS, self._html_values(report)))
         
+    def _html_values(self, report: SimulationReport) -> Dict[str, Any]:
+        """Placeholder values for the HTML template"""
         recommendations_html = "".join(f"<li>{rec}</li>" for rec in report.recommendations)
         
-        return html_template.format(
-            simulation_name=report.simulation_name,
-            duration=report.duration_seconds,
-            start_time=report.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-            end_time=report.end_time.strftime("%Y-%m-%d %H:%M:%S"),
-            customers_created=report.customers_created,
-            accounts_created=report.accounts_created,
-            transactions_processed=report.transactions_processed,
-            fraud_transactions=report.fraud_transactions,
-            average_tps=report.average_tps,
-            peak_tps=report.peak_tps,
-            nexum_avg_latency=report.nexum_stats.get("average_latency_ms", 0),
-            bastion_avg_latency=report.bastion_stats.get("average_scoring_latency_ms", 0),
-            accuracy=report.fraud_detection_accuracy,
-            precision=report.precision,
-            recall=report.recall,
-            false_positive_rate=report.false_positive_rate,
-            recommendations_html=recommendations_html
-        )
+        # Template has no format specs, so numbers are formatted here
+        return {
+            "simulation_name": report.simulation_name,
+            "duration": f"{report.duration_seconds:.1f}",
+            "start_time": report.start_time_str,
+            "end_time": report.end_time_str,
+            "customers_created": report.customers_created,
+            "accounts_created": report.accounts_created,
+            "transactions_processed": report.transactions_processed,
+            "fraud_transactions": report.fraud_transactions,
+            "average_tps": f"{report.average_tps:.1f}",
+            "peak_tps": f"{report.peak_tps:.1f}",
+            "nexum_avg_latency": f"{report.nexum_avg_latency_ms:.0f}",
+            "bastion_avg_latency": f"{report.bastion_avg_latency_ms:.0f}",
+            "accuracy": f"{report.fraud_detection_accuracy:.1%}",
+            "precision": f"{report.precision:.1%}",
+            "recall": f"{report.recall:.1%}",
+            "false_positive_rate": f"{report.false_positive_rate:.1%}",
+            "recommendations_html": recommendations_html
+        }
         
     def save_html_report(self, report: SimulationReport) -> Path:
         """Save HTML report to file"""
-        html_content = self.generate_html_report(report)
-        timestamp = report.start_time.strftime("%Y%m%d_%H%M%S")
+        timestamp = report.filename_timestamp
         filename = f"simulation_report_{timestamp}.html"
         filepath = self.output_dir / filename
         
+        # Stream segments to disk instead of building the whole page first
         with open(filepath, 'w') as f:
-            f.write(html_content)
+            f.writelines(_render_segments(_HTML_SEGMENTS, self._html_values(report)))
             
         return filepath
\ No newline at end of file
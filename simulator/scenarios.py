@@ -5,9 +5,10 @@ Scenarios define complete simulation parameters including transaction patterns,
 fraud rates, customer behavior, and timing.
 """
 
+import copy
 import os
-import yaml
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from .config import SimulationConfig, TransactionRateConfig, FraudConfig, FraudPatternConfig
@@ -31,23 +32,21 @@ class ScenarioLoader:
         if not scenario_path.exists():
             raise FileNotFoundError(f"Scenario file not found: {scenario_path}")
             
-        with open(scenario_path, 'r') as f:
-            data = yaml.safe_load(f)
-            
-        return self._parse_scenario_data(data)
+        # Cached per file version; callers get their own copy to mutate
+        config = _load_scenario_file(str(scenario_path), scenario_path.stat().st_mtime_ns)
+        return config.model_copy(deep=True)
     
     def list_scenarios(self) -> List[str]:
         """List available scenarios in the scenarios directory"""
-        if not self.scenarios_dir.exists():
+        try:
+            mtime_ns = self.scenarios_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
             
-        scenarios = []
-        for file_path in self.scenarios_dir.glob("*.yaml"):
-            scenarios.append(file_path.stem)
-            
-        return sorted(scenarios)
+        return list(_list_scenario_names(str(self.scenarios_dir), mtime_ns))
     
-    def _parse_scenario_data(self, data: dict) -> SimulationConfig:
+    @staticmethod
+    def _parse_scenario_data(data: dict) -> SimulationConfig:
         """Parse scenario data dict into SimulationConfig"""
         # Convert transaction_rate if present
         if 'transaction_rate' in data:
@@ -65,6 +64,29 @@ class ScenarioLoader:
         return SimulationConfig(**data)
 
 
+@lru_cache(maxsize=64)
+def _load_scenario_file(path: str, mtime_ns: int) -> SimulationConfig:
+    """Parse a scenario file; mtime_ns is part of the cache key so edits are picked up"""
+    import yaml
+    
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=loader)
+        
+    return ScenarioLoader._parse_scenario_data(data)
+
+
+@lru_cache(maxsize=16)
+def _list_scenario_names(directory: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Sorted scenario names in a directory, cached on the directory mtime"""
+    with os.scandir(directory) as entries:
+        return tuple(sorted(
+            entry.name[:-len(".yaml")] for entry in entries
+            if entry.name.endswith(".yaml") and entry.is_file()
+        ))
+
+
 # Pre-built scenario definitions
 BUILTIN_SCENARIOS = {
     "normal_day": {
@@ -231,15 +253,20 @@ BUILTIN_SCENARIOS = {
 }
 
 
+# Parsed once at import; deepcopy keeps the raw definitions above untouched
+_BUILTIN_CONFIGS: Dict[str, SimulationConfig] = {
+    name: ScenarioLoader._parse_scenario_data(copy.deepcopy(data))
+    for name, data in BUILTIN_SCENARIOS.items()
+}
+
+
 def get_builtin_scenario(name: str) -> SimulationConfig:
     """Get a built-in scenario by name"""
     if name not in BUILTIN_SCENARIOS:
         available = ", ".join(BUILTIN_SCENARIOS.keys())
         raise ValueError(f"Unknown built-in scenario: {name}. Available: {available}")
         
-    data = BUILTIN_SCENARIOS[name].copy()
-    loader = ScenarioLoader()
-    return loader._parse_scenario_data(data)
+    return _BUILTIN_CONFIGS[name].model_copy(deep=True)
 
 
 def create_scenario_file(scenario_name: str, config: SimulationConfig, output_dir: str = "scenarios"):
@@ -251,8 +278,11 @@ def create_scenario_file(scenario_name: str, config: SimulationConfig, output_di
     data = config.dict()
     
     # Write to YAML file
+    import yaml
+    
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     scenario_file = output_path / f"{scenario_name}.yaml"
     with open(scenario_file, 'w') as f:
-        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+        yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False, indent=2)
         
     return scenario_file
\ No newline at end of file